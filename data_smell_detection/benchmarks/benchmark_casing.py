@@ -0,0 +1,102 @@
+"""
+Compare the element-wise and the vectorized evaluation of the casing smell on
+long free-text columns.
+
+Both implementations compute the scan feature of the casing smell (see
+ColumnValuesDontContainCasingSmell) for all values of a column with distinct
+values. The element-wise implementation calls the extractor for each value,
+the vectorized implementation evaluates the patterns using the pandas string
+methods. Run it from the root directory of the package:
+
+    python benchmarks/benchmark_casing.py [--rows N] [--repetitions N]
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from datasmelldetection.detectors.great_expectations.expectations.\
+    expect_column_values_to_not_contain_casing_smell import (
+        CASING_SCAN_FEATURE,
+        ColumnValuesDontContainCasingSmell
+    )
+from datasmelldetection.detectors.great_expectations.scanner import (
+    ScanFeatureRegistry,
+    scan_column
+)
+
+_WORDS = np.array([
+    "the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "data",
+    "smell", "detection", "lorem", "ipsum", "dolor", "sit", "amet", "value.",
+    "(note)", "2021", "and", "of", "NASA"
+])
+
+
+def _create_column(row_count: int, rng: np.random.Generator) -> pd.Series:
+    # Each value is a sentence of 20 to 80 words and the values are (almost
+    # always) distinct. Every tenth sentence is written in lowercase only.
+    word_counts = rng.integers(20, 80, row_count)
+    sentences = []
+    for i, word_count in enumerate(word_counts):
+        sentence = " ".join(rng.choice(_WORDS, word_count)) + f" {i}."
+        sentences.append(sentence.lower() if i % 10 == 0 else sentence.capitalize())
+    return pd.Series(sentences)
+
+
+def _measure(function: Callable[[], object], repetitions: int) -> float:
+    durations: List[float] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100000,
+                        help="The number of rows of the free-text column.")
+    parser.add_argument("--repetitions", type=int, default=3,
+                        help="The number of runs per implementation.")
+    args = parser.parse_args()
+
+    column = _create_column(args.rows, np.random.default_rng(0))
+
+    element_wise_registry = ScanFeatureRegistry()
+    element_wise_registry.register(
+        CASING_SCAN_FEATURE,
+        ColumnValuesDontContainCasingSmell._get_casing_smell_wordcount_limit
+    )
+    vectorized_registry = ScanFeatureRegistry()
+    vectorized_registry.register(
+        CASING_SCAN_FEATURE,
+        ColumnValuesDontContainCasingSmell._get_casing_smell_wordcount_limit,
+        vectorized_extractor=ColumnValuesDontContainCasingSmell._get_casing_smell_wordcount_limits
+    )
+
+    element_wise_scan = scan_column(column, [CASING_SCAN_FEATURE], registry=element_wise_registry)
+    vectorized_scan = scan_column(column, [CASING_SCAN_FEATURE], registry=vectorized_registry)
+    assert np.array_equal(
+        element_wise_scan[CASING_SCAN_FEATURE].astype(float),
+        vectorized_scan[CASING_SCAN_FEATURE].astype(float)
+    )
+
+    element_wise_latency = _measure(
+        lambda: scan_column(column, [CASING_SCAN_FEATURE], registry=element_wise_registry),
+        args.repetitions
+    )
+    vectorized_latency = _measure(
+        lambda: scan_column(column, [CASING_SCAN_FEATURE], registry=vectorized_registry),
+        args.repetitions
+    )
+    print(f"rows: {args.rows}")
+    print(f"element-wise [s]: {element_wise_latency:.3f}")
+    print(f"vectorized [s]:   {vectorized_latency:.3f}")
+    print(f"speedup:          {element_wise_latency / vectorized_latency:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Compare the time to import the detector with and without importing the
+expectation modules for data smell detection.
+
+The expectations are registered from a manifest when the package is imported.
+Their modules are imported once the profiler generates expectations for a
+column. Previously, all expectation modules were imported with the package.
+The benchmark imports the detector in a new interpreter for each repetition
+and prints the median time of the following steps:
+
+great_expectations
+    Import Great Expectations only (a lower bound for the import of the
+    detector since the registry depends on Great Expectations).
+
+detector
+    Import the detector. No expectation module is imported.
+
+detector + float expectations
+    Import the detector and the expectation modules which are needed to
+    profile float columns.
+
+detector + all expectations
+    Import the detector and all expectation modules (the previous behavior).
+
+Run it from the root directory of the package:
+
+    python benchmarks/benchmark_import.py [--repetitions N]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+# Each statement is timed in a new interpreter. The script prints the import
+# time and the number of imported expectation modules.
+_SCRIPT_TEMPLATE = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+{statement}
+duration = time.perf_counter() - start
+print(json.dumps([duration, len([
+    x for x in sys.modules
+    if x.startswith("datasmelldetection.detectors.great_expectations.expectations.")
+])]))
+"""
+
+_IMPORT_DETECTOR = "import datasmelldetection.detectors.great_expectations.detector"
+
+_STEPS: List[Tuple[str, str]] = [
+    ("great_expectations", "import great_expectations"),
+    ("detector", _IMPORT_DETECTOR),
+    ("detector + float expectations", f"""
+{_IMPORT_DETECTOR}
+from great_expectations.profile.base import ProfilerDataType
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+default_registry.load_expectations(
+    default_registry.get_smell_dict_for_profiler_data_type(ProfilerDataType.FLOAT).values()
+)
+"""),
+    ("detector + all expectations", f"""
+{_IMPORT_DETECTOR}
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+default_registry.load_expectations()
+"""),
+]
+
+
+def _measure(statement: str) -> Tuple[float, int]:
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT_TEMPLATE.format(statement=statement)],
+        check=True, stdout=subprocess.PIPE
+    ).stdout
+    duration, module_count = json.loads(output)
+    return duration, module_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repetitions", type=int, default=10,
+                        help="The number of imports per step.")
+    args = parser.parse_args()
+
+    print(f"{'step':<32}{'expectation modules':>21}{'import [s]':>12}")
+    for name, statement in _STEPS:
+        durations: List[float] = []
+        module_count = 0
+        for _ in range(args.repetitions):
+            duration, module_count = _measure(statement)
+            durations.append(duration)
+        print(f"{name:<32}{module_count:>21}{statistics.median(durations):>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
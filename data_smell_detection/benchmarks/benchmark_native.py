@@ -0,0 +1,85 @@
+"""
+Compare the per-file detection latency of the GreatExpectationsDetector and
+the NativeDetector.
+
+The benchmark generates CSV files of different sizes, performs detection with
+both detectors using the default data smell registry and prints the median
+latency per file. Run it from the root directory of the package:
+
+    python benchmarks/benchmark_native.py [--repetitions N]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.detector import DetectorBuilder
+
+_ROW_COUNTS: List[int] = [100, 1000, 10000, 100000]
+
+_STRING_VALUES = np.array([
+    "abc def", "ABC DEF", "aBc", "  leading", "Hello World", "2020-01-01",
+    "12:30", "3.5", "-42", "N/A", "x" * 35, "Some longer text value here"
+])
+
+
+def _create_dataframe(row_count: int, rng: np.random.Generator) -> pd.DataFrame:
+    return pd.DataFrame({
+        "string1": rng.choice(_STRING_VALUES, row_count),
+        "string2": rng.choice(_STRING_VALUES, row_count),
+        "int": rng.integers(-10, 100000, row_count),
+        "float": rng.normal(size=row_count) * rng.choice([1, -1, 100], row_count),
+        "date": rng.choice(pd.date_range("2000-01-01", periods=1000).astype(str), row_count)
+    })
+
+
+def _measure(function: Callable[[], object], repetitions: int) -> float:
+    durations: List[float] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repetitions", type=int, default=3,
+                        help="The number of detection runs per file and detector.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        for row_count in _ROW_COUNTS:
+            _create_dataframe(row_count, rng).to_csv(
+                os.path.join(directory, f"rows_{row_count}.csv"), index=False
+            )
+
+        context = GreatExpectationsContextBuilder(
+            os.path.join(os.getcwd(), "../great_expectations"),
+            directory
+        ).build()
+        dataset_manager = FileBasedDatasetManager(context=context)
+
+        print(f"{'file':<16}{'great_expectations [s]':>24}{'native [s]':>14}{'speedup':>10}")
+        for row_count in _ROW_COUNTS:
+            filename = f"rows_{row_count}.csv"
+            builder = DetectorBuilder(
+                context=context,
+                dataset=dataset_manager.get_dataset(filename)
+            )
+            great_expectations_latency = _measure(builder.build().detect, args.repetitions)
+            native_latency = _measure(builder.build_native().detect, args.repetitions)
+            print(f"{filename:<16}{great_expectations_latency:>24.3f}{native_latency:>14.3f}"
+                  f"{great_expectations_latency / native_latency:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
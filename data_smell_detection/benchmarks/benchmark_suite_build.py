@@ -0,0 +1,123 @@
+"""
+Compare the time to build the expectation suite of wide datasets from
+precompiled templates and by adding each expectation to the suite.
+
+The DataSmellAwareProfiler instantiates the expectations of each column from a
+template per column type and appends them to the suite. Previously, each
+expectation was added by ExpectationSuite.add_expectation which searches the
+suite for an expectation of the same domain (i.e. the build time is quadratic
+in the number of columns). The benchmark profiles datasets with 10 rows and
+different numbers of integer, float and string columns using the default
+data smell registry and prints the median time to build the suite from the
+templates and the time to add the same expectations one at a time. Adding the
+expectations one at a time is skipped for wide datasets since it takes
+several minutes for 1,000 columns. Run it from the root
+directory of the package:
+
+    python benchmarks/benchmark_suite_build.py [--repetitions N] [--max-baseline-columns N]
+"""
+import argparse
+from copy import deepcopy
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.dataset import PandasDataset
+from great_expectations.profile.base import ProfilerDataType
+
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+# Register expectations for data smell detection
+import datasmelldetection.detectors.great_expectations.expectations
+from datasmelldetection.detectors.great_expectations.profiler import DataSmellAwareProfiler
+from datasmelldetection.detectors.great_expectations.scanner import SCAN_FEATURES_META_KEY
+
+_COLUMN_COUNTS: List[int] = [10, 100, 1000, 10000]
+
+
+def _create_dataset(column_count: int, rng: np.random.Generator) -> PandasDataset:
+    columns: Dict[str, Any] = dict()
+    for i in range(column_count):
+        if i % 3 == 0:
+            columns[f"int{i}"] = rng.integers(-10, 100, 10)
+        elif i % 3 == 1:
+            columns[f"float{i}"] = rng.normal(size=10)
+        else:
+            columns[f"string{i}"] = rng.choice(["abc", "ABC def", "12", "N/A"], 10)
+    return PandasDataset(pd.DataFrame(columns))
+
+
+# Build the suite like the profiler did before the templates were introduced
+# (given the types of the columns).
+def _build_suite_by_adding(column_types: Dict[str, ProfilerDataType]) -> ExpectationSuite:
+    suite = ExpectationSuite(expectation_suite_name="profiled_expectation_suite")
+    # The profiler uses empty kwargs for all data smells by default.
+    default_kwargs: Dict[str, Any] = dict()
+    for column, type_ in column_types.items():
+        configurations: List[ExpectationConfiguration] = []
+        for expectation_type in default_registry.get_smell_dict_for_profiler_data_type(type_).values():
+            kwargs: Dict[str, Any] = deepcopy(default_kwargs)
+            kwargs["column"] = column
+            configurations.append(ExpectationConfiguration(
+                expectation_type=expectation_type, kwargs=kwargs
+            ))
+        scan_features = set()
+        for configuration in configurations:
+            scan_features.update(default_registry.get_scan_features(configuration.expectation_type))
+        for configuration in configurations:
+            if scan_features:
+                configuration.meta[SCAN_FEATURES_META_KEY] = sorted(scan_features)
+            suite.add_expectation(configuration)
+    return suite
+
+
+def _measure(function: Callable[[], object], repetitions: int) -> float:
+    durations: List[float] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repetitions", type=int, default=3,
+                        help="The number of suite builds per dataset and method.")
+    parser.add_argument("--max-baseline-columns", type=int, default=100,
+                        help="The maximum number of columns for which the suite is "
+                             "built by adding each expectation.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'columns':>8}{'expectations':>14}{'templates [s]':>15}"
+          f"{'add_expectation [s]':>21}{'speedup':>10}")
+    for column_count in _COLUMN_COUNTS:
+        dataset = _create_dataset(column_count, rng)
+        configuration = {"registry": default_registry}
+
+        # NOTE: DatasetProfiler.profile additionally validates the suite on
+        # the dataset. Therefore, only the build of the suite is measured.
+        # The build includes the inference of the column types (which are
+        # cached after the first build).
+        suite = DataSmellAwareProfiler._profile(dataset, configuration)
+        template_time = _measure(
+            lambda: DataSmellAwareProfiler._profile(dataset, configuration), args.repetitions
+        )
+
+        column_types: Dict[str, ProfilerDataType] = {
+            column: ProfilerDataType[meta["type"].split(".")[-1]]
+            for column, meta in suite.meta["columns"].items()
+        }
+        if column_count <= args.max_baseline_columns:
+            baseline_time = _measure(lambda: _build_suite_by_adding(column_types), 1)
+            baseline = f"{baseline_time:>21.3f}{baseline_time / template_time:>9.1f}x"
+        else:
+            baseline = f"{'-':>21}{'-':>10}"
+        print(f"{column_count:>8}{len(suite.expectations):>14}{template_time:>15.3f}{baseline}")
+
+
+if __name__ == "__main__":
+    main()
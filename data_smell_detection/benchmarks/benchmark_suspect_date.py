@@ -0,0 +1,98 @@
+"""
+Compare the element-wise and the vectorized evaluation of the suspect date
+value smell on date columns.
+
+Both implementations compute the scan feature of the suspect date value smell
+(see ColumnValuesDontContainSuspectDateValueSmell) for all values of a column
+of date strings. The element-wise implementation parses each distinct value
+using datetime.strptime, the vectorized implementation parses all distinct
+values using a single regular expression pass and NumPy. Run it from the root
+directory of the package:
+
+    python benchmarks/benchmark_suspect_date.py [--rows N] [--repetitions N]
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from datasmelldetection.detectors.great_expectations.expectations.\
+    expect_column_values_to_not_contain_suspect_date_value_smell import (
+        DATE_KEY_SCAN_FEATURE,
+        ColumnValuesDontContainSuspectDateValueSmell
+    )
+from datasmelldetection.detectors.great_expectations.scanner import (
+    ScanFeatureRegistry,
+    scan_column
+)
+
+
+def _create_column(row_count: int, rng: np.random.Generator) -> pd.Series:
+    # Dates between the years 1000 and 3999 of which every tenth value is not
+    # a valid date.
+    years = rng.integers(1000, 4000, row_count)
+    months = rng.integers(1, 13, row_count)
+    days = rng.integers(1, 32, row_count)
+    dates = [f"{y:04d}-{m:02d}-{d:02d}" for y, m, d in zip(years, months, days)]
+    return pd.Series([x if i % 10 else x + "x" for i, x in enumerate(dates)])
+
+
+def _measure(function: Callable[[], object], repetitions: int) -> float:
+    durations: List[float] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1000000,
+                        help="The number of rows of the date column.")
+    parser.add_argument("--repetitions", type=int, default=3,
+                        help="The number of runs per implementation.")
+    args = parser.parse_args()
+
+    column = _create_column(args.rows, np.random.default_rng(0))
+
+    element_wise_registry = ScanFeatureRegistry()
+    element_wise_registry.register(
+        DATE_KEY_SCAN_FEATURE,
+        ColumnValuesDontContainSuspectDateValueSmell._get_date_key
+    )
+    vectorized_registry = ScanFeatureRegistry()
+    vectorized_registry.register(
+        DATE_KEY_SCAN_FEATURE,
+        ColumnValuesDontContainSuspectDateValueSmell._get_date_key,
+        vectorized_extractor=ColumnValuesDontContainSuspectDateValueSmell._get_date_keys
+    )
+
+    element_wise_scan = scan_column(column, [DATE_KEY_SCAN_FEATURE],
+                                    registry=element_wise_registry)
+    vectorized_scan = scan_column(column, [DATE_KEY_SCAN_FEATURE], registry=vectorized_registry)
+    assert np.array_equal(
+        element_wise_scan[DATE_KEY_SCAN_FEATURE].astype(float),
+        vectorized_scan[DATE_KEY_SCAN_FEATURE].astype(float),
+        equal_nan=True
+    )
+
+    element_wise_latency = _measure(
+        lambda: scan_column(column, [DATE_KEY_SCAN_FEATURE], registry=element_wise_registry),
+        args.repetitions
+    )
+    vectorized_latency = _measure(
+        lambda: scan_column(column, [DATE_KEY_SCAN_FEATURE], registry=vectorized_registry),
+        args.repetitions
+    )
+    print(f"rows: {args.rows}")
+    print(f"element-wise [s]: {element_wise_latency:.3f}")
+    print(f"vectorized [s]:   {vectorized_latency:.3f}")
+    print(f"speedup:          {element_wise_latency / vectorized_latency:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
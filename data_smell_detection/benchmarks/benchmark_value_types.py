@@ -0,0 +1,128 @@
+"""
+Compare the separate regex scan features of the type-related data smells with
+the shared value type classification on mixed string columns.
+
+The integer, floating point number, date and time as string smells as well as
+the intermingled data type smell previously matched their own regular
+expressions against each value (one regex scan feature per smell plus four
+patterns of the intermingled data type smell). All of them now read their
+verdicts from the value type scan feature (see value_types). Run it from the
+root directory of the package:
+
+    python benchmarks/benchmark_value_types.py [--rows N] [--repetitions N]
+"""
+import argparse
+import re
+import statistics
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from datasmelldetection.detectors.great_expectations.scanner import (
+    ScanFeatureRegistry,
+    regex_scan_feature,
+    scan_column
+)
+from datasmelldetection.detectors.great_expectations.value_types import (
+    ALPHABETIC_REGEX,
+    DATE_REGEX,
+    DATETIME_REGEX,
+    FLOAT_REGEX,
+    INTEGER_REGEX,
+    NUMERIC_REGEX,
+    TIME_REGEX,
+    VALUE_TYPE_SCAN_FEATURE,
+    ValueType,
+    classify_value,
+    classify_values
+)
+
+_SEPARATE_REGEXES = [INTEGER_REGEX, FLOAT_REGEX, DATE_REGEX, TIME_REGEX]
+_INTERMINGLED_PATTERNS = [
+    (re.compile(ALPHABETIC_REGEX), 1),
+    (re.compile(NUMERIC_REGEX), 2),
+    (re.compile(DATE_REGEX), 3),
+    (re.compile(DATETIME_REGEX), 4),
+]
+
+
+# The data type classification of the intermingled data type smell before the
+# value type scan feature has been introduced.
+def _get_data_type(element: str) -> int:
+    for pattern, data_type in _INTERMINGLED_PATTERNS:
+        if pattern.match(element) is not None:
+            return data_type
+    return 0
+
+
+def _create_column(row_count: int, rng: np.random.Generator) -> pd.Series:
+    # Distinct integers, floats, dates, times and words.
+    numbers = rng.integers(-10 ** 6, 10 ** 6, row_count)
+    kinds = rng.integers(0, 5, row_count)
+    values = []
+    for i, (number, kind) in enumerate(zip(numbers, kinds)):
+        if kind == 0:
+            values.append(str(number))
+        elif kind == 1:
+            values.append(f"{number / 100:.2f}")
+        elif kind == 2:
+            values.append(f"{1000 + i % 3000:04d}-{1 + i % 12:02d}-{1 + i % 28:02d}")
+        elif kind == 3:
+            values.append(f"{i % 24:02d}:{i % 60:02d}:{number % 60:02d}")
+        else:
+            values.append(f"value {chr(ord('a') + i % 26) * (1 + i % 7)}")
+    return pd.Series(values)
+
+
+def _measure(function: Callable[[], object], repetitions: int) -> float:
+    durations: List[float] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200000,
+                        help="The number of rows of the mixed column.")
+    parser.add_argument("--repetitions", type=int, default=3,
+                        help="The number of runs per implementation.")
+    args = parser.parse_args()
+
+    column = _create_column(args.rows, np.random.default_rng(0))
+
+    registry = ScanFeatureRegistry()
+    registry.register("intermingled_data_type", _get_data_type)
+    registry.register(VALUE_TYPE_SCAN_FEATURE, classify_value,
+                      vectorized_extractor=classify_values)
+    separate_features = [regex_scan_feature(x) for x in _SEPARATE_REGEXES] + \
+        ["intermingled_data_type"]
+
+    separate_scan = scan_column(column, separate_features, registry=registry)
+    shared_scan = scan_column(column, [VALUE_TYPE_SCAN_FEATURE], registry=registry)
+    value_types = shared_scan[VALUE_TYPE_SCAN_FEATURE].astype(np.uint16)
+    for regex, value_type in zip(_SEPARATE_REGEXES, [ValueType.INTEGER, ValueType.FLOAT,
+                                                     ValueType.DATE, ValueType.TIME]):
+        assert np.array_equal(separate_scan[regex_scan_feature(regex)].astype(bool),
+                              (value_types & value_type) != 0)
+
+    separate_latency = _measure(
+        lambda: scan_column(column, separate_features, registry=registry),
+        args.repetitions
+    )
+    shared_latency = _measure(
+        lambda: scan_column(column, [VALUE_TYPE_SCAN_FEATURE], registry=registry),
+        args.repetitions
+    )
+    print(f"rows: {args.rows}")
+    print(f"separate regexes [s]: {separate_latency:.3f}")
+    print(f"value types [s]:      {shared_latency:.3f}")
+    print(f"speedup:              {separate_latency / shared_latency:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
-from typing import Optional, Set, Iterable, List, Any
+import asyncio
+from typing import Optional, Set, Iterable, Iterator, AsyncIterator, List, Any
 
 from datasmelldetection.core import DataSmellType
 
@@ -42,6 +43,35 @@ class Detector(ABC):
     def detect(self) -> Iterable[DetectionResult]:
         """Perform detection and return the found data smells in the form of detection results."""
 
+    def iter_detect(self) -> Iterator[DetectionResult]:
+        """
+        Perform detection and yield the found data smells in the form of detection results.
+
+        Detectors which are able to provide detection results before the whole dataset is
+        processed should override this method. By default, the results of :meth:`detect` are
+        yielded.
+        """
+        yield from self.detect()
+
+    async def detect_async(self) -> AsyncIterator[DetectionResult]:
+        """
+        Perform detection without blocking the event loop and yield the found data smells as
+        soon as :meth:`iter_detect` yields them. The detection is performed in the default
+        executor of the running event loop.
+        """
+        # NOTE: get_event_loop returns the running loop inside a coroutine and
+        # is available on Python 3.6 (unlike get_running_loop).
+        loop = asyncio.get_event_loop()
+        iterator: Iterator[DetectionResult] = iter(self.iter_detect())
+        while True:
+            # NOTE: None marks the end of the iterator since StopIteration
+            # can't be raised into a future.
+            result: Optional[DetectionResult] = \
+                await loop.run_in_executor(None, next, iterator, None)
+            if result is None:
+                break
+            yield result
+
     @abstractmethod
     def get_supported_data_smell_types(self) -> Set[DataSmellType]:
         """Return a set of data smell types which the detector can find in datasets."""
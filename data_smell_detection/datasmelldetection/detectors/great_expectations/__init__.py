@@ -1,2 +1,6 @@
-# Import to register expectation classes
-import datasmelldetection.detectors.great_expectations.expectations
\ No newline at end of file
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+from datasmelldetection.detectors.great_expectations.manifest import register_manifest
+
+# Register the expectation classes for data smell detection. Their modules are
+# imported once the expectations are needed.
+register_manifest(default_registry)
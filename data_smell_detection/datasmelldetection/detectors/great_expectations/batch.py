@@ -0,0 +1,191 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import os
+import threading
+import traceback
+from typing import Dict, Iterable, List, Optional
+
+from great_expectations import DataContext
+
+from datasmelldetection.core.detector import Configuration
+from .converter import ExtendedDetectionResult
+from .dataset import FileBasedDatasetManager
+from .datasmell import DataSmellRegistry
+from .detector import DetectorBuilder
+
+
+@dataclass
+class DatasetDetectionResult:
+    """The outcome of the data smell detection of a single dataset."""
+
+    dataset_identifier: str
+    """The identifier of the dataset (e.g. the file name)."""  # pylint: disable=W0105
+
+    detection_results: List[ExtendedDetectionResult]
+    """
+    The detection results of the dataset (empty if detection failed).
+    """  # pylint: disable=W0105
+
+    exception: Optional[str] = None
+    """
+    The traceback of the exception which was raised during detection or None
+    if detection succeeded.
+    """  # pylint: disable=W0105
+
+    @property
+    def success(self) -> bool:
+        """Whether detection succeeded."""
+        return self.exception is None
+
+
+# Return half of the physical memory in bytes or None if it can't be
+# determined.
+def _get_default_memory_limit() -> Optional[int]:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 2
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class _MemoryBudget:
+    """
+    Limit the estimated memory usage of the datasets which are processed at
+    the same time. A dataset whose estimate exceeds the limit is admitted
+    once no other dataset is processed.
+    """
+
+    def __init__(self, limit: Optional[int]):
+        self._limit = limit
+        self._used = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, amount: int):
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._limit is None or self._used == 0 or
+                self._used + amount <= self._limit
+            )
+            self._used += amount
+
+    def release(self, amount: int):
+        with self._condition:
+            self._used -= amount
+            self._condition.notify_all()
+
+
+class BatchDetector:
+    """
+    Perform data smell detection for many datasets of a
+    :class:`.FileBasedDatasetManager`.
+
+    The datasets are processed by a bounded pool of worker threads which share
+    the Great Expectations data context. Before a dataset is imported, its
+    memory usage is estimated from the size of its file. A dataset is only
+    imported if the estimated memory usage of all datasets which are
+    processed at the same time stays below the memory limit. Therefore, large
+    datasets are not held in memory at the same time.
+
+    Exceptions which are raised during the detection of a dataset are stored
+    in the corresponding :class:`.DatasetDetectionResult` and don't abort the
+    detection of the other datasets.
+    """
+
+    def __init__(
+            self,
+            context: DataContext,
+            dataset_manager: FileBasedDatasetManager,
+            registry: Optional[DataSmellRegistry] = None,
+            configuration: Optional[Configuration] = None,
+            max_workers: Optional[int] = None,
+            memory_limit: Optional[int] = None,
+            memory_factor: float = 10.0):
+        """
+        :param context: The Great Expectations data context which is shared by
+            all detectors.
+        :param dataset_manager: The dataset manager which imports the datasets.
+        :param registry: The data smell registry to use. If it is None, the
+            default registry is used.
+        :param configuration: The configuration which is used for each dataset.
+        :param max_workers: The maximum number of datasets which are processed
+            at the same time. If it is None, the default of
+            :class:`~concurrent.futures.ThreadPoolExecutor` is used.
+        :param memory_limit: The maximum estimated memory usage in bytes of the
+            datasets which are processed at the same time. If it is None, half
+            of the physical memory is used (if it can be determined).
+        :param memory_factor: The factor by which the memory usage of an
+            imported dataset is estimated to exceed the size of its file.
+        :raises ValueError: If max_workers, memory_limit or memory_factor is
+            not positive.
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("The maximum number of workers must be positive.")
+        if memory_limit is not None and memory_limit <= 0:
+            raise ValueError("The memory limit must be positive.")
+        if memory_factor <= 0:
+            raise ValueError("The memory factor must be positive.")
+        self._context = context
+        self._dataset_manager = dataset_manager
+        self._registry = registry
+        self._configuration = configuration
+        self._max_workers = max_workers
+        self._memory_limit = memory_limit if memory_limit is not None \
+            else _get_default_memory_limit()
+        self._memory_factor = memory_factor
+
+    def detect(self, dataset_identifiers: Optional[Iterable[str]] = None) \
+            -> Dict[str, DatasetDetectionResult]:
+        """
+        :param dataset_identifiers: The identifiers of the datasets to process.
+            If it is None, all available datasets are processed (see
+            :meth:`.FileBasedDatasetManager.get_available_dataset_identifiers`).
+        :return: The detection outcome of each dataset keyed by the dataset
+            identifier (in the order of the identifiers).
+        """
+        if dataset_identifiers is None:
+            dataset_identifiers = sorted(self._dataset_manager.get_available_dataset_identifiers())
+
+        budget = _MemoryBudget(self._memory_limit)
+        futures: Dict[str, Future] = dict()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for dataset_identifier in dataset_identifiers:
+                estimate = self._estimate_memory_usage(dataset_identifier)
+                # Wait until the dataset fits into the memory budget before
+                # it is scheduled.
+                budget.acquire(estimate)
+                futures[dataset_identifier] = executor.submit(
+                    self._detect_dataset, dataset_identifier, budget, estimate
+                )
+
+        return {identifier: future.result() for identifier, future in futures.items()}
+
+    def _estimate_memory_usage(self, dataset_identifier: str) -> int:
+        try:
+            size = os.path.getsize(self._dataset_manager.get_dataset_path(dataset_identifier))
+        except Exception:  # pylint: disable=W0703
+            # The error is reported when the dataset is imported.
+            return 0
+        return int(size * self._memory_factor)
+
+    def _detect_dataset(self, dataset_identifier: str, budget: _MemoryBudget,
+                        estimate: int) -> DatasetDetectionResult:
+        try:
+            builder = DetectorBuilder(
+                context=self._context,
+                dataset=self._dataset_manager.get_dataset(dataset_identifier)
+            )
+            if self._registry is not None:
+                builder.set_registry(self._registry)
+            if self._configuration is not None:
+                builder.set_configuration(self._configuration)
+            return DatasetDetectionResult(
+                dataset_identifier=dataset_identifier,
+                detection_results=list(builder.build().detect())
+            )
+        except Exception:  # pylint: disable=W0703
+            return DatasetDetectionResult(
+                dataset_identifier=dataset_identifier,
+                detection_results=[],
+                exception=traceback.format_exc()
+            )
+        finally:
+            budget.release(estimate)
@@ -0,0 +1,207 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Dict, Optional
+
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.expectation_validation_result import ExpectationValidationResult
+from great_expectations.expectations.registry import get_expectation_impl
+
+import datasmelldetection
+from .datasmell import DataSmell
+
+
+def compute_column_hash(column: pd.Series) -> str:
+    """
+    Compute a hash of the content of a column.
+
+    :param column: The column to hash.
+    :return: A hash of the values, the index and the dtype of the column.
+    """
+    hash_ = hashlib.sha256(str(column.dtype).encode("utf-8"))
+    hash_.update(pd.util.hash_pandas_object(column, index=True).values.tobytes())
+    return hash_.hexdigest()
+
+
+# Return the kwargs which determine the validation result of an expectation
+# (see DataSmell.get_cache_kwargs).
+def _get_cache_kwargs(configuration: ExpectationConfiguration) -> Dict[str, Any]:
+    expectation_impl = get_expectation_impl(configuration.expectation_type)
+    if not issubclass(expectation_impl, DataSmell):
+        return configuration.kwargs
+    return expectation_impl.get_cache_kwargs(configuration)
+
+
+def compute_cache_key(column_hash: str, configuration: ExpectationConfiguration) -> str:
+    """
+    Compute the key of the validation result of an expectation.
+
+    :param column_hash: The hash of the content of the column the expectation
+        is evaluated on (see :func:`compute_column_hash`).
+    :param configuration: The configuration of the expectation.
+    :return: A key which only depends on the version of this package, the
+        content of the column, the expectation type and the kwargs of the
+        expectation. Default kwargs which depend on the time of validation are
+        resolved (see :meth:`.DataSmell.get_cache_kwargs`).
+    """
+    # NOTE: The meta dictionary of the configuration (e.g. the scan features)
+    # does not influence the validation result. The version invalidates
+    # results which were stored by other implementations of the expectations.
+    content = json.dumps(
+        {
+            "version": datasmelldetection.__version__,
+            "column_hash": column_hash,
+            "expectation_type": configuration.expectation_type,
+            "kwargs": _get_cache_kwargs(configuration)
+        },
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class ResultCache(ABC):
+    """A cache which stores validation results of expectations."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[ExpectationValidationResult]:
+        """
+        :param key: The key of the validation result
+            (see :func:`compute_cache_key`).
+        :return: The cached validation result or None if the key is not
+            cached.
+        """
+
+    @abstractmethod
+    def put(self, key: str, result: ExpectationValidationResult):
+        """
+        Store a validation result.
+
+        :param key: The key of the validation result
+            (see :func:`compute_cache_key`).
+        :param result: The validation result to store.
+        """
+
+
+class LRUResultCache(ResultCache):
+    """
+    An in-memory cache which evicts the least recently used validation
+    results once the maximum number of entries is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        :param max_entries: The maximum number of validation results to store.
+        """
+        if max_entries <= 0:
+            raise ValueError("The maximum number of entries must be positive.")
+        self._max_entries = max_entries
+        self._results: "OrderedDict[str, ExpectationValidationResult]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str) -> Optional[ExpectationValidationResult]:
+        if key not in self._results:
+            return None
+        self._results.move_to_end(key)
+        # Return a copy to ensure that the cached result is not modified.
+        return copy.deepcopy(self._results[key])
+
+    def put(self, key: str, result: ExpectationValidationResult):
+        self._results[key] = copy.deepcopy(result)
+        self._results.move_to_end(key)
+        while len(self._results) > self._max_entries:
+            self._results.popitem(last=False)
+
+
+class DiskResultCache(ResultCache):
+    """
+    A cache which stores each validation result as a file in a directory.
+
+    The least recently used validation results are removed once the total
+    size of the files exceeds the maximum size. Results can therefore be
+    reused across processes (e.g. for nightly detection runs).
+
+    The directory is scanned once when the cache is created. Afterwards, the
+    sizes and the order of use of the files are tracked in memory. Files
+    which other processes store later are tracked once they are read.
+    """
+
+    _FILE_EXTENSION: str = ".pickle"
+
+    def __init__(self, directory: str, max_size: int = 512 * 1024 * 1024):
+        """
+        :param directory: The directory to store the validation results in.
+            It is created if it does not exist.
+        :param max_size: The maximum total size of the stored validation
+            results in bytes.
+        """
+        if max_size <= 0:
+            raise ValueError("The maximum size must be positive.")
+        self._directory = directory
+        self._max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+        # The sizes of the files ordered from the least to the most recently
+        # used file.
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total_size: int = 0
+        entries = []
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(self._FILE_EXTENSION):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+        for _, path, size in sorted(entries):
+            self._track(path, size)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self._directory, key + self._FILE_EXTENSION)
+
+    # Mark a file as the most recently used file and update its size.
+    def _track(self, path: str, size: int):
+        self._total_size += size - self._sizes.pop(path, 0)
+        self._sizes[path] = size
+
+    def get(self, key: str) -> Optional[ExpectationValidationResult]:
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as file:
+                result: ExpectationValidationResult = pickle.load(file)
+                size = os.fstat(file.fileno()).st_size
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        # Mark the result as recently used.
+        os.utime(path)
+        self._track(path, size)
+        return result
+
+    def put(self, key: str, result: ExpectationValidationResult):
+        # Write to a temporary file first to ensure that concurrent readers
+        # never see partially written files.
+        path = self._get_path(key)
+        temporary_path = path + f".{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+            size = file.tell()
+        os.replace(temporary_path, path)
+        self._track(path, size)
+        if self._total_size > self._max_size:
+            self._evict()
+
+    # Remove the least recently used results until the total size does not
+    # exceed the maximum size.
+    def _evict(self):
+        while self._total_size > self._max_size and len(self._sizes) > 0:
+            path, size = self._sizes.popitem(last=False)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._total_size -= size
@@ -0,0 +1,466 @@
+import traceback
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import pandas as pd
+from great_expectations import DataContext
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.profile.base import DatasetProfiler
+from great_expectations.validator.validation_graph import (
+    MetricConfiguration,
+    ValidationGraph
+)
+from great_expectations.validator.validator import (
+    ExpectationValidationResult,
+    Validator
+)
+
+from datasmelldetection.core.detector import Configuration
+from .converter import DetectionResultConverter, ExtendedDetectionResult
+from .dataset import ChunkedCsvDataset
+from .datasmell import DataSmell, DataSmellRegistry, get_aggregate_metrics
+from .detector import GreatExpectationsDetector
+from .parallel import (
+    _RUNTIME_CONFIGURATION,
+    _build_suite_validation_result,
+    _group_expectations_by_column
+)
+from .report import DetectionReport, measure
+
+
+# Metrics whose values over the whole dataset are the sum of the values over
+# the chunks.
+_SUMMED_METRIC_NAMES: Set[str] = {"table.row_count"}
+_SUMMED_METRIC_SUFFIXES = (".unexpected_count",)
+
+# Metrics whose values over the whole dataset are the concatenation of the
+# values over the chunks (limited to the requested number of values).
+_CONCATENATED_METRIC_SUFFIXES = (".unexpected_values", ".unexpected_index_list")
+
+# Metrics whose values are dictionaries of counts (e.g. histograms). The
+# counts over the whole dataset are the sums of the counts over the chunks.
+_COUNTS_METRIC_SUFFIXES = (".counts",)
+
+# Metrics whose values are mergeable states (e.g. moments or sketches) which
+# provide a merge method.
+_STATE_METRIC_SUFFIXES = (".state",)
+
+
+def _is_mergeable_metric_name(metric_name: str) -> bool:
+    return metric_name in _SUMMED_METRIC_NAMES or \
+        metric_name.endswith(_SUMMED_METRIC_SUFFIXES) or \
+        metric_name.endswith(_CONCATENATED_METRIC_SUFFIXES) or \
+        metric_name.endswith(_COUNTS_METRIC_SUFFIXES) or \
+        metric_name.endswith(_STATE_METRIC_SUFFIXES)
+
+
+def _is_mergeable_metric(metric: MetricConfiguration) -> bool:
+    return _is_mergeable_metric_name(metric.metric_name)
+
+
+def _merge_metric(metric: MetricConfiguration, merged_value: Any, chunk_value: Any) -> Any:
+    if metric.metric_name.endswith(_STATE_METRIC_SUFFIXES):
+        return chunk_value if merged_value is None else merged_value.merge(chunk_value)
+
+    if metric.metric_name.endswith(_COUNTS_METRIC_SUFFIXES):
+        counts: Dict[Any, int] = dict(merged_value) if merged_value is not None else dict()
+        for key, count in chunk_value.items():
+            counts[key] = counts.get(key, 0) + count
+        return counts
+
+    if merged_value is None:
+        merged_value = [] if metric.metric_name.endswith(_CONCATENATED_METRIC_SUFFIXES) else 0
+
+    if not metric.metric_name.endswith(_CONCATENATED_METRIC_SUFFIXES):
+        return merged_value + chunk_value
+
+    # Only a limited number of values is returned unless the complete
+    # result format is requested (see the unexpected_values metrics of
+    # Great Expectations).
+    result_format: Dict[str, Any] = metric.metric_value_kwargs["result_format"]
+    values: List[Any] = merged_value + list(chunk_value)
+    if result_format["result_format"] != "COMPLETE":
+        values = values[:result_format["partial_unexpected_count"]]
+    return values
+
+
+DEFAULT_COLUMN_MEMORY_LIMIT: int = 256 * 1024 * 1024
+"""
+The default maximum estimated memory usage in bytes of the whole columns
+which the :class:`ChunkedGreatExpectationsDetector` reads at once.
+"""  # pylint: disable=W0105
+
+
+class ChunkedGreatExpectationsDetector(GreatExpectationsDetector):
+    """
+    A detector which reads a :class:`.ChunkedCsvDataset` in chunks to bound the
+    memory usage by the chunk size.
+
+    The expectations are generated by profiling the first chunk. Expectations
+    of data smells which are evaluated independently for each value (see
+    :attr:`.DataSmell.row_wise`) are evaluated for each chunk. The resulting
+    metrics (e.g. the number of unexpected values) are merged across chunks
+    before the expectations are validated. Therefore, the results match the
+    results of the in-memory detection. Expectations which additionally depend
+    on mergeable column metrics (see :attr:`.DataSmell.aggregate_metrics`) are
+    evaluated in two passes over the chunks. The first pass computes the
+    column metrics which are merged and passed to the second pass. All other
+    expectations need to see the whole column. Their columns are read in
+    batches whose estimated memory usage does not exceed the memory limit
+    (see :meth:`.ChunkedCsvDataset.iter_column_batches`) and validated column
+    by column.
+
+    :meth:`detect_with_report` measures the profiling of the first chunk, the
+    evaluation of each chunk, the validation of each expectation which needs
+    to see the whole column and the conversion of the validation results.
+    """
+
+    def __init__(
+            self,
+            context: DataContext,
+            dataset: ChunkedCsvDataset,
+            profiler: DatasetProfiler,
+            registry: DataSmellRegistry,
+            converter: DetectionResultConverter,
+            configuration: Optional[Configuration],
+            memory_limit: int = DEFAULT_COLUMN_MEMORY_LIMIT):
+        """
+        :param memory_limit: The maximum estimated memory usage in bytes of
+            the whole columns which are read at once.
+        """
+        # NOTE: The chunked dataset does not provide a batch request which
+        # would be required by the GreatExpectationsDetector.
+        super(ChunkedGreatExpectationsDetector, self).__init__(
+            context=context,
+            dataset=dataset,  # type: ignore
+            profiler=profiler,
+            registry=registry,
+            converter=converter,
+            configuration=configuration
+        )
+        if memory_limit <= 0:
+            raise ValueError("The memory limit must be positive.")
+        self._memory_limit = memory_limit
+
+    # The dataset narrowed to the chunked dataset which is read by this
+    # detector.
+    @property
+    def _chunked_dataset(self) -> ChunkedCsvDataset:
+        dataset = self.dataset
+        if not isinstance(dataset, ChunkedCsvDataset):
+            raise ValueError("The chunked detector requires a ChunkedCsvDataset")
+        return dataset
+
+    def detect(self) -> Iterable[ExtendedDetectionResult]:
+        return self._detect(report=None)
+
+    def iter_detect(self) -> Iterator[ExtendedDetectionResult]:
+        # NOTE: The metrics of row-wise expectations are only available after
+        # all chunks are read. Therefore, results are yielded once detection
+        # is complete.
+        yield from self.detect()
+
+    def detect_with_report(self) -> Tuple[List[ExtendedDetectionResult], DetectionReport]:
+        report = DetectionReport(row_count=self._chunked_dataset.get_row_count())
+        detection_results = self._detect(report=report)
+        return detection_results, report
+
+    # Perform detection and add the measurements of each phase to the report
+    # (if provided).
+    def _detect(self, report: Optional[DetectionReport]) -> List[ExtendedDetectionResult]:
+        first_chunk = self._chunked_dataset.get_great_expectations_dataset()
+        with measure(report, "profiling", len(first_chunk)):
+            suite, _ = self.profiler.profile(
+                data_asset=first_chunk,
+                profiler_configuration=self._get_profiler_configuration()
+            )
+
+        execution_engine = PandasExecutionEngine()
+        row_wise_configurations: List[ExpectationConfiguration] = []
+        column_configurations: List[ExpectationConfiguration] = []
+        for configuration in suite.expectations:
+            if self._is_evaluable_on_chunks(configuration, execution_engine):
+                row_wise_configurations.append(configuration)
+            else:
+                column_configurations.append(configuration)
+
+        results, failed_results = self._validate_chunks(row_wise_configurations, report)
+        column_results, column_failed_results = self._validate_columns(
+            column_configurations, report
+        )
+        results.update(column_results)
+        failed_results.extend(column_failed_results)
+
+        # Order the results like Validator.validate does. Results of
+        # expectations which raised an exception do not reference the
+        # corresponding expectation configuration and are appended.
+        ordered_results: List[ExpectationValidationResult] = [
+            results[id(configuration)]
+            for group in _group_expectations_by_column(suite)
+            for configuration in group
+            if id(configuration) in results
+        ]
+        ordered_results.extend(failed_results)
+        validation_result = _build_suite_validation_result(ordered_results, suite)
+
+        self.converter.meta = {
+            "column_types": suite.meta["columns"]
+        }
+        row_count: int = self._chunked_dataset.get_row_count()
+        with measure(report, "conversion", row_count):
+            detection_results = list(self.converter.convert(validation_result))
+        return detection_results
+
+    # Whether the metrics of an expectation can be computed for each chunk
+    # and merged afterwards.
+    @staticmethod
+    def _is_evaluable_on_chunks(configuration: ExpectationConfiguration,
+                                execution_engine: PandasExecutionEngine) -> bool:
+        expectation_impl = get_expectation_impl(configuration.expectation_type)
+        if not issubclass(expectation_impl, DataSmell):
+            return False
+        aggregate_metrics = expectation_impl.get_aggregate_metrics(configuration)
+        if not expectation_impl.row_wise and (
+                len(aggregate_metrics) == 0 or
+                not all(_is_mergeable_metric_name(x) for x in aggregate_metrics)):
+            return False
+
+        dependencies: Dict[str, MetricConfiguration] = \
+            expectation_impl().get_validation_dependencies(
+                configuration, execution_engine, _RUNTIME_CONFIGURATION
+            )["metrics"]
+        return all(_is_mergeable_metric(x) for x in dependencies.values())
+
+    # Evaluate the expectations on each chunk and validate them on the merged
+    # metrics. If a report is provided, the evaluation of each chunk and the
+    # validation of each expectation are measured.
+    def _validate_chunks(self, configurations: List[ExpectationConfiguration],
+                         report: Optional[DetectionReport] = None) \
+            -> Tuple[Dict[int, ExpectationValidationResult], List[ExpectationValidationResult]]:
+        if len(configurations) == 0:
+            return dict(), []
+
+        columns: List[str] = sorted(set(x.kwargs["column"] for x in configurations))
+        aggregate_metrics: Dict[tuple, Any] = self._compute_aggregate_metrics(
+            configurations, report
+        )
+        merged_metrics: Dict[tuple, Any] = dict()
+        for chunk in self._chunked_dataset.iter_chunks(columns=columns):
+            with measure(report, "validation", len(chunk)):
+                self._evaluate_chunk(
+                    chunk, configurations, aggregate_metrics, merged_metrics
+                )
+
+        row_count: int = self._chunked_dataset.get_row_count()
+        execution_engine = PandasExecutionEngine()
+        results: Dict[int, ExpectationValidationResult] = dict()
+        failed_results: List[ExpectationValidationResult] = []
+        for configuration in configurations:
+            # Exceptions are caught in the same way as Validator.graph_validate
+            # does.
+            try:
+                with measure(report, "validation", row_count,
+                             column_name=configuration.kwargs.get("column"),
+                             expectation_type=configuration.expectation_type):
+                    results[id(configuration)] = configuration.metrics_validate(
+                        merged_metrics,
+                        execution_engine=execution_engine,
+                        runtime_configuration=_RUNTIME_CONFIGURATION
+                    )
+            except Exception as err:  # pylint: disable=W0703
+                failed_results.append(ExpectationValidationResult(
+                    success=False,
+                    exception_info={
+                        "raised_exception": True,
+                        "exception_traceback": traceback.format_exc(),
+                        "exception_message": str(err),
+                    }
+                ))
+        return results, failed_results
+
+    # Compute the metrics of the expectations for a chunk and merge them into
+    # the metrics of the previous chunks.
+    @staticmethod
+    def _evaluate_chunk(chunk: pd.DataFrame, configurations: List[ExpectationConfiguration],
+                        aggregate_metrics: Dict[tuple, Any], merged_metrics: Dict[tuple, Any]):
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=chunk)]
+        )
+
+        # The metrics the expectations are directly based on
+        graph = ValidationGraph()
+        dependencies: Dict[tuple, MetricConfiguration] = dict()
+        for configuration in configurations:
+            expectation_impl = get_expectation_impl(configuration.expectation_type)
+            metrics: Dict[str, MetricConfiguration] = \
+                expectation_impl().get_validation_dependencies(
+                    configuration, validator.execution_engine, _RUNTIME_CONFIGURATION
+                )["metrics"]
+            for metric in metrics.values():
+                dependencies[metric.id] = metric
+                validator.build_metric_dependency_graph(
+                    graph,
+                    metric,
+                    configuration,
+                    validator.execution_engine,
+                    runtime_configuration=_RUNTIME_CONFIGURATION
+                )
+
+        # NOTE: Metrics which are passed to resolve_validation_graph are
+        # not computed again, i.e. the merged aggregate metrics are used.
+        chunk_metrics = validator.resolve_validation_graph(
+            graph, dict(aggregate_metrics), _RUNTIME_CONFIGURATION
+        )
+        for metric_id, metric in dependencies.items():
+            # NOTE: The aggregate metrics already cover the whole dataset.
+            if metric_id in aggregate_metrics:
+                merged_metrics[metric_id] = aggregate_metrics[metric_id]
+                continue
+            merged_metrics[metric_id] = _merge_metric(
+                metric, merged_metrics.get(metric_id), chunk_metrics[metric_id]
+            )
+
+    # Compute the aggregate metrics of the expectations over all chunks (the
+    # first pass of the chunk-wise evaluation). If a report is provided, the
+    # evaluation of each chunk is measured.
+    def _compute_aggregate_metrics(self, configurations: List[ExpectationConfiguration],
+                                   report: Optional[DetectionReport] = None) \
+            -> Dict[tuple, Any]:
+        aggregate_configurations: List[ExpectationConfiguration] = [
+            x for x in configurations
+            if len(get_aggregate_metrics(x)) > 0
+        ]
+        if len(aggregate_configurations) == 0:
+            return dict()
+
+        columns: List[str] = sorted(set(x.kwargs["column"] for x in aggregate_configurations))
+        merged_metrics: Dict[tuple, Any] = dict()
+        for chunk in self._chunked_dataset.iter_chunks(columns=columns):
+            with measure(report, "validation", len(chunk)):
+                self._evaluate_chunk_aggregate_metrics(
+                    chunk, aggregate_configurations, merged_metrics
+                )
+        return merged_metrics
+
+    # Compute the aggregate metrics of the expectations for a chunk and merge
+    # them into the aggregate metrics of the previous chunks.
+    @staticmethod
+    def _evaluate_chunk_aggregate_metrics(chunk: pd.DataFrame,
+                                          configurations: List[ExpectationConfiguration],
+                                          merged_metrics: Dict[tuple, Any]):
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=chunk)]
+        )
+
+        # Find the aggregate metrics in the metric dependency graphs of
+        # the expectations.
+        graph = ValidationGraph()
+        aggregate_metrics: Dict[tuple, MetricConfiguration] = dict()
+        for configuration in configurations:
+            expectation_impl = get_expectation_impl(configuration.expectation_type)
+            metrics: Dict[str, MetricConfiguration] = \
+                expectation_impl().get_validation_dependencies(
+                    configuration, validator.execution_engine, _RUNTIME_CONFIGURATION
+                )["metrics"]
+            expectation_graph = ValidationGraph()
+            for metric in metrics.values():
+                validator.build_metric_dependency_graph(
+                    expectation_graph,
+                    metric,
+                    configuration,
+                    validator.execution_engine,
+                    runtime_configuration=_RUNTIME_CONFIGURATION
+                )
+            for edge in expectation_graph.edges:
+                for metric in (edge.left, edge.right):
+                    if metric is None or metric.id in aggregate_metrics or \
+                            metric.metric_name not in get_aggregate_metrics(configuration):
+                        continue
+                    aggregate_metrics[metric.id] = metric
+                    validator.build_metric_dependency_graph(
+                        graph,
+                        metric,
+                        configuration,
+                        validator.execution_engine,
+                        runtime_configuration=_RUNTIME_CONFIGURATION
+                    )
+
+        chunk_metrics = validator.resolve_validation_graph(
+            graph, dict(), _RUNTIME_CONFIGURATION
+        )
+        for metric_id, metric in aggregate_metrics.items():
+            merged_metrics[metric_id] = _merge_metric(
+                metric, merged_metrics.get(metric_id), chunk_metrics[metric_id]
+            )
+
+    # Validate the expectations which need to see the whole column column by
+    # column. The columns are read in batches which fit into the memory
+    # limit. If a report is provided, the expectations are validated one at a
+    # time and the validation of each expectation is measured.
+    def _validate_columns(self, configurations: List[ExpectationConfiguration],
+                          report: Optional[DetectionReport] = None) \
+            -> Tuple[Dict[int, ExpectationValidationResult], List[ExpectationValidationResult]]:
+        suite = ExpectationSuite(
+            expectation_suite_name="column_expectations",
+            expectations=configurations
+        )
+        groups: Dict[Optional[str], List[ExpectationConfiguration]] = {
+            group[0].kwargs.get("column"): group
+            for group in _group_expectations_by_column(suite)
+        }
+        column_names: List[str] = [x for x in groups if x is not None]
+
+        results: Dict[int, ExpectationValidationResult] = dict()
+        failed_results: List[ExpectationValidationResult] = []
+        if len(column_names) > 0:
+            for dataframe in self._chunked_dataset.iter_column_batches(column_names, self._memory_limit):
+                validator = Validator(
+                    execution_engine=PandasExecutionEngine(),
+                    batches=[Batch(data=dataframe)]
+                )
+                for column in dataframe.columns:
+                    self._validate_group(
+                        validator, groups[column], len(dataframe), report, results, failed_results
+                    )
+        if None in groups:
+            # Expectations without a column are validated on all columns.
+            dataframe = self._chunked_dataset.read_columns()
+            validator = Validator(
+                execution_engine=PandasExecutionEngine(),
+                batches=[Batch(data=dataframe)]
+            )
+            self._validate_group(
+                validator, groups[None], len(dataframe), report, results, failed_results
+            )
+        return results, failed_results
+
+    # Validate the expectations of a single column and store their results.
+    @staticmethod
+    def _validate_group(validator: Validator, group: List[ExpectationConfiguration],
+                        row_count: int, report: Optional[DetectionReport],
+                        results: Dict[int, ExpectationValidationResult],
+                        failed_results: List[ExpectationValidationResult]):
+        group_results: List[ExpectationValidationResult] = []
+        if report is None:
+            group_results = validator.graph_validate(
+                configurations=group,
+                runtime_configuration=_RUNTIME_CONFIGURATION
+            )
+        else:
+            for configuration in group:
+                with measure(report, "validation", row_count,
+                             column_name=configuration.kwargs.get("column"),
+                             expectation_type=configuration.expectation_type):
+                    group_results.extend(validator.graph_validate(
+                        configurations=[configuration],
+                        runtime_configuration=_RUNTIME_CONFIGURATION
+                    ))
+        for result in group_results:
+            if result.expectation_config is None:
+                failed_results.append(result)
+            else:
+                results[id(result.expectation_config)] = result
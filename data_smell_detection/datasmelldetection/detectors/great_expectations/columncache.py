@@ -0,0 +1,255 @@
+"""
+Share the null masks and the non-null values of columns between the metrics
+of a validation run.
+
+The map and aggregate metrics of Great Expectations filter the null values of
+a column by indexing the whole batch (``df[df[column].notnull()]``) whenever a
+metric is computed. Therefore, each expectation of a column scans the column
+for null values and copies the batch several times. The metrics of the data
+smells use the :class:`.ColumnCache` of the execution engine instead. It
+computes the null mask and the non-null values of each column once per
+validation run. The detector releases the entries of a column once all
+expectations of the column have been validated.
+"""
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.execution_engine import (
+    MetricDomainTypes,
+    MetricPartialFunctionTypes,
+)
+from great_expectations.expectations.metrics import ColumnMapMetricProvider
+from great_expectations.expectations.metrics.metric_provider import (
+    metric_partial,
+    metric_value,
+)
+
+
+@dataclass
+class CachedColumn:
+    """The null mask and the non-null values of a column of a batch."""
+
+    data: pd.DataFrame
+    """The batch (or domain) the column belongs to."""  # pylint: disable=W0105
+
+    null_mask: np.ndarray
+    """Whether the values of the column are null."""  # pylint: disable=W0105
+
+    nonnull_values: pd.Series
+    """The non-null values of the column."""  # pylint: disable=W0105
+
+    def expand(self, nonnull_flags: Any) -> pd.Series:
+        """
+        Expand flags of the non-null values to all values of the column.
+
+        :param nonnull_flags: A boolean array-like which is aligned with the
+            non-null values.
+        :return: The flags aligned with all values of the column. The flags of
+            null values are False.
+        """
+        flags = np.zeros(len(self.null_mask), dtype=bool)
+        flags[~self.null_mask] = np.asarray(nonnull_flags, dtype=bool)
+        return pd.Series(flags, index=self.data.index)
+
+
+class ColumnCache:
+    """
+    Store the :class:`.CachedColumn` of each column of a batch.
+
+    An entry is recomputed if the column is requested for another batch or
+    domain (e.g. a domain with a row condition).
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, CachedColumn] = dict()
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def get(self, data: pd.DataFrame, column_name: str) -> CachedColumn:
+        """
+        :param data: The batch (or domain) which contains the column.
+        :param column_name: The name of the column.
+        :return: The null mask and the non-null values of the column.
+        """
+        cached = self._columns.get(column_name)
+        if cached is None or cached.data is not data:
+            cached = _cache_column(data, column_name)
+            self._columns[column_name] = cached
+        return cached
+
+    def release(self, column_name: Optional[str]):
+        """
+        Release the cached values of a column.
+
+        :param column_name: The name of the column (ignored if the column is
+            not cached).
+        """
+        if column_name is not None:
+            self._columns.pop(column_name, None)
+
+
+# Compute the null mask and the non-null values of a column. A column without
+# null values is not copied.
+def _cache_column(data: pd.DataFrame, column_name: str) -> CachedColumn:
+    column: pd.Series = data[column_name]
+    null_mask: np.ndarray = column.isnull().to_numpy()
+    return CachedColumn(
+        data=data,
+        null_mask=null_mask,
+        nonnull_values=column[~null_mask] if null_mask.any() else column
+    )
+
+
+def get_column_cache(execution_engine: ExecutionEngine) -> ColumnCache:
+    """
+    Get the :class:`.ColumnCache` of an execution engine. The cache is created
+    when it is requested for the first time and lives as long as the
+    execution engine.
+
+    :param execution_engine: The execution engine.
+    :return: The cache of the execution engine.
+    """
+    cache: Optional[ColumnCache] = getattr(execution_engine, "_column_cache", None)
+    if cache is None:
+        cache = ColumnCache()
+        setattr(execution_engine, "_column_cache", cache)
+    return cache
+
+
+def get_cached_column(execution_engine: PandasExecutionEngine, metric_domain_kwargs: Dict,
+                      metrics: Dict[str, Any]) -> Tuple[CachedColumn, Dict, Dict]:
+    """
+    Resolve the column domain of a metric in the same way as the decorators of
+    Great Expectations and get the cached column.
+
+    :param execution_engine: The execution engine which computes the metric.
+    :param metric_domain_kwargs: The domain kwargs of the metric.
+    :param metrics: The resolved dependencies of the metric (including the
+        table.columns metric).
+    :return: The cached column, the compute domain kwargs and the accessor
+        domain kwargs.
+    """
+    (
+        data,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = execution_engine.get_compute_domain(
+        domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+    )
+
+    column_name = accessor_domain_kwargs["column"]
+    if column_name not in metrics["table.columns"]:
+        raise ge_exceptions.ExecutionEngineError(
+            message=f'Error: The column "{column_name}" in BatchData does not exist.'
+        )
+    cached = get_column_cache(execution_engine).get(data, column_name)
+    return cached, compute_domain_kwargs, accessor_domain_kwargs
+
+
+class CachedColumnMapMetricProvider(ColumnMapMetricProvider):
+    """
+    A base class for map metrics whose conditions are evaluated on the cached
+    non-null values of a column (see :func:`cached_condition_partial`).
+
+    The conditions flag the unexpected values among all values of the column
+    and never flag null values. Therefore, Great Expectations does not have to
+    filter the batch again when the unexpected values are collected.
+    """
+
+    filter_column_isnull = False
+
+
+def cached_condition_partial(engine=PandasExecutionEngine):
+    """
+    Provide the condition of a :class:`.CachedColumnMapMetricProvider`.
+
+    This decorator is similar to
+    :func:`~great_expectations.expectations.metrics.column_condition_partial`.
+    However, the decorated function is called with the cached non-null values
+    of the column (see :class:`.ColumnCache`). It returns a boolean array-like
+    which is aligned with the non-null values. Only the PandasExecutionEngine
+    is supported.
+    """
+    if not issubclass(engine, PandasExecutionEngine):
+        raise ValueError("cached_condition_partial only supports the PandasExecutionEngine")
+
+    def wrapper(metric_fn: Callable):
+        @metric_partial(
+            engine=engine,
+            partial_fn_type=MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
+            domain_type=MetricDomainTypes.COLUMN,
+        )
+        @wraps(metric_fn)
+        def inner_func(
+            cls,
+            execution_engine: PandasExecutionEngine,
+            metric_domain_kwargs: Dict,
+            metric_value_kwargs: Dict,
+            metrics: Dict[str, Any],
+            runtime_configuration: Dict,
+        ):
+            cached, compute_domain_kwargs, accessor_domain_kwargs = get_cached_column(
+                execution_engine, metric_domain_kwargs, metrics
+            )
+            meets_expectation = metric_fn(
+                cls,
+                cached.nonnull_values,
+                **metric_value_kwargs,
+                _metrics=metrics,
+            )
+            return (
+                cached.expand(~np.asarray(meets_expectation, dtype=bool)),
+                compute_domain_kwargs,
+                accessor_domain_kwargs,
+            )
+
+        return inner_func
+
+    return wrapper
+
+
+def cached_column_aggregate_value(engine=PandasExecutionEngine):
+    """
+    Provide the value of a column aggregate metric which is computed from the
+    cached non-null values of a column (see :class:`.ColumnCache`).
+
+    This decorator is similar to
+    :func:`~great_expectations.expectations.metrics.column_aggregate_value`
+    with filter_column_isnull set. Only the PandasExecutionEngine is
+    supported.
+    """
+    if not issubclass(engine, PandasExecutionEngine):
+        raise ValueError("cached_column_aggregate_value only supports the PandasExecutionEngine")
+
+    def wrapper(metric_fn: Callable):
+        @metric_value(
+            engine=engine,
+            metric_fn_type="value",
+            domain_type=MetricDomainTypes.COLUMN,
+        )
+        @wraps(metric_fn)
+        def inner_func(
+            cls,
+            execution_engine: PandasExecutionEngine,
+            metric_domain_kwargs: Dict,
+            metric_value_kwargs: Dict,
+            metrics: Dict[str, Any],
+            runtime_configuration: Dict,
+        ):
+            cached, _, _ = get_cached_column(execution_engine, metric_domain_kwargs, metrics)
+            return metric_fn(
+                cls,
+                column=cached.nonnull_values,
+                **metric_value_kwargs,
+                _metrics=metrics,
+            )
+
+        return inner_func
+
+    return wrapper
@@ -1,4 +1,6 @@
-from typing import Set, Optional, Iterator
+from typing import Set, Optional, Iterator, Dict, List
+import numpy as np
+import pandas as pd
 from great_expectations import DataContext
 from great_expectations.core.batch import BatchRequest
 from great_expectations.dataset.pandas_dataset import PandasDataset
@@ -50,6 +52,154 @@ class DatasetWrapper(datasmelldetection.core.Dataset):
         return self._batch_request
 
 
+# Combine the dtypes which pandas inferred for a column in different chunks to
+# the dtype which would be inferred if the whole file was read at once.
+def _combine_dtypes(dtypes: List[np.dtype]) -> np.dtype:
+    unique_dtypes = set(dtypes)
+    if len(unique_dtypes) == 1:
+        return dtypes[0]
+    if all(x.kind in "iuf" for x in unique_dtypes):
+        # e.g. an integer column where only some chunks contain missing values
+        return np.result_type(*unique_dtypes)
+    # Values which cannot be represented by a common type are kept as strings.
+    return np.dtype(object)
+
+
+class ChunkedCsvDataset(datasmelldetection.core.Dataset):
+    """
+    A CSV file which is read in chunks of a fixed number of rows.
+
+    This class is intended for files which do not fit into memory. The dtypes
+    of the columns are determined by reading the whole file once. Afterwards
+    chunks are read using these dtypes to ensure that the values of the chunks
+    match the values of the whole file read at once.
+    """
+
+    def __init__(self, path: str, chunksize: int):
+        """
+        :param path: The path of the CSV file.
+        :param chunksize: The number of rows per chunk.
+        """
+        self._path = path
+        self._chunksize = chunksize
+        self._dtypes: Optional[Dict[str, np.dtype]] = None
+        self._row_count: Optional[int] = None
+
+    @property
+    def path(self) -> str:
+        """The path of the CSV file."""
+        return self._path
+
+    @property
+    def chunksize(self) -> int:
+        """The number of rows per chunk."""
+        return self._chunksize
+
+    def get_column_names(self) -> Set[str]:
+        """
+        :return: The column names of the CSV file.
+        """
+        return set(pd.read_csv(self._path, nrows=0).columns)
+
+    def get_dtypes(self) -> Dict[str, np.dtype]:
+        """
+        :return: The dtypes of the columns of the whole CSV file. The file is
+            read once when this method is called for the first time.
+        """
+        if self._dtypes is None:
+            chunk_dtypes: Dict[str, List[np.dtype]] = dict()
+            row_count = 0
+            for chunk in pd.read_csv(self._path, chunksize=self._chunksize):
+                row_count += len(chunk)
+                for column, dtype in chunk.dtypes.items():
+                    chunk_dtypes.setdefault(column, []).append(dtype)
+            self._dtypes = {
+                column: _combine_dtypes(dtypes) for column, dtypes in chunk_dtypes.items()
+            }
+            self._row_count = row_count
+        return self._dtypes
+
+    def get_row_count(self) -> int:
+        """
+        :return: The number of rows of the CSV file. The rows are counted when
+            the dtypes are determined (see :meth:`get_dtypes`).
+        """
+        self.get_dtypes()
+        assert self._row_count is not None
+        return self._row_count
+
+    def iter_chunks(self, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the chunks of the CSV file.
+
+        :param columns: The columns to read. All columns are read if this
+            parameter is None.
+        :return: An iterator over the chunks. The index of the chunks is
+            continued across chunks.
+        """
+        return pd.read_csv(
+            self._path,
+            chunksize=self._chunksize,
+            usecols=columns,
+            dtype=self.get_dtypes()
+        )
+
+    def read_columns(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read specific columns of the whole CSV file.
+
+        :param columns: The columns to read. All columns are read if this
+            parameter is None.
+        :return: The read columns.
+        """
+        return pd.read_csv(self._path, usecols=columns, dtype=self.get_dtypes())
+
+    def iter_column_batches(self, columns: List[str], memory_limit: int) \
+            -> Iterator[pd.DataFrame]:
+        """
+        Read whole columns of the CSV file in batches of consecutive columns.
+
+        The memory usage of each column is estimated from the first chunk.
+        The columns of a batch are read in a single pass over the chunks and
+        their estimated memory usage does not exceed the memory limit. A
+        column whose estimate exceeds the limit is read on its own.
+
+        :param columns: The columns to read.
+        :param memory_limit: The maximum estimated memory usage of a batch in
+            bytes.
+        :return: An iterator over the batches. The columns of each batch are
+            ordered like the given columns.
+        """
+        first_chunk: Optional[pd.DataFrame] = next(iter(self.iter_chunks(columns)), None)
+        scale = self.get_row_count() / len(first_chunk) \
+            if first_chunk is not None and len(first_chunk) > 0 else 0.0
+
+        batch: List[str] = []
+        batch_memory_usage = 0.0
+        for column in columns:
+            memory_usage = first_chunk[column].memory_usage(deep=True) * scale \
+                if first_chunk is not None else 0.0
+            if len(batch) > 0 and batch_memory_usage + memory_usage > memory_limit:
+                yield self._read_column_batch(batch)
+                batch = []
+                batch_memory_usage = 0.0
+            batch.append(column)
+            batch_memory_usage += memory_usage
+        if len(batch) > 0:
+            yield self._read_column_batch(batch)
+
+    # Read whole columns in a single pass over the chunks.
+    def _read_column_batch(self, columns: List[str]) -> pd.DataFrame:
+        return pd.concat(list(self.iter_chunks(columns)))[columns]
+
+    def get_great_expectations_dataset(self) -> great_expectations.dataset.Dataset:
+        """
+        :return: The first chunk of the CSV file. It is intended to be used for
+            profiling.
+        """
+        return PandasDataset(next(iter(self.iter_chunks())))
+
+
 class FileBasedDatasetManager(datasmelldetection.core.DatasetManager):
     """
     A class for managing :class:`.Dataset` instances.
@@ -65,6 +215,7 @@ class FileBasedDatasetManager(datasmelldetection.core.DatasetManager):
             :class:`~.context.GreatExpectationsContextBuilder` utility class.
         """
         self._datasource = context.get_datasource("csv_data_source")
+        self._data_connector = self._datasource.data_connectors["csv_data_connector"]
 
     # Convenience function for constructing batch request (for default Great
     # Expectations setup)
@@ -113,3 +264,28 @@ class FileBasedDatasetManager(datasmelldetection.core.DatasetManager):
         # Construct internal dataset wrapper to enable consistent column name
         # access.
         return DatasetWrapper(dataset, batch_request=batch_request)
+
+    def get_chunked_dataset(self, dataset_identifier: str, chunksize: int) -> ChunkedCsvDataset:
+        """
+        :param dataset_identifier: The dataset identifier (e.g. file name of the CSV file)
+            to import.
+        :param chunksize: The number of rows per chunk.
+        :return: The dataset which is read in chunks. The data is not read
+            by this method.
+        """
+
+        return ChunkedCsvDataset(path=self.get_dataset_path(dataset_identifier), chunksize=chunksize)
+
+    def get_dataset_path(self, dataset_identifier: str) -> str:
+        """
+        :param dataset_identifier: The dataset identifier (e.g. file name of the CSV file).
+        :return: The path of the file which contains the dataset.
+        :raises ValueError: If no dataset with the identifier exists.
+        """
+
+        batch_request = self.build_batch_request(filename=dataset_identifier)
+        batch_definitions = self._datasource.get_available_batch_definitions(batch_request)
+        if len(batch_definitions) == 0:
+            raise ValueError(f"The dataset {dataset_identifier!r} does not exist.")
+        batch_spec = self._data_connector.build_batch_spec(batch_definition=batch_definitions[0])
+        return batch_spec["path"]
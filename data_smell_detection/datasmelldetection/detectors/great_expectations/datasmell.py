@@ -1,10 +1,13 @@
 from abc import ABC
 import copy
 from dataclasses import dataclass
+import importlib
 from inspect import isabstract
-from typing import Set, Optional, Dict
+from typing import Any, Set, Optional, Dict, Iterable, Tuple
+from great_expectations.core import ExpectationConfiguration
 from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.expectations.expectation import Expectation
+from great_expectations.expectations.registry import get_expectation_impl
 from great_expectations.profile.base import ProfilerDataType
 
 from datasmelldetection.core.datasmells import DataSmellType
@@ -41,19 +44,56 @@ class DataSmellRegistry:
         # Type: Dict[str, DataSmellType]
         self._expectation_type_to_data_smell_type = dict()
 
-    def register(self, metadata: DataSmellMetadata, expectation_type: str):
+        # Store the scan features which are used by each expectation type
+        # Type: Dict[str, Set[str]]
+        self._expectation_type_to_scan_features = dict()
+
+        # Store the name of the module which defines each expectation type
+        # Type: Dict[str, str]
+        self._expectation_type_to_module = dict()
+
+    def register(self, metadata: DataSmellMetadata, expectation_type: str,
+                 scan_features: Iterable[str] = (), module: Optional[str] = None):
         """
         Store a new mapping between a data smell and the corresponding Great Expectations
         expectation.
 
         :param metadata: Information about the smell detection.
         :param expectation_type: The type of the Great Expectations expectation.
+        :param scan_features: The names of the scan features (see
+            :mod:`~datasmelldetection.detectors.great_expectations.scanner`)
+            which the expectation uses.
+        :param module: The name of the module which defines the expectation.
+            If the name is passed, the expectation can be registered without
+            importing the module. The module is imported by
+            :meth:`load_expectations`.
         """
         for data_type in metadata.profiler_data_types:
             self._profiler_data_type_specific_data_smells[data_type][metadata.data_smell_type] = expectation_type
 
         self._expectation_type_to_data_smell_type[expectation_type] = \
             metadata.data_smell_type
+        self._expectation_type_to_scan_features[expectation_type] = set(scan_features)
+        if module is not None:
+            self._expectation_type_to_module[expectation_type] = module
+
+    def load_expectations(self, expectation_types: Optional[Iterable[str]] = None):
+        """
+        Import the modules which define registered expectations.
+
+        Great Expectations can only evaluate an expectation once its module
+        has been imported. Modules which have already been imported and
+        expectation types without a registered module are skipped.
+
+        :param expectation_types: The types of the expectations to load. If
+            None, all registered expectations are loaded.
+        """
+        if expectation_types is None:
+            expectation_types = list(self._expectation_type_to_module)
+        for expectation_type in expectation_types:
+            module: Optional[str] = self._expectation_type_to_module.get(expectation_type)
+            if module is not None:
+                importlib.import_module(module)
 
     def get_smell_dict_for_profiler_data_type(self, profiler_data_type: ProfilerDataType) -> \
             Dict[DataSmellType, str]:
@@ -77,6 +117,16 @@ class DataSmellRegistry:
         """
         return copy.deepcopy(self._expectation_type_to_data_smell_type)
 
+    def get_scan_features(self, expectation_type: str) -> Set[str]:
+        """
+        Get the names of the scan features which a registered expectation uses.
+
+        :param expectation_type: The type of the Great Expectations expectation.
+        :return: The set of scan feature names. The set is empty if the
+            expectation does not use the fused column scan.
+        """
+        return set(self._expectation_type_to_scan_features.get(expectation_type, set()))
+
     def get_registered_data_smells(self) -> Set[DataSmellType]:
         """
         Get a set of data smell types which have been registered. Registered
@@ -114,6 +164,62 @@ class DataSmell(ABC):
     :class:`.DataSmellRegistry`.
     """  # pylint: disable=W0105
 
+    scan_features: Tuple[str, ...] = ()
+    """
+    The names of the scan features the expectation uses. The features of all
+    expectations of a column are computed by a single column scan (see
+    :mod:`~datasmelldetection.detectors.great_expectations.scanner`).
+    """  # pylint: disable=W0105
+
+    row_wise: bool = False
+    """
+    Whether the detection result for a value only depends on the value itself.
+    Expectations of row-wise data smells can be evaluated on chunks of a
+    dataset whose results are merged afterwards.
+    """  # pylint: disable=W0105
+
+    aggregate_metrics: Tuple[str, ...] = ()
+    """
+    The names of the column metrics the detection result for a value depends
+    on besides the value itself (e.g. a histogram of the column). If the
+    metrics can be merged across chunks, the expectation is evaluated on
+    chunks of a dataset in two passes. The first pass computes the merged
+    metrics which are used to evaluate the values of the chunks in the second
+    pass.
+    """  # pylint: disable=W0105
+
+    @classmethod
+    def get_aggregate_metrics(cls, configuration: ExpectationConfiguration) -> Tuple[str, ...]:
+        """
+        Return the names of the aggregate metrics (see
+        :attr:`aggregate_metrics`) an expectation configuration depends on.
+
+        By default, all aggregate metrics are returned. Data smells whose
+        metrics depend on the kwargs of the configuration override this
+        method. If no aggregate metrics are returned for a data smell which is
+        not row-wise, the expectation is evaluated on whole columns.
+
+        :param configuration: The expectation configuration.
+        :return: The names of the aggregate metrics.
+        """
+        return cls.aggregate_metrics
+
+    @classmethod
+    def get_cache_kwargs(cls, configuration: ExpectationConfiguration) -> Dict[str, Any]:
+        """
+        Return the kwargs which determine the validation result of an
+        expectation configuration (see
+        :func:`~datasmelldetection.detectors.great_expectations.cache.compute_cache_key`).
+
+        By default, the kwargs of the configuration are returned. Data smells
+        whose default kwargs depend on the time of validation override this
+        method to resolve these defaults.
+
+        :param configuration: The expectation configuration.
+        :return: The kwargs which are used to compute the cache key.
+        """
+        return configuration.kwargs
+
     @classmethod
     def is_abstract(cls) -> bool:
         """
@@ -152,4 +258,24 @@ class DataSmell(ABC):
 
         # TODO: Ensure metadata is not None (raise exception otherwise)
         # TODO: Remove ignore
-        registry.register(cls.data_smell_metadata, expectation_type=expectation_type) # type: ignore
+        registry.register(
+            cls.data_smell_metadata,  # type: ignore
+            expectation_type=expectation_type,
+            scan_features=cls.scan_features,
+            module=cls.__module__
+        )
+
+
+def get_aggregate_metrics(configuration: ExpectationConfiguration) -> Tuple[str, ...]:
+    """
+    Return the names of the aggregate metrics an expectation configuration
+    depends on (see :meth:`DataSmell.get_aggregate_metrics`).
+
+    :param configuration: The expectation configuration.
+    :return: The names of the aggregate metrics. The tuple is empty if the
+        expectation does not perform data smell detection.
+    """
+    expectation_impl = get_expectation_impl(configuration.expectation_type)
+    if not issubclass(expectation_impl, DataSmell):
+        return ()
+    return expectation_impl.get_aggregate_metrics(configuration)
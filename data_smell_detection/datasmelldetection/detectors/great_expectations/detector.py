@@ -1,22 +1,45 @@
 from dataclasses import dataclass
-from typing import Set, Optional, Iterable, Dict, Any
+from typing import Set, Optional, Iterable, Iterator, Dict, Any, Union, List, Tuple
+import pandas as pd
 from great_expectations.profile.base import DatasetProfiler
 from great_expectations import DataContext
-from great_expectations.validator.validator import ExpectationSuiteValidationResult
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validator import (
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+    Validator
+)
 
 from datasmelldetection.core.datasmells import DataSmellType
 from datasmelldetection.core.detector import (
     ConfigurableDetector,
     DetectionResult, Configuration
 )
-from .dataset import DatasetWrapper
+from .cache import ResultCache, compute_cache_key, compute_column_hash
+from .columncache import ColumnCache, get_column_cache
+from .dataset import ChunkedCsvDataset, DatasetWrapper
 from .datasmell import DataSmellRegistry, default_registry
 from .converter import (
     DetectionResultConverter,
     ExtendedDetectionResult,
     StandardResultConverter
 )
+from .native import (
+    NativeConditionRegistry,
+    default_native_condition_registry,
+    validate_column_natively
+)
+from .parallel import (
+    _RUNTIME_CONFIGURATION,
+    _build_suite_validation_result,
+    _group_expectations_by_column,
+    iter_validate_in_parallel
+)
 from .profiler import DataSmellAwareProfiler
+from .type_inference import ColumnTypeCache
+from .report import DetectionReport, measure
 
 
 @dataclass
@@ -35,6 +58,68 @@ class DataSmellAwareConfiguration(Configuration):
     configuration value.
     """  # pylint: disable=W0105
 
+    fused_scan: bool = True
+    """
+    Whether the values of each column should be scanned only once for all
+    expectations of the column which support the fused column scan. This
+    field is meant to be passed to the :class:`.DataSmellAwareProfiler` as the
+    "fused_scan" configuration value.
+    """  # pylint: disable=W0105
+
+    max_workers: Optional[int] = None
+    """
+    The maximum number of worker processes used to validate the generated
+    expectations. The expectations are split by column and the columns are
+    validated in parallel. If this field is None or 1, validation is performed
+    in the calling process.
+    """  # pylint: disable=W0105
+
+    strict_type_inference: bool = False
+    """
+    Whether the types of the columns are checked for all values by the
+    expectations of the basic dataset profiler of Great Expectations. If this
+    field is False, the types are derived from the dtypes of the columns and a
+    sample of the values of object columns. This field is meant to be passed
+    to the :class:`.DataSmellAwareProfiler` as the "strict_type_inference"
+    configuration value.
+    """  # pylint: disable=W0105
+
+    column_type_cache: Optional[ColumnTypeCache] = None
+    """
+    The cache which stores the types of the columns determined by strict type
+    inference under a hash of the content of the columns. If the same data is
+    profiled again (e.g. by a second call of detect), the types are not
+    checked again. If this field is None, the types are not cached. This
+    field is meant to be passed to the :class:`.DataSmellAwareProfiler` as the
+    "column_type_cache" configuration value.
+    """  # pylint: disable=W0105
+
+
+# Create the configuration which is passed to the profiler.
+def _create_profiler_configuration(registry: DataSmellRegistry,
+                                   configuration: Optional[Configuration]) -> Dict[str, Any]:
+    profiler_configuration: Dict[str, Any] = {
+        "registry": registry
+    }
+
+    if configuration is not None:
+        # Use the data_smell_configuration key if it was provided by the
+        # user.
+        if isinstance(configuration, DataSmellAwareConfiguration):
+            configuration_: DataSmellAwareConfiguration = configuration
+            profiler_configuration["data_smell_configuration"] = \
+                configuration_.data_smell_configuration
+            profiler_configuration["fused_scan"] = configuration_.fused_scan
+            profiler_configuration["strict_type_inference"] = \
+                configuration_.strict_type_inference
+            profiler_configuration["column_type_cache"] = configuration_.column_type_cache
+
+        # Use the column names information (if provided)
+        column_names: Optional[Set[str]] = configuration.column_names
+        profiler_configuration["column_names"] = column_names
+
+    return profiler_configuration
+
 
 class GreatExpectationsDetector(ConfigurableDetector):
     def __init__(
@@ -44,13 +129,15 @@ class GreatExpectationsDetector(ConfigurableDetector):
             profiler: DatasetProfiler,
             registry: DataSmellRegistry,
             converter: DetectionResultConverter,
-            configuration: Optional[Configuration]):
+            configuration: Optional[Configuration],
+            result_cache: Optional[ResultCache] = None):
         super(GreatExpectationsDetector, self).__init__(configuration)
         self.context = context
         self.dataset = dataset
         self.profiler = profiler
         self.registry = registry
         self.converter = converter
+        self.result_cache = result_cache
 
     @property
     def dataset(self) -> DatasetWrapper:
@@ -106,41 +193,314 @@ class GreatExpectationsDetector(ConfigurableDetector):
         # TODO: Validate argument
         self._converter = new_context
 
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """
+        The cache which stores the validation results of expectations. If
+        this attribute is None, all expectations are validated in each call
+        of :meth:`detect`.
+        """
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, new_result_cache: Optional[ResultCache]):
+        # TODO: Validate argument
+        self._result_cache = new_result_cache
+
+    # Create the configuration which is passed to the profiler.
+    def _get_profiler_configuration(self) -> Dict[str, Any]:
+        return _create_profiler_configuration(self.registry, self.configuration)
+
     def detect(self) -> Iterable[ExtendedDetectionResult]:
-        profiler_configuration: Dict[str, Any] = {
-            "registry": self.registry
+        return list(self.iter_detect())
+
+    def iter_detect(self) -> Iterator[ExtendedDetectionResult]:
+        """
+        Perform detection and yield the detection results of each column as
+        soon as the expectations of the column are validated.
+
+        :return: An iterator over the detection results.
+        """
+        yield from self._iter_detect(report=None)
+
+    def detect_with_report(self) -> Tuple[List[ExtendedDetectionResult], DetectionReport]:
+        """
+        Perform detection and measure the wall time, the throughput and the
+        peak allocated memory of the profiling, the validation of each
+        expectation and the conversion of the validation results of each
+        column.
+
+        To attribute the measurements, the expectations are validated one at
+        a time in the calling process (i.e. the max_workers field of the
+        configuration is ignored). The detection results are the same as the
+        results of :meth:`detect`.
+
+        :return: The detection results and the report which contains the
+            measurements.
+        """
+        report = DetectionReport(row_count=len(self.dataset.get_great_expectations_dataset()))
+        detection_results = list(self._iter_detect(report=report))
+        return detection_results, report
+
+    # Perform detection and add the measurements of each phase to the report
+    # (if provided).
+    def _iter_detect(self, report: Optional[DetectionReport]) \
+            -> Iterator[ExtendedDetectionResult]:
+        # Validate the already imported dataset instead of importing it again
+        # using the batch request of the dataset. The DataFrame shares the
+        # data of the wrapped dataset.
+        dataframe = pd.DataFrame(self.dataset.get_great_expectations_dataset())
+
+        with measure(report, "profiling", len(dataframe)):
+            suite, _ = self.profiler.profile(
+                data_asset=self.dataset.get_great_expectations_dataset(),
+                profiler_configuration=self._get_profiler_configuration()
+            )
+
+        self.converter.meta = {
+            "column_types": suite.meta["columns"]
         }
+        # A validation result is yielded for each group of expectations.
+        column_validation_results = zip(
+            _group_expectations_by_column(suite),
+            self._iter_validate(dataframe, suite, report)
+        )
+        for group, column_validation_result in column_validation_results:
+            with measure(report, "conversion", len(dataframe),
+                         column_name=group[0].kwargs.get("column")):
+                detection_results = list(self.converter.convert(column_validation_result))
+            yield from detection_results
+
+    # Validate the expectation suite and yield the validation results of the
+    # expectations of each column. Expectations whose results are cached are
+    # not validated. The results are cached per column content, expectation
+    # type and kwargs.
+    def _iter_validate(self, dataframe: pd.DataFrame, suite: ExpectationSuite,
+                       report: Optional[DetectionReport] = None) \
+            -> Iterator[ExpectationSuiteValidationResult]:
+        keys: Dict[int, str] = dict()
+        results: Dict[int, ExpectationValidationResult] = dict()
+        uncached_expectations: List[ExpectationConfiguration] = suite.expectations
+        if self.result_cache is not None:
+            column_hashes: Dict[str, str] = dict()
+            uncached_expectations = []
+            for configuration in suite.expectations:
+                column: str = configuration.kwargs["column"]
+                if column not in column_hashes:
+                    column_hashes[column] = compute_column_hash(dataframe[column])
+                keys[id(configuration)] = compute_cache_key(column_hashes[column], configuration)
+
+                cached_result = self.result_cache.get(keys[id(configuration)])
+                if cached_result is None:
+                    uncached_expectations.append(configuration)
+                else:
+                    results[id(configuration)] = cached_result
+
+        uncached_suite = ExpectationSuite(
+            expectation_suite_name=suite.expectation_suite_name,
+            expectations=uncached_expectations,
+            meta=suite.meta
+        )
+        # The columns of the uncached expectations are validated in the same
+        # order as the columns of the whole suite.
+        uncached_results = self._iter_validate_columns(dataframe, uncached_suite, report)
+
+        for group in _group_expectations_by_column(suite):
+            failed_results: List[ExpectationValidationResult] = []
+            if any(id(x) not in results for x in group):
+                # The validator may copy the expectation configurations.
+                # Therefore, results are assigned to the configurations by
+                # equality. Results of expectations which raised an exception
+                # do not reference the configuration and are not cached.
+                for result in next(uncached_results).results:
+                    configuration_ = next(
+                        (x for x in group
+                         if id(x) not in results and x == result.expectation_config),
+                        None
+                    )
+                    if configuration_ is None:
+                        failed_results.append(result)
+                        continue
+                    results[id(configuration_)] = result
+                    if self.result_cache is not None:
+                        self.result_cache.put(keys[id(configuration_)], result)
+
+            ordered_results: List[ExpectationValidationResult] = [
+                results[id(x)] for x in group if id(x) in results
+            ]
+            ordered_results.extend(failed_results)
+            yield _build_suite_validation_result(ordered_results, suite)
+
+    # Validate the expectation suite and yield the validation results of the
+    # expectations of each column. If a report is provided, the expectations
+    # are validated one at a time and the validation of each expectation is
+    # measured.
+    def _iter_validate_columns(self, dataframe: pd.DataFrame, suite: ExpectationSuite,
+                               report: Optional[DetectionReport] = None) \
+            -> Iterator[ExpectationSuiteValidationResult]:
+        max_workers: Optional[int] = None
+        if isinstance(self.configuration, DataSmellAwareConfiguration) and report is None:
+            max_workers = self.configuration.max_workers
+
+        if max_workers is not None and max_workers > 1:
+            yield from iter_validate_in_parallel(
+                dataframe=dataframe,
+                suite=suite,
+                max_workers=max_workers
+            )
+            return
+
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            expectation_suite=suite,
+            data_context=self.context,
+            batches=[Batch(data=dataframe)]
+        )
+        # The null mask and the non-null values of a column are shared by
+        # the metrics of all expectations of the column and released once the
+        # column has been validated.
+        column_cache: ColumnCache = get_column_cache(validator.execution_engine)
+        for group in _group_expectations_by_column(suite):
+            column: Optional[str] = group[0].kwargs.get("column")
+            if report is None:
+                suite_result = validator.validate(
+                    expectation_suite=ExpectationSuite(
+                        expectation_suite_name=suite.expectation_suite_name,
+                        expectations=group,
+                        meta=suite.meta
+                    )
+                )
+                column_cache.release(column)
+                yield suite_result
+                continue
+
+            results: List[ExpectationValidationResult] = []
+            for configuration in group:
+                with measure(report, "validation", len(dataframe),
+                             column_name=configuration.kwargs.get("column"),
+                             expectation_type=configuration.expectation_type):
+                    results.extend(validator.validate(
+                        expectation_suite=ExpectationSuite(
+                            expectation_suite_name=suite.expectation_suite_name,
+                            expectations=[configuration],
+                            meta=suite.meta
+                        )
+                    ).results)
+            column_cache.release(column)
+            yield _build_suite_validation_result(results, suite)
+
+    def get_supported_data_smell_types(self) -> Set[DataSmellType]:
+        return self._registry.get_registered_data_smells()
+
+
+class NativeDetector(ConfigurableDetector):
+    """
+    A detector which generates the same expectations as the
+    :class:`.GreatExpectationsDetector` but evaluates them directly on the
+    columns of the dataset (see
+    :func:`~datasmelldetection.detectors.great_expectations.native.validate_column_natively`).
+
+    No metric dependency graph is built and resolved. This avoids the fixed
+    overhead of the Great Expectations validator per expectation, which
+    dominates the detection time of small and medium-sized datasets.
+    Expectations which depend on aggregate metrics (see
+    :meth:`.DataSmell.get_aggregate_metrics`) are still validated by the
+    validator. The detection results match the results of the
+    :class:`.GreatExpectationsDetector`.
+    """
+
+    def __init__(
+            self,
+            dataset: DatasetWrapper,
+            profiler: DatasetProfiler,
+            registry: DataSmellRegistry,
+            converter: DetectionResultConverter,
+            configuration: Optional[Configuration],
+            native_registry: NativeConditionRegistry = default_native_condition_registry):
+        super(NativeDetector, self).__init__(configuration)
+        self.dataset = dataset
+        self.profiler = profiler
+        self.registry = registry
+        self.converter = converter
+        self.native_registry = native_registry
+
+    @property
+    def dataset(self) -> DatasetWrapper:
+        """The dataset to use."""
+        return self._dataset
+
+    @dataset.setter
+    def dataset(self, new_dataset: DatasetWrapper):
+        # TODO: Validate argument
+        self._dataset = new_dataset
+
+    @property
+    def profiler(self) -> DatasetProfiler:
+        """The profiler to use."""
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, new_profiler: DatasetProfiler):
+        # TODO: Validate argument
+        self._profiler = new_profiler
 
-        if self.configuration is not None:
-            # Use the data_smell_configuration key if it was provided by the
-            # user.
-            if isinstance(self.configuration, DataSmellAwareConfiguration):
-                configuration_: DataSmellAwareConfiguration = self.configuration
-                profiler_configuration["data_smell_configuration"] = \
-                    configuration_.data_smell_configuration
+    @property
+    def registry(self) -> DataSmellRegistry:
+        """The data smell registry to use."""
+        return self._registry
 
-            # Use the column names information (if provided)
-            column_names: Optional[Set[str]] = self.configuration.column_names
-            profiler_configuration["column_names"] = column_names
+    @registry.setter
+    def registry(self, new_registry: DataSmellRegistry):
+        # TODO: Validate argument
+        self._registry = new_registry
 
+    @property
+    def converter(self) -> DetectionResultConverter:
+        """
+        The converter object used which converts an
+        ExpectationSuiteValidationResult object to a list of detection result
+        objects.
+        """
+        return self._converter
+
+    @converter.setter
+    def converter(self, new_converter: DetectionResultConverter):
+        # TODO: Validate argument
+        self._converter = new_converter
+
+    @property
+    def native_registry(self) -> NativeConditionRegistry:
+        """The registry which stores the native conditions of map metrics."""
+        return self._native_registry
+
+    @native_registry.setter
+    def native_registry(self, new_native_registry: NativeConditionRegistry):
+        # TODO: Validate argument
+        self._native_registry = new_native_registry
+
+    def detect(self) -> Iterable[ExtendedDetectionResult]:
+        return list(self.iter_detect())
+
+    def iter_detect(self) -> Iterator[ExtendedDetectionResult]:
         suite, _ = self.profiler.profile(
             data_asset=self.dataset.get_great_expectations_dataset(),
-            profiler_configuration=profiler_configuration
-        )
-
-        # Import dataset
-        validator = self.context.get_validator(
-            batch_request=self._dataset.get_batch_request(),
-            expectation_suite=suite
+            profiler_configuration=_create_profiler_configuration(
+                self.registry, self.configuration
+            )
         )
-        validation_result: ExpectationSuiteValidationResult = validator.validate()
+        dataframe = pd.DataFrame(self.dataset.get_great_expectations_dataset())
 
         self.converter.meta = {
             "column_types": suite.meta["columns"]
         }
-        detected_smells = self.converter.convert(validation_result)
-
-        return detected_smells
+        for group in _group_expectations_by_column(suite):
+            results = validate_column_natively(
+                column=dataframe[group[0].kwargs["column"]],
+                configurations=group,
+                runtime_configuration=_RUNTIME_CONFIGURATION,
+                registry=self.native_registry
+            )
+            yield from self.converter.convert(_build_suite_validation_result(results, suite))
 
     def get_supported_data_smell_types(self) -> Set[DataSmellType]:
         return self._registry.get_registered_data_smells()
@@ -150,10 +510,11 @@ class DetectorBuilder:
     def __init__(
             self,
             context: DataContext,
-            dataset: DatasetWrapper):
+            dataset: Union[DatasetWrapper, ChunkedCsvDataset]):
         # Great Expectations context
         self._context = context
-        # Dataset which should be checked for data smells
+        # Dataset which should be checked for data smells. A
+        # ChunkedCsvDataset is read in chunks.
         self._dataset = dataset
         # Data smell registry to use
         self._registry: Optional[DataSmellRegistry] = None
@@ -166,12 +527,14 @@ class DetectorBuilder:
         self._converter: Optional[DetectionResultConverter] = None
         # The configuration to use.
         self._configuration: Optional[Configuration] = None
+        # The cache which stores validation results across detection runs.
+        self._result_cache: Optional[ResultCache] = None
 
     def set_context(self, context: DataContext):
         self._context = context
         return self
 
-    def set_dataset(self, dataset: DatasetWrapper):
+    def set_dataset(self, dataset: Union[DatasetWrapper, ChunkedCsvDataset]):
         self._dataset = dataset
         return self
 
@@ -191,7 +554,13 @@ class DetectorBuilder:
         self._configuration = configuration
         return self
 
-    def build(self) -> GreatExpectationsDetector:
+    def set_result_cache(self, result_cache: ResultCache):
+        self._result_cache = result_cache
+        return self
+
+    # Create the registry, the profiler and the converter to use.
+    def _create_components(self) \
+            -> Tuple[DataSmellRegistry, DatasetProfiler, DetectionResultConverter]:
         # Ensure a non-null data smell registry is present
         registry: Optional[DataSmellRegistry] = self._registry
         if registry is None:
@@ -209,8 +578,57 @@ class DetectorBuilder:
         if converter is None:
             converter = StandardResultConverter(registry=registry)
 
+        return registry, profiler, converter
+
+    def build(self) -> GreatExpectationsDetector:
+        """
+        Build a :class:`.GreatExpectationsDetector` or a
+        :class:`~datasmelldetection.detectors.great_expectations.chunked.ChunkedGreatExpectationsDetector`
+        if the dataset is a :class:`.ChunkedCsvDataset`.
+
+        :return: The detector.
+        :raises ValueError: If a result cache is set for a
+            :class:`.ChunkedCsvDataset` (which is not supported by the
+            chunked detector).
+        """
+        registry, profiler, converter = self._create_components()
+        if isinstance(self._dataset, ChunkedCsvDataset):
+            if self._result_cache is not None:
+                raise ValueError("The result cache is not supported for a ChunkedCsvDataset")
+            # NOTE: Imported here to avoid a circular import
+            from .chunked import ChunkedGreatExpectationsDetector
+            return ChunkedGreatExpectationsDetector(
+                context=self._context,
+                dataset=self._dataset,
+                registry=registry,
+                profiler=profiler,
+                converter=converter,
+                configuration=self._configuration
+            )
+
         return GreatExpectationsDetector(
             context=self._context,
+            dataset=self._dataset,
+            registry=registry,
+            profiler=profiler,
+            converter=converter,
+            configuration=self._configuration,
+            result_cache=self._result_cache
+        )
+
+    def build_native(self) -> NativeDetector:
+        """
+        Build a :class:`.NativeDetector` which evaluates the expectations
+        without the Great Expectations validator. The context and the result
+        cache are not used by the native detector.
+
+        :return: The native detector.
+        """
+        if not isinstance(self._dataset, DatasetWrapper):
+            raise ValueError("The native detector requires a DatasetWrapper")
+
+        registry, profiler, converter = self._create_components()
+        return NativeDetector(
             dataset=self._dataset,
             registry=registry,
             profiler=profiler,
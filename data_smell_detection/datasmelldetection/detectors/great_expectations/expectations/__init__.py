@@ -1,34 +1,32 @@
-from .expect_column_values_to_not_contain_missing_value_smell import \
-    ExpectColumnValuesToNotContainMissingValueSmell
-from .expect_column_values_to_not_contain_suspect_sign_smell import \
-    ExpectColumnValuesToNotContainSuspectSignSmell
-from .expect_column_values_to_not_contain_integer_as_string_smell import \
-    ExpectColumnValuesToNotContainIntegerAsStringSmell
-from .expect_column_values_to_not_contain_floating_point_number_as_string_smell import \
-    ExpectColumnValuesToNotContainFloatingPointNumberAsStringSmell
-from .expect_column_values_to_not_contain_extreme_value_smell import \
-    ExpectColumnValuesToNotContainExtremeValueSmell
-from .expect_column_values_to_not_contain_long_data_value_smell import \
-    ExpectColumnValuesToNotContainLongDataValueSmell
-from .expect_column_values_to_not_contain_integer_as_floating_point_number_smell import \
-    ExpectColumnValuesToNotContainIntegerAsFloatingPointNumberSmell
-from .expect_column_values_to_not_contain_casing_smell import \
-    ExpectColumnValuesToNotContainCasingSmell
-from .expect_column_values_to_not_contain_duplicated_value_smell import \
-    ExpectColumnValuesToNotContainDuplicatedValueSmell
-from .expect_column_values_to_not_contain_date_as_string_smell import \
-    ExpectColumnValuesToNotContainDateAsStringSmell
-from .expect_column_values_to_not_contain_suspect_date_value_smell import \
-    ExpectColumnValuesToNotContainSuspectDateValueSmell
-from .expect_column_values_to_not_contain_intermingled_data_type_smell import \
-    ExpectColumnValuesToNotContainIntermingledDataTypes
-from .expect_column_values_to_not_contain_dummy_value_smell import \
-    ExpectColumnValuesToNotContainDummyValueSmell
-from .expect_column_values_to_not_contain_spacing_smell import \
-    ExpectColumnValuesToNotContainSpacingSmell
-from .expect_column_values_to_not_contain_spacing_inconsistency_smell import \
-    ExpectColumnValuesToNotContainSpacingInconsistencySmell
-from .expect_column_values_to_not_contain_time_as_string_smell import \
-    ExpectColumnValuesToNotContainTimeAsStringSmell
-from .expect_column_values_to_not_contain_precision_inconsistency_smell import \
-    ExpectColumnValuesToNotContainPrecisionInconsistencies
\ No newline at end of file
+"""
+Expectation classes for data smell detection.
+
+Importing this package does not import the modules of the expectation
+classes. A module is imported when its class is accessed (e.g. by
+``from datasmelldetection.detectors.great_expectations.expectations import
+ExpectColumnValuesToNotContainCasingSmell``) or when the expectation is loaded
+by
+:meth:`~datasmelldetection.detectors.great_expectations.datasmell.DataSmellRegistry.load_expectations`
+(see :mod:`~datasmelldetection.detectors.great_expectations.manifest`).
+"""
+import importlib
+from typing import Any, Dict, List
+
+from datasmelldetection.detectors.great_expectations.manifest import EXPECTATION_MANIFEST
+
+# Store the name of the module which defines each expectation class
+_CLASS_NAME_TO_MODULE: Dict[str, str] = {
+    entry.class_name: entry.module for entry in EXPECTATION_MANIFEST
+}
+
+__all__ = list(_CLASS_NAME_TO_MODULE)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _CLASS_NAME_TO_MODULE:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_CLASS_NAME_TO_MODULE[name]), name)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,12 +1,11 @@
-from typing import List, Dict, Any
+from typing import Dict, Any, List, Optional
 
+import numpy as np
+import pandas as pd
 from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation import ColumnMapExpectation
-from great_expectations.expectations.metrics import (
-    ColumnMapMetricProvider,
-    column_condition_partial,
-)
 from great_expectations.profile.base import ProfilerDataType
+import math
 import re
 
 from datasmelldetection.core.datasmells import DataSmellType
@@ -14,41 +13,115 @@ from datasmelldetection.detectors.great_expectations.datasmell import (
     DataSmell,
     DataSmellMetadata
 )
+from datasmelldetection.detectors.great_expectations.scanner import (
+    ColumnScan,
+    ScannedColumnMapMetricProvider,
+    default_scan_feature_registry,
+    scanned_condition_partial,
+)
 
 
-class ColumnValuesDontContainCasingSmell(ColumnMapMetricProvider):
-    condition_metric_name = "column_values.custom.not_contains_casing_smell"
-    condition_value_keys = ("same_case_wordcount_threshold", )
+CASING_SCAN_FEATURE: str = "casing_smell_wordcount_limit"
 
-    @classmethod
-    def _contains_casing_smell(cls, element: str, same_case_wordcount_threshold: int) -> bool:
-        same_case_wordcount_threshold = int(same_case_wordcount_threshold)
-        # Extract substrings of the input string by splitting on spaces
-        word_candidates: List[str] = re.split(r"\s+", element)
+# A word is the sequence of alphabetical characters at the start of a
+# whitespace separated substring (e.g. only "word" is extracted from "word.").
+_WORD_START_REGEX = r"(?<!\S)"
+_WORD_REGEX = _WORD_START_REGEX + r"[a-zA-Z]+"
+_WORD_PATTERN = re.compile(_WORD_REGEX)
+
+# Mixed case patterns
+# e.g. "AbC" or "AbcDef" (uppercase characters followed by lowercase and
+# uppercase characters) and "aBC" or "abCdefGHI" (lowercase characters
+# followed by uppercase characters). Both patterns are matched exactly by the
+# words which contain a lowercase character followed by an uppercase
+# character.
+_MIXED_CASE_WORD_REGEX = _WORD_START_REGEX + r"[a-zA-Z]*[a-z][A-Z]"
+_MIXED_CASE_WORD_PATTERN = re.compile(_MIXED_CASE_WORD_REGEX)
+
+# Words which contain at least one uppercase (lowercase) character
+_UPPERCASE_WORD_REGEX = _WORD_START_REGEX + r"[a-zA-Z]*[A-Z]"
+_UPPERCASE_WORD_PATTERN = re.compile(_UPPERCASE_WORD_REGEX)
+_LOWERCASE_WORD_REGEX = _WORD_START_REGEX + r"[a-zA-Z]*[a-z]"
+_LOWERCASE_WORD_PATTERN = re.compile(_LOWERCASE_WORD_REGEX)
+
+
+# The number of values which are concatenated by the vectorized evaluation.
+_VECTORIZED_BATCH_SIZE: int = 10000
+
+# Whether an ASCII character is matched by \s
+_IS_ASCII_WHITESPACE: np.ndarray = np.array(
+    [re.match(r"\s", chr(x)) is not None for x in range(128)]
+)
+
+
+# Compute the casing smell wordcount limits of ASCII strings. None is returned
+# if a string contains non-ASCII characters.
+def _get_ascii_casing_smell_wordcount_limits(strings: List[str]) -> Optional[np.ndarray]:
+    # Separate the strings by whitespace such that words end at the end of
+    # each string.
+    text = "\n".join(strings) + "\n"
+    if not text.isascii():
+        return None
+    characters = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    # The position of the first character of each string (each string ends
+    # with a separator and is therefore not empty).
+    offsets = np.zeros(len(strings), dtype=np.intp)
+    np.cumsum(np.fromiter(map(len, strings), dtype=np.intp, count=len(strings))[:-1] + 1,
+              out=offsets[1:])
+
+    is_uppercase = (characters >= ord("A")) & (characters <= ord("Z"))
+    is_lowercase = (characters >= ord("a")) & (characters <= ord("z"))
+    is_letter = is_uppercase | is_lowercase
+    follows_whitespace = np.concatenate(([True], _IS_ASCII_WHITESPACE[characters[:-1]]))
+    follows_letter = np.concatenate(([False], is_letter[:-1]))
+
+    # Words are the runs of letters which start after whitespace.
+    run_ids = np.cumsum(is_letter & ~follows_letter, dtype=np.int32)
+    is_word_start = is_letter & follows_whitespace
+    is_word_run = np.zeros(run_ids[-1] + 1, dtype=bool)
+    is_word_run[run_ids[is_word_start]] = True
+    is_word_character = is_letter & is_word_run[run_ids]
+
+    def any_per_string(mask: np.ndarray) -> np.ndarray:
+        return np.logical_or.reduceat(mask, offsets)
 
-        words: List[str] = list()
-        for word in word_candidates:
-            # Find consecutive alphabetical characters. Require matching to
-            # start at the begin of a string to consider cases like
-            # "word." where only "word" should be extracted.
-            substrings = list(re.findall(r"^[a-zA-Z]+", word))
-            words = words + substrings
+    # A lowercase character followed by an uppercase character of the same
+    # word
+    is_mixed_case = any_per_string(np.concatenate((
+        is_word_character[:-1] & is_lowercase[:-1] & is_uppercase[1:], [False]
+    )))
+    is_same_case = ~(
+        any_per_string(is_word_character & is_uppercase) &
+        any_per_string(is_word_character & is_lowercase)
+    )
+    word_counts = np.add.reduceat(is_word_start, offsets, dtype=np.int64).astype(float)
+    return np.where(is_mixed_case, math.inf, np.where(is_same_case, word_counts, -math.inf))
 
-        word_count: int = len(words)
 
-        # Case 1: Function for testing if all words are in lowercase
-        # (e.g. "abc def ghi")
-        def is_all_lower_case(word: str) -> bool:
-            return word.lower() == word
+class ColumnValuesDontContainCasingSmell(ScannedColumnMapMetricProvider):
+    condition_metric_name = "column_values.custom.not_contains_casing_smell"
+    condition_value_keys = ("same_case_wordcount_threshold", )
+    scan_features = (CASING_SCAN_FEATURE, )
 
-        # Case 1: Function for testing if all words are in uppercase
-        # (e.g. "ABC DEF GHI")
-        def is_all_upper_case(word: str) -> bool:
-            return word.upper() == word
+    @classmethod
+    def _get_casing_smell_wordcount_limit(cls, element: str) -> float:
+        """
+        Get the largest `same_case_wordcount_threshold` for which the element
+        contains a casing smell.
 
-        is_all_words_lowercase: bool = all(map(is_all_lower_case, words))
-        is_all_words_uppercase: bool = all(map(is_all_upper_case, words))
+        The limit is the number of words if all words are of the same case,
+        infinity if a word is in mixed case (the smell is present for all
+        thresholds) and minus infinity if no casing smell can be present.
+        """
+        # Case 2: Some words are in mixed case (e.g. "AbC dEf gHI")
+        # NOTE: Case 2 is checked first since it does not depend on the
+        # number of words.
+        if _MIXED_CASE_WORD_PATTERN.search(element) is not None:
+            return math.inf
 
+        # Case 1: Test if all words are in lowercase (e.g. "abc def ghi")
+        # or if all words are in uppercase (e.g. "ABC DEF GHI")
+        #
         # At least `same_case_wordcount_threshold` lowercase or uppercase words
         # have to be present to flag a casing smell. This is required since
         # strings like "abc" should not be flagged.
@@ -56,28 +129,45 @@ class ColumnValuesDontContainCasingSmell(ColumnMapMetricProvider):
         # NOTE: Only consider a Casing Smell to be present if all words are
         # lower case or all are upper case. This is done to avoid that
         # inputs like "A test string" are not flagged.
-        if word_count >= same_case_wordcount_threshold and \
-                (is_all_words_lowercase or is_all_words_uppercase):
-            return True
+        if _UPPERCASE_WORD_PATTERN.search(element) is None or \
+                _LOWERCASE_WORD_PATTERN.search(element) is None:
+            return len(_WORD_PATTERN.findall(element))
+        return -math.inf
 
-        # Case 2: Some words are in mixed case (e.g. "AbC dEf gHI")
-        def is_mixed_case(x: str) -> bool:
-            # e.g. "AbC" or "AbcDef"
-            regex_case1 = r"[A-Z]+[a-z]+[A-Z]+.*"
-            # e.g. "aBC" or "abCdefGHI"
-            regex_case2 = r"[a-z]+[A-Z]+.*"
-            regex = f"^({regex_case1}|{regex_case2})$"
-            return bool(re.match(regex, x))
-        return any(map(is_mixed_case, words))
-
-    @column_condition_partial(engine=PandasExecutionEngine)
-    def _pandas(cls, column, _metrics, same_case_wordcount_threshold: int, **kwargs):
-        # Negate the result of _contains_casing_smell since Great Expectations
-        # assumes that False is returned if a value is faulty
-        # (a data smell is present).
-        def not_contains_casing_smell(element: str) -> bool:
-            return not cls._contains_casing_smell(element, same_case_wordcount_threshold)
-        return column.map(not_contains_casing_smell)
+    @classmethod
+    def _get_casing_smell_wordcount_limits(cls, values: pd.Series) -> Optional[np.ndarray]:
+        """
+        Vectorized equivalent of :meth:`_get_casing_smell_wordcount_limit`.
+
+        The values are concatenated and the characters are classified using
+        NumPy instead of matching regular expressions per value. None is
+        returned if not all values are ASCII strings.
+        """
+        if pd.api.types.infer_dtype(values, skipna=False) != "string":
+            return None
+
+        strings: List[str] = values.tolist()
+        limits: List[np.ndarray] = []
+        for start in range(0, len(strings), _VECTORIZED_BATCH_SIZE):
+            batch_limits = _get_ascii_casing_smell_wordcount_limits(
+                strings[start:start + _VECTORIZED_BATCH_SIZE]
+            )
+            if batch_limits is None:
+                return None
+            limits.append(batch_limits)
+        return np.concatenate(limits) if len(limits) > 0 else np.array([], dtype=float)
+
+    @classmethod
+    def _contains_casing_smell(cls, element: str, same_case_wordcount_threshold: int) -> bool:
+        same_case_wordcount_threshold = int(same_case_wordcount_threshold)
+        return same_case_wordcount_threshold <= cls._get_casing_smell_wordcount_limit(element)
+
+    @scanned_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, scan: ColumnScan, same_case_wordcount_threshold: int, **kwargs):
+        # Negate the result since Great Expectations assumes that False is
+        # returned if a value is faulty (a data smell is present).
+        limits = scan[CASING_SCAN_FEATURE].astype(float)
+        return ~(int(same_case_wordcount_threshold) <= limits)
 
 
 class ExpectColumnValuesToNotContainCasingSmell(ColumnMapExpectation, DataSmell):
@@ -116,6 +206,8 @@ class ExpectColumnValuesToNotContainCasingSmell(ColumnMapExpectation, DataSmell)
         profiler_data_types={ProfilerDataType.STRING}
     )
 
+    row_wise = True
+
     # NOTE: The examples are used to perform tests
     examples = [
         {
@@ -359,6 +451,7 @@ class ExpectColumnValuesToNotContainCasingSmell(ColumnMapExpectation, DataSmell)
     }
 
     map_metric = "column_values.custom.not_contains_casing_smell"
+    scan_features = (CASING_SCAN_FEATURE, )
 
     success_keys = ("mostly", "same_case_wordcount_threshold")
 
@@ -368,6 +461,12 @@ class ExpectColumnValuesToNotContainCasingSmell(ColumnMapExpectation, DataSmell)
     }
 
 
+default_scan_feature_registry.register(
+    CASING_SCAN_FEATURE,
+    ColumnValuesDontContainCasingSmell._get_casing_smell_wordcount_limit,
+    vectorized_extractor=ColumnValuesDontContainCasingSmell._get_casing_smell_wordcount_limits
+)
+
 expectation = ExpectColumnValuesToNotContainCasingSmell()
 expectation.register_data_smell()
 del expectation
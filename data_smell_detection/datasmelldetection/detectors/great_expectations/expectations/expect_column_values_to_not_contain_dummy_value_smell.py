@@ -3,6 +3,7 @@ from typing import Optional
 
 from datasmelldetection.core import DataSmellType
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.scanner import regex_scan_feature
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.expectations.expectation import ColumnMapExpectation
@@ -27,6 +28,8 @@ class ExpectColumnValuesToNotContainDummyValueSmell(ColumnMapExpectation, DataSm
         profiler_data_types={ProfilerDataType.STRING, ProfilerDataType.INT, ProfilerDataType.FLOAT, ProfilerDataType.NUMERIC}
     )
 
+    row_wise = True
+
     # NOTE: The examples are used to perform tests
     examples = [
         {
@@ -114,7 +117,7 @@ class ExpectColumnValuesToNotContainDummyValueSmell(ColumnMapExpectation, DataSm
         "package": "experimental_expectations",
     }
 
-    map_metric = "column_values.not_match_regex"
+    map_metric = "column_values.custom.not_match_regex"
     success_keys = (
         "mostly",
         "regex"
@@ -126,6 +129,9 @@ class ExpectColumnValuesToNotContainDummyValueSmell(ColumnMapExpectation, DataSm
         "mostly": 0.1
     }
 
+    # NOTE: The regex is evaluated by the fused column scan
+    scan_features = (regex_scan_feature(str(default_kwarg_values["regex"])),)
+
     def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
         super().validate_configuration(configuration)
         assert configuration is not None
@@ -1,13 +1,57 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.expectations.core import ExpectColumnValuesToBeUnique
+from great_expectations.expectations.metrics import ColumnMetricProvider
+from great_expectations.expectations.registry import get_metric_kwargs
 from great_expectations.profile.base import ProfilerDataType
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.columncache import (
+    CachedColumnMapMetricProvider,
+    cached_column_aggregate_value,
+    cached_condition_partial
+)
 from datasmelldetection.detectors.great_expectations.datasmell import (
     DataSmell,
     DataSmellMetadata
 )
+from datasmelldetection.detectors.great_expectations.sketches import (
+    DEFAULT_FREQUENT_VALUES_CAPACITY,
+    DuplicatesSketch
+)
+
+
+DUPLICATES_SKETCH_STATE_METRIC_NAME: str = "column.custom.duplicates_sketch.state"
+
+
+class ColumnDuplicatesSketchState(ColumnMetricProvider):
+    """
+    Compute the
+    :class:`~datasmelldetection.detectors.great_expectations.sketches.DuplicatesSketch`
+    of the non-null values of a column.
+    """
+
+    metric_name = DUPLICATES_SKETCH_STATE_METRIC_NAME
+
+    @cached_column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        return DuplicatesSketch.from_values(column.to_numpy())
+
+
+class ColumnValuesUnique(CachedColumnMapMetricProvider):
+    """
+    Equivalent of the column_values.unique metric of Great Expectations which
+    is evaluated on the cached non-null values of a column.
+    """
+
+    condition_metric_name = "column_values.custom.unique"
+
+    @cached_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        return ~column.duplicated(keep=False)
 
 
 class ExpectColumnValuesToNotContainDuplicatedValueSmell(ExpectColumnValuesToBeUnique, DataSmell):
@@ -15,7 +59,35 @@ class ExpectColumnValuesToNotContainDuplicatedValueSmell(ExpectColumnValuesToBeU
     Detect if a duplicate value smell is present.
 
     The ExpectColumnValuesToBeUnique expectation from Great Expectations
-    is used.
+    is used. The uniqueness of the values is computed by an equivalent map
+    metric which shares the non-null values of the column with the other
+    data smells.
+
+    In approximate mode, the column is summarized by a mergeable sketch whose
+    memory usage does not depend on the number of values. The number of
+    distinct values is estimated by a HyperLogLog sketch, the number of values
+    which occur more than once is estimated from a sample of the distinct
+    values and the most duplicated values are tracked by a count-min sketch
+    and a heavy hitters summary. As in the exact mode, the unexpected count is
+    the (estimated) number of values which occur more than once including
+    all of their occurrences and the partial unexpected list contains the
+    most duplicated values. The estimated duplicate ratio and the most duplicated
+    values with their estimated counts are reported in the details of the
+    result. The sketches of chunks of a column are merged. Therefore, the
+    expectation can be evaluated on chunked datasets in this mode.
+
+    Parameters:
+        approximate: \
+            Whether the memory-bounded approximate mode is used. Set to False
+            by default.
+        top_k: \
+            The maximum number of most duplicated values which are reported
+            in approximate mode. Set to 10 by default.
+
+    Keyword Args:
+        mostly:
+            See the documentation regarding the `mostly` concept regarding
+            expectations in Great Expectations.
     """
 
     data_smell_metadata = DataSmellMetadata(
@@ -27,10 +99,102 @@ class ExpectColumnValuesToNotContainDuplicatedValueSmell(ExpectColumnValuesToBeU
     # NOTE: library_metadata not set since the ExpectColumnValuesToBeUnique
     # expectation sets it.
 
+    map_metric = "column_values.custom.unique"
+
+    aggregate_metrics = (DUPLICATES_SKETCH_STATE_METRIC_NAME,)
+
+    success_keys = ("mostly", "approximate", "top_k")
+
     default_kwarg_values: Dict[str, Any] = {
+        "approximate": False,
+        "top_k": 10,
         "mostly": 0.95
     }
 
+    @classmethod
+    def get_aggregate_metrics(cls, configuration: ExpectationConfiguration) -> Tuple[str, ...]:
+        # NOTE: The exact duplicates cannot be merged across chunks.
+        if configuration.kwargs.get("approximate", cls.default_kwarg_values["approximate"]):
+            return cls.aggregate_metrics
+        return ()
+
+    def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
+        super().validate_configuration(configuration)
+        assert configuration is not None
+        if "approximate" in configuration.kwargs:
+            assert isinstance(configuration.kwargs["approximate"], bool), \
+                "approximate must be a boolean."
+        if "top_k" in configuration.kwargs:
+            top_k = configuration.kwargs["top_k"]
+            assert isinstance(top_k, int) and 0 < top_k <= DEFAULT_FREQUENT_VALUES_CAPACITY, \
+                f"top_k must be an integer in the interval [1, {DEFAULT_FREQUENT_VALUES_CAPACITY}]."
+
+    def get_validation_dependencies(
+            self,
+            configuration: Optional[ExpectationConfiguration] = None,
+            execution_engine: Optional[ExecutionEngine] = None,
+            runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super().get_validation_dependencies(
+            configuration, execution_engine, runtime_configuration
+        )
+        # In approximate mode, the sketch replaces the metrics of the map
+        # metric (which require the whole column).
+        if self.get_success_kwargs(configuration)["approximate"]:
+            metric_dependencies: Dict[str, MetricConfiguration] = dependencies["metrics"]
+            for metric_name in list(metric_dependencies.keys()):
+                if metric_name.startswith(self.map_metric + "."):
+                    del metric_dependencies[metric_name]
+            metric_dependencies[DUPLICATES_SKETCH_STATE_METRIC_NAME] = MetricConfiguration(
+                metric_name=DUPLICATES_SKETCH_STATE_METRIC_NAME,
+                metric_domain_kwargs=get_metric_kwargs(
+                    DUPLICATES_SKETCH_STATE_METRIC_NAME,
+                    configuration=configuration,
+                    runtime_configuration=runtime_configuration
+                )["metric_domain_kwargs"],
+                metric_value_kwargs=dict()
+            )
+        return dependencies
+
+    def _validate(
+            self,
+            configuration: ExpectationConfiguration,
+            metrics: Dict,
+            runtime_configuration: Optional[dict] = None,
+            execution_engine: Optional[ExecutionEngine] = None,
+    ):
+        # NOTE: The sketch is missing if the metrics are not computed from
+        # the validation dependencies (e.g. by validate_column_natively). The
+        # exact metrics are used in this case.
+        sketch: Optional[DuplicatesSketch] = metrics.get(DUPLICATES_SKETCH_STATE_METRIC_NAME)
+        if sketch is None:
+            return super()._validate(
+                configuration, metrics, runtime_configuration, execution_engine
+            )
+
+        top_duplicated_values = sketch.get_top_duplicated_values(
+            self.get_success_kwargs(configuration)["top_k"]
+        )
+        approximate_metrics = dict(metrics)
+        approximate_metrics[self.map_metric + ".unexpected_count"] = \
+            sketch.estimate_duplicate_count()
+        approximate_metrics[self.map_metric + ".unexpected_values"] = \
+            [value for value, _ in top_duplicated_values]
+        result = super()._validate(
+            configuration, approximate_metrics, runtime_configuration, execution_engine
+        )
+        if "result" in result:
+            result["result"]["details"] = {
+                "estimated_distinct_count": sketch.estimate_distinct_count(),
+                "distinct_count_relative_error": sketch.distinct_values.relative_error,
+                "estimated_duplicate_ratio": sketch.estimate_duplicate_ratio(),
+                "top_duplicated_values": [
+                    {"value": value, "count": count} for value, count in top_duplicated_values
+                ]
+            }
+        return result
+
+
 # Perform registration of data smell at DataSmellRegistry
 expectation = ExpectColumnValuesToNotContainDuplicatedValueSmell()
 expectation.register_data_smell()
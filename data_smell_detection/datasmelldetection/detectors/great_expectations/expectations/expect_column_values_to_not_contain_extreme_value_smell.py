@@ -1,22 +1,136 @@
-from typing import Optional
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
 
 from datasmelldetection.core import DataSmellType
+from datasmelldetection.detectors.great_expectations.columncache import (
+    CachedColumnMapMetricProvider,
+    cached_condition_partial
+)
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.numeric import (
+    MOMENTS_STATE_METRIC_NAME,
+    NUMERIC_STATISTICS_METRIC_NAME,
+    QUANTILE_SKETCH_STATE_METRIC_NAME,
+    ColumnNumericStatistics,
+    NumericStatistics,
+    RunningMoments,
+    get_robust_z_scores
+)
+from datasmelldetection.detectors.great_expectations.sketches import (
+    DEFAULT_SKETCH_CAPACITY,
+    QuantileSketch
+)
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.profile.base import ProfilerDataType
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 from great_expectations.expectations.expectation import ColumnMapExpectation
 
 
+# Return True for the values whose (robust) z-score is below the threshold.
+# The z-scores are computed in a single buffer. The state is either the
+# RunningMoments or the QuantileSketch (robust mode) of the whole column
+# while the statistics may belong to a chunk of the column.
+def _is_under_threshold(statistics: NumericStatistics, state: Union[RunningMoments, QuantileSketch],
+                        threshold: float, double_sided: bool, robust: bool) -> np.ndarray:
+    if robust:
+        assert isinstance(state, QuantileSketch)
+        z_scores = get_robust_z_scores(statistics.values, state)
+    else:
+        assert isinstance(state, RunningMoments)
+        z_scores = state.get_z_scores(statistics.values)
+    if double_sided:
+        return np.abs(z_scores, out=z_scores) < abs(threshold)
+    return z_scores < threshold
+
+
+class ColumnValuesZScoreUnderThreshold(CachedColumnMapMetricProvider):
+    """
+    Check whether the z-scores of the values of a column are below a
+    threshold. Unless robust is set, the result is equivalent to the
+    column_values.z_score.under_threshold metric of Great Expectations. In
+    robust mode, the median and the median absolute deviation replace the mean
+    and the standard deviation (see
+    :func:`~datasmelldetection.detectors.great_expectations.numeric.get_robust_z_scores`).
+
+    The z-scores are computed from the shared numeric statistics of the
+    column and a mergeable state (the moments or a quantile sketch) of the
+    column. Therefore, the metric can be evaluated on chunks of a column.
+    """
+
+    condition_metric_name = "column_values.custom.z_score.under_threshold"
+    condition_value_keys = ("threshold", "double_sided", "robust")
+    default_kwarg_values = {"robust": False}
+
+    @cached_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, column, _metrics, threshold, double_sided, robust=False, **kwargs):
+        state_metric_name = QUANTILE_SKETCH_STATE_METRIC_NAME if robust \
+            else MOMENTS_STATE_METRIC_NAME
+        return pd.Series(
+            _is_under_threshold(
+                _metrics[NUMERIC_STATISTICS_METRIC_NAME], _metrics[state_metric_name],
+                threshold, double_sided, robust
+            ),
+            index=column.index
+        )
+
+    @classmethod
+    def _get_evaluation_dependencies(
+            cls,
+            metric: MetricConfiguration,
+            configuration: Optional[ExpectationConfiguration] = None,
+            execution_engine: Optional[ExecutionEngine] = None,
+            runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        # NOTE: The numeric statistics provide the values of the domain
+        # (e.g. a chunk) while the state summarizes the whole column (the
+        # states of chunks are merged).
+        if metric.metric_name == cls.condition_metric_name + ".condition":
+            column_domain_kwargs = {
+                k: v for k, v in metric.metric_domain_kwargs.items()
+                if k in ColumnNumericStatistics.domain_keys
+            }
+            state_metric_name = QUANTILE_SKETCH_STATE_METRIC_NAME \
+                if metric.metric_value_kwargs.get("robust", False) else MOMENTS_STATE_METRIC_NAME
+            dependencies[NUMERIC_STATISTICS_METRIC_NAME] = MetricConfiguration(
+                metric_name=NUMERIC_STATISTICS_METRIC_NAME,
+                metric_domain_kwargs=column_domain_kwargs,
+                metric_value_kwargs=dict()
+            )
+            dependencies[state_metric_name] = MetricConfiguration(
+                metric_name=state_metric_name,
+                metric_domain_kwargs=column_domain_kwargs,
+                metric_value_kwargs={"capacity": DEFAULT_SKETCH_CAPACITY}
+                if state_metric_name == QUANTILE_SKETCH_STATE_METRIC_NAME else dict()
+            )
+
+        return dependencies
+
+
 class ExpectColumnValuesToNotContainExtremeValueSmell(ColumnMapExpectation, DataSmell):
     """
     Detect the presence of an extreme value smell (outliers).
 
-    This expectation internally uses the "column_values.z_score.under_threshold"
-    metric which is also be used by the
+    This expectation internally uses the
+    "column_values.custom.z_score.under_threshold" metric which is equivalent
+    to the "column_values.z_score.under_threshold" metric used by the
     "expect_column_value_z_scores_to_be_less_than" expectation. By default,
     double-sided checking is performed.
+
+    The mean and the standard deviation (or the quantile sketch in robust
+    mode) of a column can be merged across chunks. Therefore, the expectation
+    can be evaluated on chunked datasets.
     
     
     Parameters:
@@ -24,6 +138,12 @@ class ExpectColumnValuesToNotContainExtremeValueSmell(ColumnMapExpectation, Data
             The threshold to use regarding the z-score. This parameter can be
             configured by users but is set to 3 by default. It is assumed that
             this parameter is a positive number.
+        robust: \
+            Whether robust z-scores are used which are based on the median and
+            the median absolute deviation (approximated by a mergeable quantile
+            sketch) instead of the mean and the standard deviation. Robust
+            z-scores are not distorted by the extreme values themselves. Set to
+            False by default.
 
     Keyword Args:
         mostly:
@@ -36,16 +156,20 @@ class ExpectColumnValuesToNotContainExtremeValueSmell(ColumnMapExpectation, Data
         profiler_data_types={ProfilerDataType.INT, ProfilerDataType.FLOAT, ProfilerDataType.NUMERIC}
     )
 
-    map_metric = "column_values.z_score.under_threshold"
+    aggregate_metrics = (MOMENTS_STATE_METRIC_NAME, QUANTILE_SKETCH_STATE_METRIC_NAME)
+
+    map_metric = "column_values.custom.z_score.under_threshold"
     success_keys = (
         "mostly",
         "threshold",
-        "double_sided"
+        "double_sided",
+        "robust"
     )
 
     default_kwarg_values = {
         "threshold": 3,
         "double_sided": True,
+        "robust": False,
         "catch_exceptions": True,
         "mostly": 0.95
     }
@@ -57,6 +181,8 @@ class ExpectColumnValuesToNotContainExtremeValueSmell(ColumnMapExpectation, Data
         if "threshold" in configuration.kwargs:
             threshold = configuration.kwargs["threshold"]
             assert threshold > 0, "Threshold must be a positive integer."
+        if "robust" in configuration.kwargs:
+            assert isinstance(configuration.kwargs["robust"], bool), "robust must be a boolean."
 
 
 expectation = ExpectColumnValuesToNotContainExtremeValueSmell()
@@ -1,27 +1,30 @@
+import pandas as pd
+
 from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.columncache import (
+    CachedColumnMapMetricProvider,
+    cached_condition_partial
+)
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.numeric import has_fractional_part
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
 )
 from great_expectations.expectations.expectation import (
     ColumnMapExpectation,
 )
-from great_expectations.expectations.metrics import (
-    ColumnMapMetricProvider,
-    column_condition_partial,
-)
 from great_expectations.profile.base import ProfilerDataType
 
 
-class ColumnValuesDontContainIntegerAsFloatingPointNumberSmell(ColumnMapMetricProvider):
+class ColumnValuesDontContainIntegerAsFloatingPointNumberSmell(CachedColumnMapMetricProvider):
     condition_metric_name = "column_values.custom.not_contains_integer_as_floating_point_number_smell"
     condition_value_keys = ("epsilon",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @cached_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, epsilon, **kwargs):
         # Round to nearest integer to estimate the presence of an integer as
         # floating point number smell.
-        return (column - column.round(decimals=0)).abs() > epsilon
+        return pd.Series(has_fractional_part(column, epsilon), index=column.index)
 
 
 class ExpectColumnValuesToNotContainIntegerAsFloatingPointNumberSmell(ColumnMapExpectation, DataSmell):
@@ -51,6 +54,8 @@ class ExpectColumnValuesToNotContainIntegerAsFloatingPointNumberSmell(ColumnMapE
         profiler_data_types={ProfilerDataType.FLOAT}
     )
 
+    row_wise = True
+
     # Testcases
     examples = [
         {
@@ -3,6 +3,10 @@ from typing import Optional
 
 from datasmelldetection.core import DataSmellType
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.value_types import (
+    INTEGER_REGEX,
+    VALUE_TYPE_SCAN_FEATURE
+)
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.expectations.expectation import ColumnMapExpectation
@@ -27,6 +31,8 @@ class ExpectColumnValuesToNotContainIntegerAsStringSmell(ColumnMapExpectation, D
         profiler_data_types={ProfilerDataType.STRING}
     )
 
+    row_wise = True
+
     # NOTE: The examples are used to perform tests
     examples = [
         {
@@ -126,7 +132,7 @@ class ExpectColumnValuesToNotContainIntegerAsStringSmell(ColumnMapExpectation, D
         "package": "experimental_expectations",
     }
 
-    map_metric = "column_values.not_match_regex"
+    map_metric = "column_values.custom.not_match_typed_regex"
     success_keys = (
         "mostly",
         "regex"
@@ -134,10 +140,14 @@ class ExpectColumnValuesToNotContainIntegerAsStringSmell(ColumnMapExpectation, D
 
     default_kwarg_values = {
         "catch_exceptions": True,
-        "regex": r'^(?:\+|-)?\d+$',
+        "regex": INTEGER_REGEX,
         "mostly": 0.1
     }
 
+    # NOTE: The regex is evaluated by the value type classification of the
+    # fused column scan which is shared with other data smells.
+    scan_features = (VALUE_TYPE_SCAN_FEATURE,)
+
     def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
         super().validate_configuration(configuration)
         assert configuration is not None
@@ -1,74 +1,99 @@
 from typing import Optional, Dict, Any
-import re
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation import ColumnMapExpectation
-from great_expectations.expectations.metrics import ColumnMapMetricProvider, column_condition_partial
 from great_expectations.profile.base import ProfilerDataType
-import pandas as pd
+import numpy as np
 
 from datasmelldetection.core.datasmells import DataSmellType
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.scanner import (
+    ColumnScan,
+    ScannedColumnMapMetricProvider,
+    scanned_condition_partial,
+)
+from datasmelldetection.detectors.great_expectations.value_types import (
+    VALUE_TYPE_SCAN_FEATURE,
+    ValueType
+)
 
 
-unique_types = set()
+# Codes of the data types which are distinguished
+_UNKNOWN_TYPE = 0
+_STRING_TYPE = 1
+_NUMERIC_TYPE = 2
+_DATE_TYPE = 3
+_DATETIME_TYPE = 4
 
+# The value types which determine the data type of a string. The first value
+# type a string is of determines its data type.
+_DATA_TYPE_PRIORITIES = [
+    (ValueType.ALPHABETIC, _STRING_TYPE),
+    (ValueType.NUMERIC, _NUMERIC_TYPE),
+    (ValueType.DATE, _DATE_TYPE),
+    (ValueType.DATETIME, _DATETIME_TYPE),
+]
 
-class ColumnValuesDontContainIntermingledDataTypes(ColumnMapMetricProvider):
+
+class ColumnValuesDontContainIntermingledDataTypes(ScannedColumnMapMetricProvider):
     condition_metric_name = "column_values.custom.not_contains_intermingled_data_types"
     condition_value_keys = ()
+    scan_features = (VALUE_TYPE_SCAN_FEATURE,)
 
     @classmethod
-    def _contains_intermingled_types(cls, element: str) -> bool:
+    def _get_data_types(cls, value_types: np.ndarray) -> np.ndarray:
         """
-        Check if a column contains intermingled data types.
+        Get the codes of the data types of the values of a column.
 
         Args:
-            column (pandas.Series): The column to check.
+            value_types (numpy.ndarray): The value type flags of the values
+                (see ValueType).
 
         Returns:
-            bool: True (needed for great_expectations) if intermingled data types are detected,
-              False otherwise.
+            numpy.ndarray: The codes of the data types or 0 if the data type is
+            unknown.
+
+        Raises:
+            TypeError: If a value is neither a string nor an int or a float.
         """
-        string_pattern = re.compile(r'^[a-zA-Z\s]+$')
-        numeric_pattern = re.compile(r'^-?\d+(\.\d+)?$')
-        date_pattern = re.compile(r'^(\d{4}-\d{2}-\d{2})$|^(\d{2}/\d{2}/\d{4})$|^(\d{2}-\d{2}-\d{4})$|^(\d{4}/\d{2}/\d{2})$')
-        datetime_pattern = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})|(\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2})|(\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2})|(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})')
-        if (type(element) == int or type(element) == float):
-            unique_types.add('numeric')
-        elif bool(string_pattern.match(element)):
-            unique_types.add("string")
-        elif bool(numeric_pattern.match(element)):
-            unique_types.add("numeric")
-        elif bool(date_pattern.match(element)):
-            unique_types.add('date')
-        elif bool(datetime_pattern.match(element)):
-            unique_types.add('datetime')
+        value_types = value_types.astype(np.uint16)
+        if np.any(value_types & ValueType.NOT_A_STRING):
+            raise TypeError("The values must be strings, ints or floats.")
 
-        if len(unique_types) > 1:
-            return True  # True if more than one unique data type is found
-        else:
-            return False
+        data_types = np.full(len(value_types), _UNKNOWN_TYPE, dtype=np.int8)
+        # Ints and floats are numeric regardless of their string representation.
+        data_types[(value_types & ValueType.NUMBER) != 0] = _NUMERIC_TYPE
+        for value_type, data_type in _DATA_TYPE_PRIORITIES:
+            unassigned = data_types == _UNKNOWN_TYPE
+            data_types[unassigned & ((value_types & value_type) != 0)] = data_type
+        return data_types
 
-    @column_condition_partial(engine=PandasExecutionEngine)
-    def _pandas(cls, column, _metrics, **kwargs):
+    @scanned_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, scan: ColumnScan, **kwargs):
         """
-        Apply the intermingled data types check to each element in the column.
+        Evaluate the intermingled data types check for each element in the column.
+
+        An element is flagged if more than one data type is present among the
+        element and the elements preceding it.
 
         Args:
-            column (pandas.Series): The column to check.
+            scan (ColumnScan): The scan features of the column to check.
 
         Returns:
-            pandas.Series: Boolean series where True indicates the value is not suspect.
+            numpy.ndarray: Boolean array where True indicates the value is not suspect.
         """
-        # Negate the result of _contains_casing_smell since Great Expectations
-        # assumes that False is returned if a value is faulty
-        # (a data smell is present).
-        unique_types.clear()
-        def not_contains_intermingled_data_types(element: str) -> bool:
-            return not cls._contains_intermingled_types(element)
-        return column.map(not_contains_intermingled_data_types)
+        data_types = cls._get_data_types(scan[VALUE_TYPE_SCAN_FEATURE])
+        result = np.ones(len(data_types), dtype=bool)
+
+        # Positions where each known data type occurs for the first time
+        known = data_types != _UNKNOWN_TYPE
+        _, first_positions = np.unique(data_types[known], return_index=True)
+        if len(first_positions) > 1:
+            positions = np.flatnonzero(known)[first_positions]
+            # The second data type is present from this position onwards.
+            result[np.sort(positions)[1]:] = False
+        return result
 
 
 class ExpectColumnValuesToNotContainIntermingledDataTypes(ColumnMapExpectation, DataSmell):
@@ -260,6 +285,7 @@ class ExpectColumnValuesToNotContainIntermingledDataTypes(ColumnMapExpectation,
     }
 
     map_metric = "column_values.custom.not_contains_intermingled_data_types"
+    scan_features = (VALUE_TYPE_SCAN_FEATURE,)
 
     success_keys = ("mostly",)
 
@@ -1,14 +1,27 @@
-from typing import Optional, Iterable, Dict, Any, List
+from typing import Iterable, Dict, Any, List, Sequence
 import re
 
+import numpy as np
+import pandas as pd
+
 from datasmelldetection.core import DataSmellType
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.scanner import (
+    ColumnScan,
+    ScannedColumnMapMetricProvider,
+    default_scan_feature_registry,
+    scan_column,
+    scanned_condition_partial,
+)
 
-from great_expectations.core.expectation_configuration import ExpectationConfiguration
-from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation import ColumnMapExpectation
 from great_expectations.profile.base import ProfilerDataType
-from great_expectations.validator.validation_graph import MetricConfiguration
+
+
+MAX_WORD_LENGTH_SCAN_FEATURE: str = "max_word_length"
+
+_WORD_PATTERN = re.compile(r"\w+")
 
 
 _test_data = {
@@ -177,6 +190,52 @@ def _generate_per_column_testcases(column_name: str) -> List[Dict[str, Any]]:
     ]
 
 
+class ColumnValuesDontContainLongDataValueSmell(ScannedColumnMapMetricProvider):
+    condition_metric_name = "column_values.custom.not_contains_long_data_value_smell"
+    condition_value_keys = ("length_threshold",)
+    scan_features = (MAX_WORD_LENGTH_SCAN_FEATURE,)
+
+    @classmethod
+    def _get_max_word_length(cls, element: Any) -> int:
+        # Length of the longest substring consisting of word characters. The
+        # string representation is used to match the previously used
+        # column_values.not_match_regex metric with the regex \w{N,}.
+        return max(map(len, _WORD_PATTERN.findall(str(element))), default=0)
+
+    @scanned_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, scan: ColumnScan, length_threshold: int, **kwargs):
+        # A long data value smell is present if the longest word consists of
+        # at least `length_threshold` characters.
+        return scan[MAX_WORD_LENGTH_SCAN_FEATURE].astype(int) < int(length_threshold)
+
+
+def get_long_data_values(column: pd.Series, length_thresholds: Sequence[int]) -> np.ndarray:
+    """
+    Detect long data values for several length thresholds at once (e.g. the
+    thresholds of the tolerant, medium and strict presettings).
+
+    The length of the longest word of each value is computed once. Each
+    threshold is evaluated by comparing the lengths to the threshold.
+    Expectations of the same column with different thresholds which are
+    validated together share the computed lengths too (see
+    ColumnFusedScan).
+
+    Args:
+        column (pandas.Series): The non-null values to check.
+        length_thresholds (Sequence[int]): The minimum numbers of characters
+            a word must consist of to be considered "long".
+
+    Returns:
+        numpy.ndarray: Boolean array of shape (number of thresholds, number
+        of values) where True indicates a long data value smell of the value
+        for the corresponding threshold.
+    """
+    scan = scan_column(column, [MAX_WORD_LENGTH_SCAN_FEATURE])
+    max_word_lengths = scan[MAX_WORD_LENGTH_SCAN_FEATURE].astype(int)
+    thresholds = np.asarray(length_thresholds, dtype=int)
+    return max_word_lengths[np.newaxis, :] >= thresholds[:, np.newaxis]
+
+
 class ExpectColumnValuesToNotContainLongDataValueSmell(ColumnMapExpectation, DataSmell):
     """
     Detect if a long data value smell is present.
@@ -204,6 +263,8 @@ class ExpectColumnValuesToNotContainLongDataValueSmell(ColumnMapExpectation, Dat
         profiler_data_types={ProfilerDataType.STRING}
     )
 
+    row_wise = True
+
     # NOTE: The examples are used to perform tests
     # NOTE: Some testcases were taken from
     # https://www.grammarly.com/blog/14-of-the-longest-words-in-english/.
@@ -250,7 +311,7 @@ class ExpectColumnValuesToNotContainLongDataValueSmell(ColumnMapExpectation, Dat
         "package": "experimental_expectations",
     }
 
-    map_metric = "column_values.not_match_regex"
+    map_metric = "column_values.custom.not_contains_long_data_value_smell"
     success_keys = ("length_threshold", "mostly")
 
     default_kwarg_values = {
@@ -258,35 +319,13 @@ class ExpectColumnValuesToNotContainLongDataValueSmell(ColumnMapExpectation, Dat
         "mostly": 0.95
     }
 
-    def get_validation_dependencies(
-        self,
-        configuration: Optional[ExpectationConfiguration] = None,
-        execution_engine: Optional[ExecutionEngine] = None,
-        runtime_configuration: Optional[dict] = None,
-    ):
-        dependencies = super(ExpectColumnValuesToNotContainLongDataValueSmell, self).get_validation_dependencies(
-            configuration, execution_engine, runtime_configuration
-        )
-
-        # Get values for success kwargs (needed to ensure that default length
-        # threshold value is used if it is not explicitly specified).
-        success_kwargs = self.get_success_kwargs(configuration)
-
-        pattern = re.compile(r"^column_values\.not_match_regex\.")
-        length_threshold = success_kwargs["length_threshold"]
-        regex: str = r"\w{" + str(int(length_threshold)) + r",}"
-
-        # Override regex for internally used metric
-        # (column_values.not_match_regex). This is required since the regex is
-        # constructed above using the length threshold parameter.
-        for metric_name, metric_configuration_ in dependencies["metrics"].items():
-            if pattern.search(metric_name):
-                assert isinstance(metric_configuration_, MetricConfiguration)
-                metric_configuration: MetricConfiguration = metric_configuration_
-                metric_configuration.metric_value_kwargs["regex"] = regex
-
-        return dependencies
+    scan_features = (MAX_WORD_LENGTH_SCAN_FEATURE,)
+
 
+default_scan_feature_registry.register(
+    MAX_WORD_LENGTH_SCAN_FEATURE,
+    ColumnValuesDontContainLongDataValueSmell._get_max_word_length
+)
 
 expectation = ExpectColumnValuesToNotContainLongDataValueSmell()
 expectation.register_data_smell()
@@ -25,6 +25,8 @@ class ExpectColumnValuesToNotContainMissingValueSmell(ExpectColumnValuesToNotBeN
         profiler_data_types=set([e for e in ProfilerDataType])
     )
 
+    row_wise = True
+
     # NOTE: library_metadata not set since the ExpectColumnValuesToNotBeNull
     # expectation sets it.
 
@@ -1,47 +1,123 @@
 from typing import Optional, Dict, Any
+
+import numpy as np
 import pandas as pd
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
-from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.expectations.expectation import ColumnMapExpectation
-from great_expectations.expectations.metrics import ColumnMapMetricProvider, column_condition_partial
+from great_expectations.expectations.metrics import ColumnMetricProvider
 from great_expectations.profile.base import ProfilerDataType
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.columncache import (
+    CachedColumnMapMetricProvider,
+    cached_column_aggregate_value,
+    cached_condition_partial
+)
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.scanner import factorize_values
 
 
-class ColumnValuesDontContainPrecisionInconsistencies(ColumnMapMetricProvider):
-    condition_metric_name = "column_values.custom.not_contains_precision_inconsistencies"
-    condition_value_keys = ()
+DECIMAL_PLACE_COUNTS_METRIC_NAME: str = "column.custom.decimal_places.counts"
 
-    @classmethod
-    def _contains_precision_inconsistencies(cls, element: str) -> bool:
-        """
-        Check if a float value has a different number of decimal places compared to others.
 
-        Args:
-            element (str): The float string to check.
+# The number of floats whose string representations are processed at once.
+# This limits the size of the intermediate character arrays.
+_BATCH_SIZE: int = 100000
 
-        Returns:
-            bool: True if precision inconsistency is detected, False otherwise.
-        """
-        def count_decimal_places(value: float) -> int:
-            if '.' in str(value):
-                return len(str(value).split('.')[1])
-            return 0
-        
-        # Extract the number of decimal places
-        decimal_places = count_decimal_places(element)
-        cls.decimal_places_set.add(decimal_places)
-        
-        # Check if there are multiple unique decimal places
-        return len(cls.decimal_places_set) > 1
-
-    @column_condition_partial(engine=PandasExecutionEngine)
+
+# Return the number of decimal places of the string representations of
+# floats. NumPy formats floats in the same way as str does (i.e. using the
+# shortest representation) which allows to process the characters as arrays.
+def _count_float_decimal_places(values: np.ndarray) -> np.ndarray:
+    decimal_places = np.empty(len(values), dtype=np.int64)
+    for start in range(0, len(values), _BATCH_SIZE):
+        strings: np.ndarray = values[start:start + _BATCH_SIZE].astype("S")
+        characters = strings.view(np.uint8).reshape(len(strings), strings.dtype.itemsize)
+        is_period = characters == ord(".")
+        # NOTE: The string representation of a float contains at most one
+        # period. Unused characters are zero bytes.
+        decimal_places[start:start + len(strings)] = np.where(
+            is_period.any(axis=1),
+            (characters != 0).sum(axis=1) - is_period.argmax(axis=1) - 1,
+            0
+        )
+    return decimal_places
+
+
+# Return the number of decimal places of each value of a column, i.e. the
+# length of the part between the first and the second period of the string
+# representation of the value (0 if the value does not contain a period).
+def _count_decimal_places(column: pd.Series) -> np.ndarray:
+    if column.dtype.kind in ("i", "u", "b"):
+        return np.zeros(len(column), dtype=np.int64)
+
+    # The string representations are only computed once per distinct value.
+    factorized = factorize_values(column)
+    values: pd.Series = column if factorized is None else factorized[1]
+    decimal_places: np.ndarray
+    if values.dtype.kind == "f":
+        decimal_places = _count_float_decimal_places(values.to_numpy())
+    else:
+        decimal_places = values.astype(str).str.split(".").str[1].str.len().\
+            fillna(0).to_numpy(dtype=np.int64)
+    return decimal_places if factorized is None else decimal_places[factorized[0]]
+
+
+# Return the histogram of the decimal places of the values of a column which
+# maps a number of decimal places to the number of values with this number of
+# decimal places. The histograms of chunks of a column can be merged by adding
+# the counts.
+def _get_decimal_place_counts(column: pd.Series) -> Dict[int, int]:
+    decimal_places, counts = np.unique(_count_decimal_places(column), return_counts=True)
+    return dict(zip(decimal_places.tolist(), counts.tolist()))
+
+
+# Return the number of decimal places of the majority of the values or None if
+# several numbers of decimal places are equally common.
+def _get_dominant_decimal_places(decimal_place_counts: Dict[int, int]) -> Optional[int]:
+    if len(decimal_place_counts) == 0:
+        return None
+    maximum_count: int = max(decimal_place_counts.values())
+    dominant = [k for k, v in decimal_place_counts.items() if v == maximum_count]
+    return dominant[0] if len(dominant) == 1 else None
+
+
+# Return True for the values with the dominant number of decimal places. If
+# there is no dominant number of decimal places, the precision of all values
+# is inconsistent.
+def _has_dominant_precision(column: pd.Series, decimal_place_counts: Dict[int, int]) \
+        -> pd.Series:
+    dominant_decimal_places = _get_dominant_decimal_places(decimal_place_counts)
+    if dominant_decimal_places is None:
+        return pd.Series(False, index=column.index)
+    return pd.Series(_count_decimal_places(column) == dominant_decimal_places, index=column.index)
+
+
+class ColumnDecimalPlaceCounts(ColumnMetricProvider):
+    """
+    Compute the histogram of the decimal places of the non-null values of a
+    column (see :data:`DECIMAL_PLACE_COUNTS_METRIC_NAME`).
+    """
+
+    metric_name = DECIMAL_PLACE_COUNTS_METRIC_NAME
+
+    @cached_column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        return _get_decimal_place_counts(column)
+
+
+class ColumnValuesDontContainPrecisionInconsistencies(CachedColumnMapMetricProvider):
+    condition_metric_name = "column_values.custom.not_contains_precision_inconsistencies"
+    condition_value_keys = ()
+
+    @cached_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, _metrics, **kwargs):
         """
-        Apply the precision inconsistency check to each element in the column.
+        Flag the values whose number of decimal places deviates from the
+        dominant number of decimal places of the column.
 
         Args:
             column (pandas.Series): The column to check.
@@ -49,18 +125,47 @@ class ColumnValuesDontContainPrecisionInconsistencies(ColumnMapMetricProvider):
         Returns:
             pandas.Series: Boolean series where True indicates the value is not suspect.
         """
-        cls.decimal_places_set = set()
+        return _has_dominant_precision(column, _metrics[DECIMAL_PLACE_COUNTS_METRIC_NAME])
+
+    @classmethod
+    def _get_evaluation_dependencies(
+            cls,
+            metric: MetricConfiguration,
+            configuration: Optional[ExpectationConfiguration] = None,
+            execution_engine: Optional[ExecutionEngine] = None,
+            runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        # NOTE: The histogram is computed in a first pass over the column
+        # before the values are evaluated.
+        if metric.metric_name == cls.condition_metric_name + ".condition":
+            dependencies[DECIMAL_PLACE_COUNTS_METRIC_NAME] = MetricConfiguration(
+                metric_name=DECIMAL_PLACE_COUNTS_METRIC_NAME,
+                metric_domain_kwargs={
+                    k: v for k, v in metric.metric_domain_kwargs.items()
+                    if k in ColumnDecimalPlaceCounts.domain_keys
+                },
+                metric_value_kwargs=dict()
+            )
 
-        def not_contains_precision_inconsistencies(element: str) -> bool:
-            return not cls._contains_precision_inconsistencies(element)
-        return column.map(not_contains_precision_inconsistencies)
+        return dependencies
 
 
 class ExpectColumnValuesToNotContainPrecisionInconsistencies(ColumnMapExpectation, DataSmell):
     """
     Detect the presence of precision inconsistencies in float values.
 
-    This expectation checks if the number of decimal places varies significantly across the column.
+    This expectation checks if the number of decimal places varies across the column. First, the
+    histogram of the decimal places of the column is computed. Afterwards, the values whose number
+    of decimal places deviates from the most common number of decimal places are flagged. If
+    several numbers of decimal places are equally common, all values are flagged. Therefore, the
+    result does not depend on the order of the values.
 
     Keyword Args:
         mostly:
@@ -72,6 +177,8 @@ class ExpectColumnValuesToNotContainPrecisionInconsistencies(ColumnMapExpectatio
         profiler_data_types={ProfilerDataType.FLOAT}
     )
 
+    aggregate_metrics = (DECIMAL_PLACE_COUNTS_METRIC_NAME,)
+
     # Examples for tests
     examples = [
         {
@@ -3,61 +3,46 @@ from typing import List, Dict, Any, Optional
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation import ColumnMapExpectation
-from great_expectations.expectations.metrics import (
-    ColumnMapMetricProvider,
-    column_condition_partial,
-)
 from great_expectations.profile.base import ProfilerDataType
-import re
 
 from datasmelldetection.core.datasmells import DataSmellType
 from datasmelldetection.detectors.great_expectations.datasmell import (
     DataSmell,
     DataSmellMetadata
 )
+from datasmelldetection.detectors.great_expectations.scanner import (
+    ColumnScan,
+    ScannedColumnMapMetricProvider,
+    scanned_condition_partial,
+)
+from datasmelldetection.detectors.great_expectations.whitespace import (
+    WHITESPACE_PROFILE_SCAN_FEATURE,
+    has_spacing_issues
+)
 
 
-class ColumnValuesDontContainSpacingInconsistencySmell(ColumnMapMetricProvider):
+class ColumnValuesDontContainSpacingInconsistencySmell(ScannedColumnMapMetricProvider):
     condition_metric_name = "column_values.custom.not_contains_spacing_inconsistency_smell"
     condition_value_keys = ()
+    # NOTE: The whitespace profile is shared with the spacing smell.
+    scan_features = (WHITESPACE_PROFILE_SCAN_FEATURE,)
 
-    @classmethod
-    def _contains_spacing_inconsistency_smell(cls, element: str) -> bool:
+    @scanned_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, scan: ColumnScan, **kwargs):
         """
-        Check if a string contains spacing inconsistencies.
+        Evaluate the spacing inconsistency check for each element in the column.
 
-        Args:
-            element (str): The string to check.
-
-        Returns:
-            bool: True if spacing inconsistencies are detected, False otherwise.
-        """
-        # Regex patterns for different types of spacing issues
-        leading_spaces_pattern = re.compile(r'^\s+')
-        multiple_spaces_pattern = re.compile(r'\s{2,}')
-        trailing_spaces_pattern = re.compile(r'\s+$')
-
-        # Check for spacing issues
-        if (leading_spaces_pattern.search(element) or
-                multiple_spaces_pattern.search(element) or
-                trailing_spaces_pattern.search(element)):
-            return True
-        return False
-
-    @column_condition_partial(engine=PandasExecutionEngine)
-    def _pandas(cls, column, _metrics, **kwargs):
-        """
-        Apply the spacing inconsistency check to each element in the column.
+        A value contains a spacing inconsistency if it contains leading
+        whitespace, trailing whitespace or runs of multiple whitespace
+        characters.
 
         Args:
-            column (pandas.Series): The column to check.
+            scan (ColumnScan): The scan features of the column to check.
 
         Returns:
-            pandas.Series: Boolean series where True indicates the value is not suspect.
+            numpy.ndarray: Boolean array where True indicates the value is not suspect.
         """
-        def not_contains_spacing_inconsistency_smell(element: str) -> bool:
-            return not cls._contains_spacing_inconsistency_smell(element)
-        return column.map(not_contains_spacing_inconsistency_smell)
+        return ~has_spacing_issues(scan[WHITESPACE_PROFILE_SCAN_FEATURE])
 
 
 class ExpectColumnValuesToNotContainSpacingInconsistencySmell(ColumnMapExpectation, DataSmell):
@@ -79,6 +64,8 @@ class ExpectColumnValuesToNotContainSpacingInconsistencySmell(ColumnMapExpectati
         profiler_data_types={ProfilerDataType.STRING}
     )
 
+    row_wise = True
+
     # NOTE: The examples are used to perform tests
     examples = [
         {
@@ -184,6 +171,7 @@ class ExpectColumnValuesToNotContainSpacingInconsistencySmell(ColumnMapExpectati
     }
 
     map_metric = "column_values.custom.not_contains_spacing_inconsistency_smell"
+    scan_features = (WHITESPACE_PROFILE_SCAN_FEATURE,)
 
     success_keys = ("mostly",)
 
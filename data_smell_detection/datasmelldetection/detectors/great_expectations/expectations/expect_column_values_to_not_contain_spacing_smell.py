@@ -3,6 +3,7 @@ from typing import Optional
 
 from datasmelldetection.core import DataSmellType
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.whitespace import WHITESPACE_PROFILE_SCAN_FEATURE
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.expectations.expectation import ColumnMapExpectation
@@ -13,7 +14,9 @@ class ExpectColumnValuesToNotContainSpacingSmell(ColumnMapExpectation, DataSmell
     """
     Detect if a string contains spacing smells (multiple occurrences of whitespaces).
 
-    The presence of a spacing smell is checked by using regex matching. This includes:
+    The presence of a spacing smell is checked by using the whitespace profile
+    of the values (see
+    :mod:`~datasmelldetection.detectors.great_expectations.whitespace`). This includes:
     - Multiple spaces at the beginning
     - Multiple spaces between words
     - Multiple spaces at the end
@@ -29,6 +32,8 @@ class ExpectColumnValuesToNotContainSpacingSmell(ColumnMapExpectation, DataSmell
         profiler_data_types={ProfilerDataType.STRING}
     )
 
+    row_wise = True
+
     # NOTE: The examples are used to perform tests
     examples = [
         {
@@ -277,18 +282,18 @@ class ExpectColumnValuesToNotContainSpacingSmell(ColumnMapExpectation, DataSmell
         "package": "experimental_expectations",
     }
 
-    map_metric = "column_values.not_match_regex"
-    success_keys = (
-        "mostly",
-        "regex"
-    )
+    map_metric = "column_values.custom.not_contains_spacing_smell"
+    success_keys = ("mostly",)
 
     default_kwarg_values = {
         "catch_exceptions": True,
-        "regex": r'(^\s+)|(\s{2,})|(\s+$)',
         "mostly": 0.9
     }
 
+    # NOTE: The whitespace profile is shared with the spacing inconsistency
+    # smell.
+    scan_features = (WHITESPACE_PROFILE_SCAN_FEATURE,)
+
     def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
         super().validate_configuration(configuration)
         assert configuration is not None
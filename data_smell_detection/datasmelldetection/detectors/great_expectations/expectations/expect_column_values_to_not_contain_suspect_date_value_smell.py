@@ -1,56 +1,176 @@
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from datetime import date, datetime, timedelta
+import math
+from typing import Optional, Dict, Any, List, Union
 
+import numpy as np
+import pandas as pd
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation import ColumnMapExpectation
-from great_expectations.expectations.metrics import ColumnMapMetricProvider, column_condition_partial
 from great_expectations.profile.base import ProfilerDataType
 
 from datasmelldetection.core.datasmells import DataSmellType
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.scanner import (
+    ColumnScan,
+    ScannedColumnMapMetricProvider,
+    default_scan_feature_registry,
+    scanned_condition_partial,
+)
 
 
-class ColumnValuesDontContainSuspectDateValueSmell(ColumnMapMetricProvider):
+DATE_KEY_SCAN_FEATURE: str = "date_key"
+
+_DATE_FORMAT: str = "%Y-%m-%d"
+
+# Matches exactly the strings which datetime.strptime accepts for the format
+# %Y-%m-%d (see the directives of the _strptime module). Whether the day
+# exists in the month is checked separately.
+_DATE_REGEX: str = r"\A(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])\Z"
+
+# The positions of the digits of a date in the format YYYY-MM-DD
+_CANONICAL_DIGIT_POSITIONS: List[int] = [0, 1, 2, 3, 5, 6, 8, 9]
+
+# The number of days of each month in a leap year (indexed by the month)
+_MAX_DAYS_IN_MONTH: np.ndarray = np.array([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+DateThreshold = Union[str, date]
+"""
+A threshold date of the suspect date value smell. Strings must be in the
+format %Y-%m-%d. The time of datetime objects is ignored.
+"""  # pylint: disable=W0105
+
+
+# Encode a date as the number YYYYMMDD. The order of the numbers is the order
+# of the dates.
+def _get_date_key(value: date) -> int:
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+# Encode dates given as arrays of their components as numbers YYYYMMDD. The
+# result is NaN for dates which don't exist.
+def _get_date_keys(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    is_valid_month = (month >= 1) & (month <= 12)
+    is_leap_year = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    is_valid = (year >= 1) & is_valid_month & (day >= 1) & \
+        (day <= _MAX_DAYS_IN_MONTH[np.where(is_valid_month, month, 0)]) & \
+        ((month != 2) | (day <= 28) | is_leap_year)
+    return np.where(is_valid, year * 10000 + month * 100 + day, math.nan)
+
+
+# Return the future threshold date which is used if none is given (tomorrow).
+def _get_default_future_threshold_date() -> date:
+    return (datetime.now() + timedelta(days=1)).date()
+
+
+def _get_threshold_date_key(threshold: DateThreshold) -> int:
+    if isinstance(threshold, str):
+        threshold = datetime.strptime(threshold, _DATE_FORMAT)
+    return _get_date_key(threshold)
+
+
+class ColumnValuesDontContainSuspectDateValueSmell(ScannedColumnMapMetricProvider):
     condition_metric_name = "column_values.custom.not_contains_suspect_date_value_smell"
     condition_value_keys = ("past_threshold_date", "future_threshold_date")
+    scan_features = (DATE_KEY_SCAN_FEATURE,)
 
     @classmethod
-    def _contains_suspect_date(cls, element: str) -> bool:
+    def _get_date_key(cls, element: str) -> float:
         """
-        Check if a date value is suspect by being before the past threshold date (1950-01-01) 
-        or after the future threshold date (tomorrow).
+        Get the date an element represents encoded as the number YYYYMMDD.
 
         Args:
-            element (str): The date string to check.
+            element (str): The date string to convert.
 
         Returns:
-            bool: True if the date is suspect, False otherwise.
+            float: The encoded date or NaN if the element is not a date in the
+            format %Y-%m-%d.
         """
-        past_threshold_date = datetime.strptime("1950-01-01", "%Y-%m-%d")
-        future_threshold_date = datetime.now() + timedelta(days=1)
         try:
-            date_value = datetime.strptime(element, "%Y-%m-%d")
-            return date_value < past_threshold_date or date_value > future_threshold_date
+            return _get_date_key(datetime.strptime(element, _DATE_FORMAT))
         except ValueError:
-            # If the date is not in the expected format, consider it suspect
-            #print("ERROR: in suspect date value. not expected format.")
-            return False
+            # If the date is not in the expected format, it is not suspect.
+            return math.nan
+
+    @classmethod
+    def _get_date_keys(cls, values: pd.Series) -> Optional[np.ndarray]:
+        """
+        Vectorized equivalent of :meth:`_get_date_key`.
+
+        Dates in the canonical format YYYY-MM-DD are parsed as arrays of
+        characters using NumPy. The remaining values which might be dates (e.g.
+        2021-1-5) are parsed by a regular expression. Other than
+        pandas.to_datetime, the dates are not limited to the range of
+        nanosecond timestamps (e.g. 3000-01-01 is a date).
+
+        Args:
+            values (pandas.Series): The values to convert.
+
+        Returns:
+            numpy.ndarray: The encoded dates or None if not all values are strings.
+        """
+        if pd.api.types.infer_dtype(values, skipna=False) != "string":
+            return None
 
-    @column_condition_partial(engine=PandasExecutionEngine)
-    def _pandas(cls, column, _metrics, **kwargs):
+        keys: np.ndarray = np.full(len(values), math.nan)
+        # Dates have between 8 (YYYY-M-D) and 10 (YYYY-MM-DD) characters.
+        lengths: np.ndarray = values.str.len().to_numpy()
+        is_remaining: np.ndarray = (lengths >= 8) & (lengths <= 10)
+
+        canonical_positions = np.flatnonzero(lengths == 10)
+        characters = values.iloc[canonical_positions].to_numpy().astype("U10").\
+            view(np.uint32).reshape(len(canonical_positions), 10)
+        # NOTE: Characters before "0" wrap around and are no digits either.
+        digits = characters[:, _CANONICAL_DIGIT_POSITIONS] - np.uint32(ord("0"))
+        is_canonical = (digits <= 9).all(axis=1) & \
+            (characters[:, 4] == ord("-")) & (characters[:, 7] == ord("-"))
+        digits = digits[is_canonical].astype(np.int64)
+        canonical_positions = canonical_positions[is_canonical]
+        keys[canonical_positions] = _get_date_keys(
+            digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3],
+            digits[:, 4] * 10 + digits[:, 5],
+            digits[:, 6] * 10 + digits[:, 7]
+        )
+        is_remaining[canonical_positions] = False
+
+        remaining_positions = np.flatnonzero(is_remaining)
+        parts: pd.DataFrame = values.iloc[remaining_positions].str.extract(_DATE_REGEX)
+        is_matched: np.ndarray = parts[0].notnull().to_numpy()
+        if is_matched.any():
+            year, month, day = (
+                parts[i][is_matched].astype(np.int64).to_numpy() for i in range(3)
+            )
+            keys[remaining_positions[is_matched]] = _get_date_keys(year, month, day)
+        return keys
+
+    @scanned_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, scan: ColumnScan, past_threshold_date: Optional[DateThreshold] = None,
+                future_threshold_date: Optional[DateThreshold] = None, **kwargs):
         """
-        Apply the suspect date check to each element in the column.
+        Evaluate the suspect date check for each element in the column.
 
         Args:
-            column (pandas.Series): The column to check.
+            scan (ColumnScan): The scan features of the column to check.
+            past_threshold_date (Optional[DateThreshold]): Dates before this date are
+                suspect (1950-01-01 if it is None).
+            future_threshold_date (Optional[DateThreshold]): Dates after this date are
+                suspect (tomorrow if it is None).
 
         Returns:
-            pandas.Series: Boolean series where True indicates the value is not suspect.
+            numpy.ndarray: Boolean array where True indicates the value is not suspect.
         """
-        def not_contains_suspect_date(element: str) -> bool:
-            return not cls._contains_suspect_date(element)
-        return column.map(not_contains_suspect_date)
+        # NOTE: The thresholds are computed once per column.
+        past_key = _get_threshold_date_key(
+            past_threshold_date if past_threshold_date is not None else "1950-01-01"
+        )
+        future_key = _get_threshold_date_key(
+            future_threshold_date if future_threshold_date is not None
+            else _get_default_future_threshold_date()
+        )
+        keys = scan[DATE_KEY_SCAN_FEATURE].astype(float)
+        # NaN (values which are not dates) is neither less nor greater than
+        # the thresholds.
+        return ~((keys < past_key) | (keys > future_key))
 
 
 class ExpectColumnValuesToNotContainSuspectDateValueSmell(ColumnMapExpectation, DataSmell):
@@ -58,7 +178,16 @@ class ExpectColumnValuesToNotContainSuspectDateValueSmell(ColumnMapExpectation,
     Expectation to detect the presence of suspect date values.
 
     This expectation checks if date values in a column are before a given past threshold date
-    or after a given future threshold date, marking them as suspect.
+    or after a given future threshold date, marking them as suspect. Values which are not dates
+    in the format %Y-%m-%d (e.g. "2021-12-31") are not suspect.
+
+    Parameters:
+        past_threshold_date: \
+            Dates before this date are suspect. The date is either a string in the format
+            %Y-%m-%d or a date object. If it is None, 1950-01-01 is used.
+        future_threshold_date: \
+            Dates after this date are suspect. The date is either a string in the format
+            %Y-%m-%d or a date object. If it is None, the date of tomorrow is used.
 
     Keyword Args:
         mostly: See the documentation regarding the `mostly` concept in Great Expectations.
@@ -69,6 +198,8 @@ class ExpectColumnValuesToNotContainSuspectDateValueSmell(ColumnMapExpectation,
         profiler_data_types={ProfilerDataType.STRING}
     )
 
+    row_wise = True
+
     # Examples for tests
     examples = [
         {
@@ -78,6 +209,7 @@ class ExpectColumnValuesToNotContainSuspectDateValueSmell(ColumnMapExpectation,
                 "suspect_dates_future": ["2099-01-01", "3000-12-31", "2500-07-20"],
                 "invalid_dates": ["2023-13-01", "2024-01-32", "2024-12-31 00:00:00"],
                 "mixed_valid_suspect": ["2023-06-01", "1949-12-31", "2099-01-01"],
+                "leap_days": ["2000-02-29", "1900-02-29", "2023-2-9"],
                 "empty_strings": ["", "", ""],
                 "non_date_values": ["hello", "world", "test"],
             },
@@ -126,12 +258,42 @@ class ExpectColumnValuesToNotContainSuspectDateValueSmell(ColumnMapExpectation,
                     "title": "test_mixed_valid_suspect",
                     "exact_match_out": False,
                     "include_in_gallery": True,
-                    "in": {"column": "mixed_valid_suspect"},
+                    "in": {"column": "mixed_valid_suspect", "mostly": 0.5},
                     "out": {
                         "success": False,
                         "partial_unexpected_list": ["1949-12-31", "2099-01-01"],
                     },
                 },
+                {
+                    "title": "test_custom_thresholds",
+                    "exact_match_out": False,
+                    "include_in_gallery": True,
+                    "in": {
+                        "column": "mixed_valid_suspect",
+                        "past_threshold_date": "1900-01-01",
+                        "future_threshold_date": "2023-01-01",
+                        "mostly": 0.5
+                    },
+                    "out": {
+                        "success": False,
+                        "partial_unexpected_list": ["2023-06-01", "2099-01-01"],
+                    },
+                },
+                {
+                    "title": "test_leap_days",
+                    "exact_match_out": False,
+                    "include_in_gallery": True,
+                    "in": {
+                        "column": "leap_days",
+                        "past_threshold_date": "2001-01-01",
+                        "mostly": 1
+                    },
+                    "out": {
+                        "success": False,
+                        # 1900-02-29 does not exist and is therefore not suspect
+                        "partial_unexpected_list": ["2000-02-29"],
+                    },
+                },
                 {
                     "title": "test_empty_strings",
                     "exact_match_out": False,
@@ -169,13 +331,30 @@ class ExpectColumnValuesToNotContainSuspectDateValueSmell(ColumnMapExpectation,
     }
 
     map_metric = "column_values.custom.not_contains_suspect_date_value_smell"
+    scan_features = (DATE_KEY_SCAN_FEATURE,)
 
-    success_keys = ("mostly")
+    success_keys = ("mostly", "past_threshold_date", "future_threshold_date")
 
     default_kwarg_values: Dict[str, Any] = {
+        "past_threshold_date": None,
+        "future_threshold_date": None,
         "mostly": 0.1
     }
 
+    @classmethod
+    def get_cache_kwargs(cls, configuration: ExpectationConfiguration) -> Dict[str, Any]:
+        # The default future threshold date changes every day.
+        kwargs = dict(super().get_cache_kwargs(configuration))
+        if kwargs.get("future_threshold_date") is None:
+            kwargs["future_threshold_date"] = _get_default_future_threshold_date()
+        return kwargs
+
+
+default_scan_feature_registry.register(
+    DATE_KEY_SCAN_FEATURE,
+    ColumnValuesDontContainSuspectDateValueSmell._get_date_key,
+    vectorized_extractor=ColumnValuesDontContainSuspectDateValueSmell._get_date_keys
+)
 
 # Instantiate and register the expectation
 expectation = ExpectColumnValuesToNotContainSuspectDateValueSmell()
@@ -1,6 +1,8 @@
 import json
 
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
 
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -10,36 +12,101 @@ from great_expectations.expectations.expectation import (
     ColumnMapExpectation,
     ExpectationConfiguration,
 )
-from great_expectations.expectations.metrics import (
-    ColumnMapMetricProvider,
-    column_condition_partial,
-)
+from great_expectations.expectations.registry import get_metric_kwargs
 from great_expectations.profile.base import ProfilerDataType
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.columncache import (
+    CachedColumnMapMetricProvider,
+    cached_condition_partial
+)
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.native import (
+    NativeColumn,
+    default_native_condition_registry
+)
+from datasmelldetection.detectors.great_expectations.numeric import (
+    NUMERIC_STATISTICS_METRIC_NAME,
+    QUANTILE_SKETCH_STATE_METRIC_NAME,
+    ColumnNumericStatistics,
+    ColumnQuantileSketchState,
+    NumericStatistics
+)
+from datasmelldetection.detectors.great_expectations.sketches import QuantileSketch
+
+
+DEFAULT_QUANTILE_ERROR: float = 0.01
+
+
+# Return True for the values which have the sign of the majority of the
+# values. The quantiles are the percentile_threshold and the
+# 1 - percentile_threshold quantiles of the column.
+def _has_majority_sign(column: pd.Series, quantiles: List[float]) -> pd.Series:
+    if quantiles[0] >= 0:
+        # The majority of the values are positive => return True for positive values
+        # to flag negative values
+        return column >= 0
+    elif quantiles[1] <= 0:
+        # The majority of the values are negative => return True for negative values
+        # to flag positive values
+        return column <= 0
+    else:
+        # Suspect sign smell not present
+        return pd.Series(True, index=column.index)
+
+
+# Compute the quantiles which are passed to _has_majority_sign from the
+# numeric statistics of the column. If there are no negative values, all
+# quantiles are non-negative and no quantiles have to be computed.
+def _has_majority_sign_by_statistics(column: pd.Series, statistics: NumericStatistics,
+                                     percentile_threshold: float) -> pd.Series:
+    if statistics.count > 0 and statistics.negative_count == 0:
+        return column >= 0
+    return _has_majority_sign(
+        column, statistics.get_quantiles([percentile_threshold, 1 - percentile_threshold])
+    )
+
+
+# Return the configuration of the quantile sketch whose rank error is
+# expected to stay below quantile_error.
+def _get_sketch_configuration(metric_domain_kwargs: Dict[str, Any], quantile_error: float) \
+        -> MetricConfiguration:
+    return MetricConfiguration(
+        metric_name=QUANTILE_SKETCH_STATE_METRIC_NAME,
+        metric_domain_kwargs={
+            k: v for k, v in metric_domain_kwargs.items()
+            if k in ColumnQuantileSketchState.domain_keys
+        },
+        metric_value_kwargs={"capacity": QuantileSketch.get_capacity(quantile_error)}
+    )
 
 
-class ColumnValuesDontContainSuspectSignSmell(ColumnMapMetricProvider):
+# The native condition of the exact mode. In approximate mode, the expectation
+# depends on the quantile sketch and is validated by the Great Expectations
+# validator (see validate_column_natively).
+def _native_condition(column: NativeColumn, percentile_threshold: float, **kwargs) -> pd.Series:
+    return _has_majority_sign_by_statistics(
+        column.values, column.numeric_statistics, percentile_threshold
+    )
+
+
+class ColumnValuesDontContainSuspectSignSmell(CachedColumnMapMetricProvider):
     condition_metric_name = "column_values.custom.not_contains_suspect_sign_smell"
-    condition_value_keys = ("percentile_threshold",)
-
-    @column_condition_partial(engine=PandasExecutionEngine)
-    def _pandas(cls, column, _metrics, **kwargs):
-        quantiles = _metrics.get("column.quantile_values")
-        if quantiles[0] >= 0:
-            # The majority of the values are positive => return True for positive values
-            # to flag negative values
-            return column >= 0
-        elif quantiles[1] <= 0:
-            # The majority of the values are negative => return True for negative values
-            # to flag positive values
-            return column <= 0
-        else:
-            # Suspect sign smell not present
-            return column.map(lambda x: True)
+    condition_value_keys = ("percentile_threshold", "approximate", "quantile_error")
+    default_kwarg_values = {"approximate": False, "quantile_error": DEFAULT_QUANTILE_ERROR}
+
+    @cached_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, column, _metrics, percentile_threshold, approximate=False, **kwargs):
+        if approximate:
+            sketch: QuantileSketch = _metrics[QUANTILE_SKETCH_STATE_METRIC_NAME]
+            return _has_majority_sign(
+                column, sketch.get_quantiles([percentile_threshold, 1 - percentile_threshold])
+            )
+        return _has_majority_sign_by_statistics(
+            column, _metrics[NUMERIC_STATISTICS_METRIC_NAME], percentile_threshold
+        )
 
     @classmethod
     def _get_evaluation_dependencies(
@@ -58,16 +125,24 @@ class ColumnValuesDontContainSuspectSignSmell(ColumnMapMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
-        percentile_threshold = metric.metric_value_kwargs["percentile_threshold"]
-
-        dependencies["column.quantile_values"] = MetricConfiguration(
-            metric_name="column.quantile_values",
-            metric_domain_kwargs=metric.metric_domain_kwargs,
-            metric_value_kwargs={
-                "quantiles": [percentile_threshold, 1 - percentile_threshold],
-                "allow_relative_error": "linear"
-            }
-        )
+        # NOTE: The quantiles are computed from the numeric statistics which
+        # are shared with other data smells (e.g. the extreme value smell).
+        # In approximate mode, a mergeable quantile sketch is used instead.
+        if metric.metric_name == cls.condition_metric_name + ".condition":
+            if metric.metric_value_kwargs.get("approximate", False):
+                dependencies[QUANTILE_SKETCH_STATE_METRIC_NAME] = _get_sketch_configuration(
+                    metric.metric_domain_kwargs,
+                    metric.metric_value_kwargs.get("quantile_error", DEFAULT_QUANTILE_ERROR)
+                )
+            else:
+                dependencies[NUMERIC_STATISTICS_METRIC_NAME] = MetricConfiguration(
+                    metric_name=NUMERIC_STATISTICS_METRIC_NAME,
+                    metric_domain_kwargs={
+                        k: v for k, v in metric.metric_domain_kwargs.items()
+                        if k in ColumnNumericStatistics.domain_keys
+                    },
+                    metric_value_kwargs=dict()
+                )
 
         return dependencies
 
@@ -95,6 +170,17 @@ class ExpectColumnValuesToNotContainSuspectSignSmell(ColumnMapExpectation, DataS
             quantiles are computed. The computed quantiles are used to
             determine whether the majority of the column values are positive
             or negative.
+        approximate: \
+            Whether the quantiles are approximated by a quantile sketch which
+            is built in a single streaming pass instead of sorting the whole
+            column. The sketches of chunks of a column are merged. Therefore,
+            the expectation can be evaluated on chunked datasets in this mode.
+            The rank error bound of the sketch is reported in the details of
+            the result ("quantile_rank_error"). Set to False by default.
+        quantile_error: \
+            The normalized rank error the quantile sketch should stay below
+            (in the interval (0, 1)). Smaller errors require larger sketches.
+            Only used in approximate mode. Set to 0.01 by default.
 
     Keyword Args:
         mostly:
@@ -249,17 +335,78 @@ class ExpectColumnValuesToNotContainSuspectSignSmell(ColumnMapExpectation, DataS
         "package": "experimental_expectations",
     }
 
+    aggregate_metrics = (QUANTILE_SKETCH_STATE_METRIC_NAME,)
+
     map_metric = "column_values.custom.not_contains_suspect_sign_smell"
 
     # for more information about domain and success keys, and other arguments to Expectations
-    success_keys = ("mostly", "percentile_threshold")
+    success_keys = ("mostly", "percentile_threshold", "approximate", "quantile_error")
 
     default_kwarg_values = {
         "percentile_threshold": 0.25,
+        "approximate": False,
+        "quantile_error": DEFAULT_QUANTILE_ERROR,
         "mostly": 0.95
     }
 
+    @classmethod
+    def get_aggregate_metrics(cls, configuration: ExpectationConfiguration) -> Tuple[str, ...]:
+        # NOTE: The exact quantiles cannot be merged across chunks.
+        if configuration.kwargs.get("approximate", cls.default_kwarg_values["approximate"]):
+            return cls.aggregate_metrics
+        return ()
+
+    def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
+        super().validate_configuration(configuration)
+        assert configuration is not None
+        if "approximate" in configuration.kwargs:
+            assert isinstance(configuration.kwargs["approximate"], bool), \
+                "approximate must be a boolean."
+        if "quantile_error" in configuration.kwargs:
+            quantile_error = configuration.kwargs["quantile_error"]
+            assert 0 < quantile_error < 1, "quantile_error must be in the interval (0, 1)."
+
+    def get_validation_dependencies(
+            self,
+            configuration: Optional[ExpectationConfiguration] = None,
+            execution_engine: Optional[ExecutionEngine] = None,
+            runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super().get_validation_dependencies(
+            configuration, execution_engine, runtime_configuration
+        )
+        # The sketch is required to report its rank error (it is shared with
+        # the condition metric).
+        success_kwargs = self.get_success_kwargs(configuration)
+        if success_kwargs["approximate"]:
+            metric_domain_kwargs = get_metric_kwargs(
+                QUANTILE_SKETCH_STATE_METRIC_NAME,
+                configuration=configuration,
+                runtime_configuration=runtime_configuration
+            )["metric_domain_kwargs"]
+            dependencies["metrics"][QUANTILE_SKETCH_STATE_METRIC_NAME] = \
+                _get_sketch_configuration(metric_domain_kwargs, success_kwargs["quantile_error"])
+        return dependencies
+
+    def _validate(
+            self,
+            configuration: ExpectationConfiguration,
+            metrics: Dict,
+            runtime_configuration: Optional[dict] = None,
+            execution_engine: Optional[ExecutionEngine] = None,
+    ):
+        result = super()._validate(
+            configuration, metrics, runtime_configuration, execution_engine
+        )
+        sketch: Optional[QuantileSketch] = metrics.get(QUANTILE_SKETCH_STATE_METRIC_NAME)
+        if sketch is not None and "result" in result:
+            result["result"]["details"] = {"quantile_rank_error": sketch.rank_error}
+        return result
+
 
+default_native_condition_registry.register(
+    ColumnValuesDontContainSuspectSignSmell.condition_metric_name, _native_condition
+)
 expectation = ExpectColumnValuesToNotContainSuspectSignSmell()
 expectation.register_data_smell()
 del expectation
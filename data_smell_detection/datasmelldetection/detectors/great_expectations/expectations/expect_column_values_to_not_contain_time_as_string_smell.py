@@ -3,6 +3,10 @@ from typing import Optional
 
 from datasmelldetection.core import DataSmellType
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.value_types import (
+    TIME_REGEX,
+    VALUE_TYPE_SCAN_FEATURE
+)
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.expectations.expectation import ColumnMapExpectation
@@ -27,6 +31,8 @@ class ExpectColumnValuesToNotContainTimeAsStringSmell(ColumnMapExpectation, Data
         profiler_data_types={ProfilerDataType.STRING}
     )
 
+    row_wise = True
+
     # NOTE: The examples are used to perform tests
     examples = [
         {
@@ -224,7 +230,7 @@ class ExpectColumnValuesToNotContainTimeAsStringSmell(ColumnMapExpectation, Data
         "package": "experimental_expectations",
     }
 
-    map_metric = "column_values.not_match_regex"
+    map_metric = "column_values.custom.not_match_typed_regex"
     success_keys = (
         "mostly",
         "regex"
@@ -232,10 +238,14 @@ class ExpectColumnValuesToNotContainTimeAsStringSmell(ColumnMapExpectation, Data
 
     default_kwarg_values = {
         "catch_exceptions": True,
-        "regex": r'^(\d{2}:\d{2}:\d{2})$|^(\d{2}:\d{2})$',
+        "regex": TIME_REGEX,
         "mostly": 0.1
     }
 
+    # NOTE: The regex is evaluated by the value type classification of the
+    # fused column scan which is shared with other data smells.
+    scan_features = (VALUE_TYPE_SCAN_FEATURE,)
+
     def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
         super().validate_configuration(configuration)
         assert configuration is not None
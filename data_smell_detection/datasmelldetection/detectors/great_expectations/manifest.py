@@ -0,0 +1,218 @@
+"""
+A declarative manifest of the expectations for data smell detection.
+
+Each expectation module registers its expectation at a
+:class:`~datasmelldetection.detectors.great_expectations.datasmell.DataSmellRegistry`
+when it is imported. Importing all modules upfront is slow since each module
+defines metric providers and imports the parts of Great Expectations they
+depend on. The manifest stores the registration data of each expectation
+together with the module which defines it. Registries are populated from the
+manifest without importing the modules (see :func:`register_manifest`). The
+modules are imported by
+:meth:`~datasmelldetection.detectors.great_expectations.datasmell.DataSmellRegistry.load_expectations`
+once the expectations are needed, e.g. when the
+:class:`~datasmelldetection.detectors.great_expectations.profiler.DataSmellAwareProfiler`
+generates them for a column.
+"""
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+from great_expectations.profile.base import ProfilerDataType
+
+from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.datasmell import (
+    DataSmellMetadata,
+    DataSmellRegistry
+)
+
+
+_EXPECTATIONS_PACKAGE: str = "datasmelldetection.detectors.great_expectations.expectations"
+
+_NUMERIC_TYPES = {ProfilerDataType.INT, ProfilerDataType.FLOAT, ProfilerDataType.NUMERIC}
+
+
+@dataclass
+class ExpectationManifestEntry:
+    """
+    The registration data of an expectation which performs data smell
+    detection.
+
+    The data must match the corresponding attributes of the expectation class.
+    """
+
+    expectation_type: str
+    """The type of the Great Expectations expectation."""  # pylint: disable=W0105
+
+    class_name: str
+    """The name of the expectation class."""  # pylint: disable=W0105
+
+    module: str
+    """The name of the module which defines the expectation class."""  # pylint: disable=W0105
+
+    data_smell_metadata: DataSmellMetadata
+    """Information about the detected data smell."""  # pylint: disable=W0105
+
+    scan_features: Tuple[str, ...] = ()
+    """The names of the scan features the expectation uses."""  # pylint: disable=W0105
+
+
+# Create the manifest entry of an expectation of this package. The module name
+# equals the expectation type except for a few expectations.
+def _entry(expectation_type: str, class_name: str, data_smell_type: DataSmellType,
+           profiler_data_types: Iterable[ProfilerDataType], scan_features: Tuple[str, ...] = (),
+           module_name: str = "") -> ExpectationManifestEntry:
+    return ExpectationManifestEntry(
+        expectation_type=expectation_type,
+        class_name=class_name,
+        module=f"{_EXPECTATIONS_PACKAGE}.{module_name or expectation_type}",
+        data_smell_metadata=DataSmellMetadata(
+            data_smell_type=data_smell_type,
+            profiler_data_types=set(profiler_data_types)
+        ),
+        scan_features=scan_features
+    )
+
+
+EXPECTATION_MANIFEST: Tuple[ExpectationManifestEntry, ...] = (
+    _entry(
+        "expect_column_values_to_not_contain_missing_value_smell",
+        "ExpectColumnValuesToNotContainMissingValueSmell",
+        DataSmellType.MISSING_VALUE_SMELL,
+        ProfilerDataType
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_suspect_sign_smell",
+        "ExpectColumnValuesToNotContainSuspectSignSmell",
+        DataSmellType.SUSPECT_SIGN_SMELL,
+        _NUMERIC_TYPES
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_integer_as_string_smell",
+        "ExpectColumnValuesToNotContainIntegerAsStringSmell",
+        DataSmellType.INTEGER_AS_STRING_SMELL,
+        {ProfilerDataType.STRING},
+        scan_features=("value_type",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_floating_point_number_as_string_smell",
+        "ExpectColumnValuesToNotContainFloatingPointNumberAsStringSmell",
+        DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL,
+        {ProfilerDataType.STRING},
+        scan_features=("value_type",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_extreme_value_smell",
+        "ExpectColumnValuesToNotContainExtremeValueSmell",
+        DataSmellType.EXTREME_VALUE_SMELL,
+        _NUMERIC_TYPES
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_long_data_value_smell",
+        "ExpectColumnValuesToNotContainLongDataValueSmell",
+        DataSmellType.LONG_DATA_VALUE_SMELL,
+        {ProfilerDataType.STRING},
+        scan_features=("max_word_length",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_integer_as_floating_point_number_smell",
+        "ExpectColumnValuesToNotContainIntegerAsFloatingPointNumberSmell",
+        DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL,
+        {ProfilerDataType.FLOAT}
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_casing_smell",
+        "ExpectColumnValuesToNotContainCasingSmell",
+        DataSmellType.CASING_SMELL,
+        {ProfilerDataType.STRING},
+        scan_features=("casing_smell_wordcount_limit",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_duplicated_value_smell",
+        "ExpectColumnValuesToNotContainDuplicatedValueSmell",
+        DataSmellType.DUPLICATED_VALUE_SMELL,
+        {ProfilerDataType.STRING, ProfilerDataType.INT}
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_date_as_string_smell",
+        "ExpectColumnValuesToNotContainDateAsStringSmell",
+        DataSmellType.DATE_AS_STRING_SMELL,
+        {ProfilerDataType.STRING},
+        scan_features=("value_type",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_suspect_date_value_smell",
+        "ExpectColumnValuesToNotContainSuspectDateValueSmell",
+        DataSmellType.SUSPECT_DATE_VALUE_SMELL,
+        {ProfilerDataType.STRING},
+        scan_features=("date_key",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_intermingled_data_types",
+        "ExpectColumnValuesToNotContainIntermingledDataTypes",
+        DataSmellType.INTERMINGLED_DATA_TYPE_SMELL,
+        {ProfilerDataType.STRING} | _NUMERIC_TYPES,
+        scan_features=("value_type",),
+        module_name="expect_column_values_to_not_contain_intermingled_data_type_smell"
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_dummy_value_smell",
+        "ExpectColumnValuesToNotContainDummyValueSmell",
+        DataSmellType.DUMMY_VALUE_SMELL,
+        {ProfilerDataType.STRING} | _NUMERIC_TYPES,
+        scan_features=("regex:^(0|1|999|9999|8888|UNK|N/A)$",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_spacing_smell",
+        "ExpectColumnValuesToNotContainSpacingSmell",
+        DataSmellType.SPACING_SMELL,
+        {ProfilerDataType.STRING},
+        scan_features=("whitespace_profile",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_spacing_inconsistency_smell",
+        "ExpectColumnValuesToNotContainSpacingInconsistencySmell",
+        DataSmellType.SPACING_INCONSISTENCY_SMELL,
+        {ProfilerDataType.STRING},
+        scan_features=("whitespace_profile",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_time_as_string_smell",
+        "ExpectColumnValuesToNotContainTimeAsStringSmell",
+        DataSmellType.TIME_AS_STRING_SMELL,
+        {ProfilerDataType.STRING},
+        scan_features=("value_type",)
+    ),
+    _entry(
+        "expect_column_values_to_not_contain_precision_inconsistencies",
+        "ExpectColumnValuesToNotContainPrecisionInconsistencies",
+        DataSmellType.PRECISION_INCONSISTENCY_SMELL,
+        {ProfilerDataType.FLOAT},
+        module_name="expect_column_values_to_not_contain_precision_inconsistency_smell"
+    ),
+)
+"""
+The manifest entries of the expectations of the
+:mod:`~datasmelldetection.detectors.great_expectations.expectations` package.
+The order of the entries determines the order of the expectations of a
+column in a profiled expectation suite.
+"""  # pylint: disable=W0105
+
+
+def register_manifest(registry: DataSmellRegistry,
+                      manifest: Tuple[ExpectationManifestEntry, ...] = EXPECTATION_MANIFEST):
+    """
+    Register the expectations of a manifest at a
+    :class:`~datasmelldetection.detectors.great_expectations.datasmell.DataSmellRegistry`
+    without importing their modules.
+
+    :param registry: The registry where the expectations should be
+        registered.
+    :param manifest: The manifest entries of the expectations.
+    """
+    for entry in manifest:
+        registry.register(
+            entry.data_smell_metadata,
+            expectation_type=entry.expectation_type,
+            scan_features=entry.scan_features,
+            module=entry.module
+        )
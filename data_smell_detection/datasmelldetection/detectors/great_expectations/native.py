@@ -0,0 +1,307 @@
+import inspect
+import traceback
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_validation_result import ExpectationValidationResult
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.registry import (
+    get_expectation_impl,
+    get_metric_kwargs,
+    get_metric_provider
+)
+from great_expectations.core.expectation_configuration import parse_result_format
+from great_expectations.validator.validator import Validator
+
+from .datasmell import get_aggregate_metrics
+from .numeric import NumericStatistics, compute_numeric_statistics
+from .scanner import ColumnScan, ScannedColumnMapMetricProvider, scan_column
+
+
+class NativeColumn:
+    """
+    The values of a column which are passed to native conditions.
+
+    The non-null values, the scan of the non-null values (see
+    :class:`~datasmelldetection.detectors.great_expectations.scanner.ColumnScan`)
+    and their numeric statistics (see
+    :class:`~datasmelldetection.detectors.great_expectations.numeric.NumericStatistics`)
+    are computed once and shared by all conditions evaluated on the column.
+    """
+
+    def __init__(self, all_values: pd.Series, scan_features: Iterable[str] = ()):
+        """
+        :param all_values: The values of the column (including null values).
+        :param scan_features: The scan features which are computed when the
+            scan is accessed for the first time.
+        """
+        self._all_values = all_values
+        self._scan_features: Tuple[str, ...] = tuple(sorted(set(scan_features)))
+        self._values: Optional[pd.Series] = None
+        self._scan: Optional[ColumnScan] = None
+        self._numeric_statistics: Optional[NumericStatistics] = None
+
+    @property
+    def all_values(self) -> pd.Series:
+        """The values of the column including null values."""
+        return self._all_values
+
+    @property
+    def values(self) -> pd.Series:
+        """The non-null values of the column."""
+        if self._values is None:
+            self._values = self._all_values[self._all_values.notnull()]
+        return self._values
+
+    @property
+    def scan(self) -> ColumnScan:
+        """The scan of the non-null values of the column."""
+        if self._scan is None:
+            self._scan = scan_column(self.values, self._scan_features)
+        return self._scan
+
+    @property
+    def numeric_statistics(self) -> NumericStatistics:
+        """
+        The numeric statistics of the non-null values of the column.
+
+        :raises TypeError: If the column contains non-numeric values.
+        """
+        if self._numeric_statistics is None:
+            self._numeric_statistics = compute_numeric_statistics(self.values)
+        return self._numeric_statistics
+
+
+NativeCondition = Callable[..., Any]
+"""
+A function which is called with a :class:`.NativeColumn` and the value kwargs
+of a map metric. It returns a boolean array-like which is True for the values
+which meet the expectation. The array is aligned with the non-null values of
+the column (or all values if null values are not filtered).
+"""  # pylint: disable=W0105
+
+
+class NativeConditionRegistry:
+    """
+    Store the native conditions of map metrics.
+
+    Conditions of map metrics which are defined using the
+    :func:`~great_expectations.expectations.metrics.column_condition_partial` or
+    :func:`~datasmelldetection.detectors.great_expectations.scanner.scanned_condition_partial`
+    decorators don't have to be registered as long as they don't depend on
+    other metrics. The decorated functions are evaluated directly in this case.
+    """
+
+    def __init__(self):
+        # Type: Dict[str, Tuple[NativeCondition, bool, Callable]]
+        self._conditions = dict()
+
+    def register(self, metric_name: str, condition: NativeCondition,
+                 filter_column_isnull: bool = True):
+        """
+        Register the native condition of a map metric.
+
+        :param metric_name: The name of the map metric (e.g. the map_metric
+            attribute of an expectation).
+        :param condition: The native condition.
+        :param filter_column_isnull: Whether the condition is only evaluated
+            on the non-null values of a column.
+        """
+        self._conditions[metric_name] = (condition, filter_column_isnull, lambda x: ())
+
+    def get_condition(self, metric_name: str) -> Tuple[NativeCondition, bool]:
+        """
+        :param metric_name: The name of the map metric.
+        :return: The native condition and whether null values are filtered.
+        """
+        condition, filter_column_isnull, _ = self._get(metric_name)
+        return condition, filter_column_isnull
+
+    def get_scan_features(self, metric_name: str, metric_value_kwargs: Dict[str, Any]) \
+            -> Tuple[str, ...]:
+        """
+        :param metric_name: The name of the map metric.
+        :param metric_value_kwargs: The value kwargs of the map metric.
+        :return: The scan features the condition is based on.
+        """
+        _, _, get_scan_features = self._get(metric_name)
+        return get_scan_features(metric_value_kwargs)
+
+    def _get(self, metric_name: str) -> Tuple[NativeCondition, bool, Callable]:
+        if metric_name not in self._conditions:
+            self._conditions[metric_name] = _derive_condition(metric_name)
+        return self._conditions[metric_name]
+
+
+# Create a native condition from the pandas implementation of a map metric.
+def _derive_condition(metric_name: str) -> Tuple[NativeCondition, bool, Callable]:
+    provider, provider_fn = get_metric_provider(
+        metric_name + ".condition", PandasExecutionEngine()
+    )
+    # The condition function without the decorators which resolve the domain
+    # of the metric.
+    condition_fn = inspect.unwrap(provider_fn)
+
+    if issubclass(provider, ScannedColumnMapMetricProvider):
+        def scanned_condition(column: NativeColumn, **kwargs):
+            return condition_fn(provider, column.scan, **kwargs, _metrics=dict())
+        return scanned_condition, True, provider.get_scan_features
+
+    def condition(column: NativeColumn, **kwargs):
+        return condition_fn(provider, column.values, **kwargs, _metrics=dict())
+    return condition, True, lambda x: ()
+
+
+default_native_condition_registry: NativeConditionRegistry = NativeConditionRegistry()
+"""
+The default :class:`.NativeConditionRegistry` which is used by
+:func:`validate_column_natively`.
+"""  # pylint: disable=W0105
+
+
+# Native condition of the map metric of Great Expectations which is used by
+# the missing value smell.
+def _not_null(column: NativeColumn, **kwargs):
+    return column.all_values.notnull()
+
+
+default_native_condition_registry.register(
+    "column_values.nonnull", _not_null, filter_column_isnull=False
+)
+
+
+def _create_exception_result(exception: Exception) -> ExpectationValidationResult:
+    # Construct the result in the same way as Validator.graph_validate does.
+    return ExpectationValidationResult(
+        success=False,
+        exception_info={
+            "raised_exception": True,
+            "exception_traceback": traceback.format_exc(),
+            "exception_message": str(exception),
+        },
+    )
+
+
+# Validate expectations of a single column with the Great Expectations
+# validator. Each expectation is validated separately to assign exceptions to
+# the corresponding configuration. The resolved metrics are shared.
+def _validate_with_validator(
+        column: pd.Series,
+        configurations: List[ExpectationConfiguration],
+        runtime_configuration: Dict[str, Any]) -> Dict[int, ExpectationValidationResult]:
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=pd.DataFrame({configurations[0].kwargs["column"]: column}))]
+    )
+    metrics: Dict[Tuple, Any] = dict()
+    results: Dict[int, ExpectationValidationResult] = dict()
+    for configuration in configurations:
+        try:
+            results[id(configuration)] = validator.graph_validate(
+                configurations=[configuration],
+                metrics=metrics,
+                runtime_configuration=runtime_configuration
+            )[0]
+        except Exception as e:  # pylint: disable=W0703
+            results[id(configuration)] = _create_exception_result(e)
+    return results
+
+
+def validate_column_natively(
+        column: pd.Series,
+        configurations: List[ExpectationConfiguration],
+        runtime_configuration: Dict[str, Any],
+        registry: NativeConditionRegistry = default_native_condition_registry) \
+        -> List[ExpectationValidationResult]:
+    """
+    Validate column map expectations of a single column without building and
+    resolving a metric dependency graph.
+
+    The metrics which the expectations are based on (e.g. the number of
+    unexpected values) are computed by evaluating the native condition of the
+    map metric of each expectation. Afterwards, the validation results are
+    built by the expectations themselves. Therefore, the validation results
+    match the results of the Great Expectations validator.
+
+    Expectations which depend on aggregate metrics (see
+    :meth:`.DataSmell.get_aggregate_metrics`), e.g. sketches of approximate
+    modes, cannot be evaluated by native conditions. They are validated by the
+    Great Expectations validator instead.
+
+    :param column: The column to validate (including null values).
+    :param configurations: The expectation configurations of the column.
+    :param runtime_configuration: The runtime configuration
+        (e.g. the result format).
+    :param registry: The registry which stores the native conditions.
+    :return: The validation results in the order of the configurations. If an
+        exception is raised during validation of an expectation, the
+        exception is stored in the corresponding validation result.
+    """
+    # Resolve the metric value kwargs of all expectations first to compute
+    # the scan features of all expectations in a single pass.
+    prepared: List[Tuple[ExpectationConfiguration, Any, Dict[str, Any]]] = []
+    results: Dict[int, ExpectationValidationResult] = dict()
+    scan_features: Set[str] = set()
+    validator_configurations: List[ExpectationConfiguration] = []
+    for configuration in configurations:
+        try:
+            if len(get_aggregate_metrics(configuration)) > 0:
+                validator_configurations.append(configuration)
+                continue
+            expectation = get_expectation_impl(configuration.expectation_type)(configuration)
+            metric_value_kwargs: Dict[str, Any] = dict(get_metric_kwargs(
+                expectation.map_metric + ".condition",
+                configuration,
+                runtime_configuration
+            )["metric_value_kwargs"])
+            scan_features.update(
+                registry.get_scan_features(expectation.map_metric, metric_value_kwargs)
+            )
+            prepared.append((configuration, expectation, metric_value_kwargs))
+        except Exception as e:  # pylint: disable=W0703
+            results[id(configuration)] = _create_exception_result(e)
+
+    native_column = NativeColumn(column, scan_features=scan_features)
+    result_format = parse_result_format(runtime_configuration["result_format"])
+    for configuration, expectation, metric_value_kwargs in prepared:
+        try:
+            condition, filter_column_isnull = registry.get_condition(expectation.map_metric)
+            domain_values = native_column.values if filter_column_isnull \
+                else native_column.all_values
+            unexpected = ~np.asarray(
+                condition(native_column, **metric_value_kwargs), dtype=bool
+            )
+            unexpected_values = domain_values[unexpected]
+            if result_format["result_format"] != "COMPLETE":
+                unexpected_values = unexpected_values[:result_format["partial_unexpected_count"]]
+
+            map_metric: str = expectation.map_metric
+            metrics: Dict[str, Any] = {
+                "table.row_count": len(native_column.all_values),
+                "column_values.nonnull.unexpected_count":
+                    len(native_column.all_values) - len(native_column.values),
+                map_metric + ".unexpected_count": int(np.count_nonzero(unexpected)),
+                map_metric + ".unexpected_values": list(unexpected_values)
+            }
+            if result_format["result_format"] not in ("BOOLEAN_ONLY", "BASIC"):
+                metrics[map_metric + ".unexpected_index_list"] = \
+                    list(domain_values.index[unexpected])
+            results[id(configuration)] = expectation._build_evr(
+                expectation._validate(
+                    configuration=configuration,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration
+                ),
+                configuration
+            )
+        except Exception as e:  # pylint: disable=W0703
+            results[id(configuration)] = _create_exception_result(e)
+
+    if len(validator_configurations) > 0:
+        results.update(
+            _validate_with_validator(column, validator_configurations, runtime_configuration)
+        )
+    return [results[id(x)] for x in configurations]
@@ -0,0 +1,388 @@
+"""
+Compute the statistics of a numeric column which are used by several data
+smells in a single metric.
+
+The extreme value smell (z-scores) and the suspect sign smell (sign and
+quantiles) previously requested the mean, the standard deviation and the
+quantiles of a column as separate Great Expectations metrics. Each of them
+converted and iterated over the column. Instead, the
+:data:`NUMERIC_STATISTICS_METRIC_NAME` metric converts the non-null values of
+a column to a NumPy buffer once and computes all statistics from this buffer.
+The results match the corresponding metrics of Great Expectations (which are
+computed by pandas).
+
+The moments (:data:`MOMENTS_STATE_METRIC_NAME`) and a quantile sketch
+(:data:`QUANTILE_SKETCH_STATE_METRIC_NAME`) of a column are additionally
+provided as mergeable states. They are computed for each chunk of a chunked
+dataset and merged afterwards.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.expectations.metrics import ColumnMetricProvider
+from great_expectations.validator.validation_graph import MetricConfiguration
+
+from .columncache import cached_column_aggregate_value
+from .sketches import DEFAULT_SKETCH_CAPACITY, QuantileSketch
+
+
+NUMERIC_STATISTICS_METRIC_NAME: str = "column.custom.numeric_statistics"
+"""
+Name of the column metric which computes the :class:`.NumericStatistics` of
+the non-null values of a column.
+"""  # pylint: disable=W0105
+
+MOMENTS_STATE_METRIC_NAME: str = "column.custom.moments.state"
+"""
+Name of the column metric which computes the :class:`.RunningMoments` of the
+non-null values of a column. The states of chunks of a column can be merged.
+"""  # pylint: disable=W0105
+
+QUANTILE_SKETCH_STATE_METRIC_NAME: str = "column.custom.quantile_sketch.state"
+"""
+Name of the column metric which computes the
+:class:`~datasmelldetection.detectors.great_expectations.sketches.QuantileSketch`
+of the non-null values of a column. The capacity of the sketch is passed as
+the value kwarg "capacity". The states of chunks of a column can be merged.
+"""  # pylint: disable=W0105
+
+MAD_SCALE_FACTOR: float = 1.4826
+"""
+The factor which scales the median absolute deviation of normally distributed
+values to their standard deviation. Therefore, robust z-scores (see
+:func:`get_robust_z_scores`) are comparable to z-scores.
+"""  # pylint: disable=W0105
+
+
+@dataclass
+class RunningMoments:
+    """
+    The number of values, their mean and the sum of the squared deviations
+    from the mean. The moments of parts of a column can be merged to obtain
+    the moments of the whole column (see :meth:`merge`).
+    """
+
+    count: int
+    """The number of values."""  # pylint: disable=W0105
+
+    mean: float
+    """The mean of the values (NaN if there are no values)."""  # pylint: disable=W0105
+
+    squared_deviation_sum: float
+    """The sum of the squared deviations of the values from their mean."""  # pylint: disable=W0105
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "RunningMoments":
+        """
+        Compute the moments of float values.
+
+        The mean and the standard deviation are computed in the same way as
+        pandas does (see pandas.core.nanops.nanmean and nanvar). Therefore,
+        they match the column.mean and column.standard_deviation metrics of
+        Great Expectations.
+
+        :param values: The float64 values (which must not contain NaN).
+        :return: The moments of the values.
+        """
+        count = len(values)
+        if count == 0:
+            return cls(count=0, mean=np.nan, squared_deviation_sum=0.0)
+        mean = values.sum(dtype=np.float64) / count
+        # NOTE: Like pandas, the deviations of infinite values are NaN.
+        with np.errstate(invalid="ignore"):
+            deviations = np.subtract(mean, values)
+        np.square(deviations, out=deviations)
+        return cls(
+            count=count,
+            mean=float(mean),
+            squared_deviation_sum=float(deviations.sum(dtype=np.float64))
+        )
+
+    @property
+    def variance(self) -> float:
+        """The sample variance (NaN if there are less than two values)."""
+        if self.count < 2:
+            return np.nan
+        return self.squared_deviation_sum / (self.count - 1)
+
+    @property
+    def standard_deviation(self) -> float:
+        """The sample standard deviation (NaN if there are less than two values)."""
+        return float(np.sqrt(self.variance))
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """
+        Merge the moments of two sets of values without modifying them.
+
+        The moments are combined using the pairwise update of Chan et al.
+        which generalizes the streaming algorithm of Welford to sets of
+        values.
+
+        :param other: The moments to merge with these moments.
+        :return: The moments of the values of both sets.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return RunningMoments(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            squared_deviation_sum=self.squared_deviation_sum + other.squared_deviation_sum +
+            delta * delta * self.count * other.count / count
+        )
+
+    def get_z_scores(self, values: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the z-scores of values with respect to these moments.
+
+        :param values: The float64 values.
+        :param out: An optional float64 array with the same length as the
+            values which stores the result (instead of allocating a new array).
+        :return: The z-scores of the values.
+        """
+        # NOTE: Like pandas, NaN is returned if the standard deviation is 0.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = np.subtract(values, self.mean, out=out)
+            return np.divide(z_scores, self.standard_deviation, out=z_scores)
+
+
+@dataclass
+class NumericStatistics:
+    """The statistics of the non-null values of a numeric column."""
+
+    values: np.ndarray
+    """
+    The non-null values as a float64 array. The array is shared by all
+    consumers of the statistics and must not be modified.
+    """  # pylint: disable=W0105
+
+    moments: RunningMoments
+    """The moments of the values."""  # pylint: disable=W0105
+
+    negative_count: int
+    """The number of values which are less than zero."""  # pylint: disable=W0105
+
+    zero_count: int
+    """The number of values which are equal to zero."""  # pylint: disable=W0105
+
+    positive_count: int
+    """The number of values which are greater than zero."""  # pylint: disable=W0105
+
+    @property
+    def count(self) -> int:
+        """The number of non-null values."""
+        return self.moments.count
+
+    @property
+    def mean(self) -> float:
+        """The mean of the values (NaN if there are no values)."""
+        return self.moments.mean
+
+    @property
+    def standard_deviation(self) -> float:
+        """
+        The sample standard deviation of the values (NaN if there are less
+        than two values).
+        """
+        return self.moments.standard_deviation
+
+    def get_quantiles(self, quantiles: Sequence[float]) -> List[float]:
+        """
+        Compute quantiles of the values using linear interpolation.
+
+        The result matches the column.quantile_values metric of Great
+        Expectations with allow_relative_error set to "linear".
+
+        :param quantiles: The quantiles to compute (in the interval [0, 1]).
+        :return: The computed quantiles.
+        """
+        if self.count == 0:
+            return [np.nan] * len(quantiles)
+        # NOTE: pandas computes the quantiles in the same way.
+        return np.percentile(
+            self.values, np.array(quantiles) * 100, interpolation="linear"
+        ).tolist()
+
+    def get_z_scores(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the z-scores of the values.
+
+        The result matches the column_values.z_score.map metric of Great
+        Expectations.
+
+        :param out: An optional float64 array with the same length as the
+            values which stores the result (instead of allocating a new array).
+        :return: The z-scores of the values.
+        """
+        return self.moments.get_z_scores(self.values, out=out)
+
+
+# The types (see pandas.api.types.infer_dtype) of object columns whose values
+# can be converted to floats. pandas computes the mean of such columns.
+_NUMERIC_INFERRED_TYPES = {
+    "empty", "boolean", "integer", "floating", "mixed-integer-float", "decimal"
+}
+
+
+def compute_numeric_statistics(column: pd.Series) -> NumericStatistics:
+    """
+    Compute the statistics of the values of a numeric column.
+
+    The values are converted to float64. Therefore, the statistics of
+    float32 columns may differ slightly from the ones pandas computes.
+
+    :param column: The non-null values of the column.
+    :return: The computed statistics.
+    :raises TypeError: If the column contains non-numeric values.
+    """
+    kind = column.dtype.kind
+    if kind not in ("b", "i", "u", "f") and not (
+            kind == "O" and pd.api.types.infer_dtype(column) in _NUMERIC_INFERRED_TYPES):
+        raise TypeError("Cannot compute numeric statistics of a non-numerical column.")
+    values = column.to_numpy(dtype=np.float64)
+
+    negative_count = int(np.count_nonzero(values < 0))
+    zero_count = int(np.count_nonzero(values == 0))
+    return NumericStatistics(
+        values=values,
+        moments=RunningMoments.from_values(values),
+        negative_count=negative_count,
+        zero_count=zero_count,
+        positive_count=len(values) - negative_count - zero_count
+    )
+
+
+def get_robust_z_scores(values: np.ndarray, sketch: QuantileSketch,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute robust z-scores of values, i.e. their deviations from the median
+    divided by the scaled median absolute deviation (see
+    :data:`MAD_SCALE_FACTOR`).
+
+    :param values: The float64 values.
+    :param sketch: The quantile sketch of the column which the median and the
+        median absolute deviation are computed from.
+    :param out: An optional float64 array with the same length as the values
+        which stores the result (instead of allocating a new array).
+    :return: The robust z-scores of the values. If the median absolute
+        deviation is 0, the robust z-score is 0 for values equal to the
+        median and infinite otherwise.
+    """
+    median = sketch.get_quantiles([0.5])[0]
+    scale = MAD_SCALE_FACTOR * sketch.get_median_absolute_deviation()
+    z_scores = np.subtract(values, median, out=out)
+    if scale == 0:
+        return np.copysign(np.where(z_scores == 0, 0, np.inf), z_scores, out=z_scores)
+    return np.divide(z_scores, scale, out=z_scores)
+
+
+def has_fractional_part(column: pd.Series, epsilon: float) -> np.ndarray:
+    """
+    Check whether the absolute difference between the values of a column and
+    the nearest integers exceeds epsilon.
+
+    Float columns are evaluated in a single buffer without allocating
+    intermediate series.
+
+    :param column: The values to check.
+    :param epsilon: The maximum difference between a value and the nearest
+        integer for which the value is considered to be an integer.
+    :return: Boolean array where True indicates that the value has a
+        fractional part.
+    """
+    values = column.to_numpy()
+    if values.dtype.kind != "f":
+        return ((column - column.round(decimals=0)).abs() > epsilon).to_numpy(dtype=bool)
+    differences = np.round(values)
+    # NOTE: Infinite values have no fractional part (like in pandas).
+    with np.errstate(invalid="ignore"):
+        np.subtract(values, differences, out=differences)
+    np.abs(differences, out=differences)
+    return differences > epsilon
+
+
+class ColumnNumericStatistics(ColumnMetricProvider):
+    """
+    Compute the :class:`.NumericStatistics` of the non-null values of a column
+    (see :data:`NUMERIC_STATISTICS_METRIC_NAME`).
+    """
+
+    metric_name = NUMERIC_STATISTICS_METRIC_NAME
+
+    @cached_column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        return compute_numeric_statistics(column)
+
+
+# Return the configuration of the numeric statistics metric on the domain of
+# a metric which is derived from the statistics.
+def _get_numeric_statistics_configuration(metric: MetricConfiguration) -> MetricConfiguration:
+    return MetricConfiguration(
+        metric_name=NUMERIC_STATISTICS_METRIC_NAME,
+        metric_domain_kwargs={
+            k: v for k, v in metric.metric_domain_kwargs.items()
+            if k in ColumnNumericStatistics.domain_keys
+        },
+        metric_value_kwargs=dict()
+    )
+
+
+class _NumericStatisticsStateProvider(ColumnMetricProvider):
+    # Base class of the metrics which derive a mergeable state from the
+    # numeric statistics of a column.
+
+    @classmethod
+    def _get_evaluation_dependencies(
+            cls,
+            metric: MetricConfiguration,
+            configuration: Optional[ExpectationConfiguration] = None,
+            execution_engine: Optional[ExecutionEngine] = None,
+            runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: Dict[str, Any] = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        dependencies[NUMERIC_STATISTICS_METRIC_NAME] = \
+            _get_numeric_statistics_configuration(metric)
+        return dependencies
+
+
+class ColumnMomentsState(_NumericStatisticsStateProvider):
+    """
+    Compute the :class:`.RunningMoments` of the non-null values of a column
+    (see :data:`MOMENTS_STATE_METRIC_NAME`).
+    """
+
+    metric_name = MOMENTS_STATE_METRIC_NAME
+
+    @cached_column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, _metrics, **kwargs):
+        return _metrics[NUMERIC_STATISTICS_METRIC_NAME].moments
+
+
+class ColumnQuantileSketchState(_NumericStatisticsStateProvider):
+    """
+    Compute the
+    :class:`~datasmelldetection.detectors.great_expectations.sketches.QuantileSketch`
+    of the non-null values of a column (see
+    :data:`QUANTILE_SKETCH_STATE_METRIC_NAME`).
+    """
+
+    metric_name = QUANTILE_SKETCH_STATE_METRIC_NAME
+    value_keys = ("capacity",)
+
+    @cached_column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, _metrics, capacity=DEFAULT_SKETCH_CAPACITY, **kwargs):
+        return QuantileSketch.from_values(
+            _metrics[NUMERIC_STATISTICS_METRIC_NAME].values, capacity=capacity
+        )
@@ -0,0 +1,132 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validator import (
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+    Validator
+)
+
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+
+
+# The runtime configuration which Validator.validate uses by default.
+_RUNTIME_CONFIGURATION: Dict[str, Any] = {
+    "catch_exceptions": True,
+    "result_format": {"result_format": "BASIC"}
+}
+
+# The dataframe to validate in a worker process. It is set once per worker by
+# the initializer of the process pool to avoid passing the dataframe to each
+# task.
+_worker_dataframe: Optional[pd.DataFrame] = None
+
+
+def _initialize_worker(dataframe: pd.DataFrame):
+    global _worker_dataframe
+    _worker_dataframe = dataframe
+
+
+def _validate_expectations(configurations: List[ExpectationConfiguration]) \
+        -> List[ExpectationValidationResult]:
+    # Import the modules of the expectations (required if worker processes
+    # are spawned instead of forked)
+    default_registry.load_expectations(x.expectation_type for x in configurations)
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=_worker_dataframe)]
+    )
+    return validator.graph_validate(
+        configurations=configurations,
+        runtime_configuration=_RUNTIME_CONFIGURATION
+    )
+
+
+# Group the expectations by column in the same way as Validator.validate does.
+def _group_expectations_by_column(suite: ExpectationSuite) \
+        -> List[List[ExpectationConfiguration]]:
+    columns: Dict[Any, List[ExpectationConfiguration]] = dict()
+    for expectation in suite.expectations:
+        column = expectation.kwargs.get("column", "_nocolumn")
+        columns.setdefault(column, []).append(expectation)
+    return list(columns.values())
+
+
+# Combine validation results like Validator.validate does.
+def _build_suite_validation_result(results: List[ExpectationValidationResult],
+                                   suite: ExpectationSuite) -> ExpectationSuiteValidationResult:
+    # NOTE: The success percent is None if no expectations are evaluated.
+    evaluated_expectations = len(results)
+    successful_expectations = sum(bool(result.success) for result in results)
+    success_percent: Optional[float] = None
+    if evaluated_expectations > 0:
+        success_percent = successful_expectations / evaluated_expectations * 100
+    return ExpectationSuiteValidationResult(
+        results=results,
+        success=successful_expectations == evaluated_expectations,
+        statistics={
+            "evaluated_expectations": evaluated_expectations,
+            "successful_expectations": successful_expectations,
+            "unsuccessful_expectations": evaluated_expectations - successful_expectations,
+            "success_percent": success_percent,
+        },
+        meta={
+            "expectation_suite_name": suite.expectation_suite_name
+        }
+    )
+
+
+def iter_validate_in_parallel(dataframe: pd.DataFrame, suite: ExpectationSuite,
+                              max_workers: int) -> Iterator[ExpectationSuiteValidationResult]:
+    """
+    Validate an expectation suite using a pool of worker processes and yield
+    the validation results column by column.
+
+    The expectations are split by column and the expectations of each column
+    are validated in a separate task. The dataframe is passed to each worker
+    process only once. The columns are yielded in the order in which
+    :meth:`great_expectations.validator.validator.Validator.validate` orders
+    the validation results.
+
+    :param dataframe: The dataframe to validate.
+    :param suite: The expectation suite to validate.
+    :param max_workers: The maximum number of worker processes.
+    :return: An iterator over the validation results of the expectations of
+        each column.
+    """
+    expectation_groups = _group_expectations_by_column(suite)
+    if len(expectation_groups) == 0:
+        return
+
+    with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(expectation_groups)),
+            initializer=_initialize_worker,
+            initargs=(dataframe,)) as executor:
+        for group_results in executor.map(_validate_expectations, expectation_groups):
+            yield _build_suite_validation_result(group_results, suite)
+
+
+def validate_in_parallel(dataframe: pd.DataFrame, suite: ExpectationSuite,
+                         max_workers: int) -> ExpectationSuiteValidationResult:
+    """
+    Validate an expectation suite using a pool of worker processes.
+
+    The expectations are split by column and the expectations of each column
+    are validated in a separate task (see :func:`iter_validate_in_parallel`).
+    The validation results are ordered like the results of
+    :meth:`great_expectations.validator.validator.Validator.validate`.
+
+    :param dataframe: The dataframe to validate.
+    :param suite: The expectation suite to validate.
+    :param max_workers: The maximum number of worker processes.
+    :return: The validation result of the whole suite.
+    """
+    results: List[ExpectationValidationResult] = []
+    for group_result in iter_validate_in_parallel(dataframe, suite, max_workers):
+        results.extend(group_result.results)
+
+    return _build_suite_validation_result(results, suite)
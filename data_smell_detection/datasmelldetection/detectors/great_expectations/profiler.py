@@ -1,15 +1,22 @@
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Optional, Tuple
 
 from copy import deepcopy
 from datasmelldetection.core import DataSmellType
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfilerBase
 from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.profile.base import ProfilerDataType
 
 from datasmelldetection.detectors.great_expectations.datasmell import (
     DataSmellRegistry,
     default_registry
 )
+from datasmelldetection.detectors.great_expectations.cache import compute_column_hash
+from datasmelldetection.detectors.great_expectations.scanner import SCAN_FEATURES_META_KEY
+from datasmelldetection.detectors.great_expectations.type_inference import (
+    ColumnTypeCache,
+    infer_column_type
+)
 
 
 # Create a configuration dictionary for data smells. The registry is used to
@@ -26,6 +33,63 @@ def _create_data_smell_configuration_dict(registry: DataSmellRegistry) \
     return result
 
 
+# Whether kwargs only contain immutable values. Such kwargs do not have to be
+# deep-copied for each column.
+def _has_immutable_values(kwargs: Dict[str, Any]) -> bool:
+    return all(isinstance(x, (str, int, float, bool, type(None))) for x in kwargs.values())
+
+
+class _ColumnExpectationsTemplate:
+    # The expectations which are generated for each column of a profiler data
+    # type. The kwargs and the scan features are computed once and copied for
+    # each column.
+
+    def __init__(self, type_: ProfilerDataType, registry: DataSmellRegistry,
+                 data_smell_configuration: Dict[DataSmellType, Dict[str, Any]],
+                 fused_scan: bool):
+        # NOTE: An expectation type which is registered for several data
+        # smells is only generated once (like ExpectationSuite.add_expectation
+        # replaces expectations of the same domain).
+        expectations: Dict[str, Tuple[Dict[str, Any], bool]] = dict()
+        expectation_dict = registry.get_smell_dict_for_profiler_data_type(type_)
+        for data_smell_type, expectation_type in expectation_dict.items():
+            if data_smell_type not in data_smell_configuration:
+                # Data smell type should not be considered
+                continue
+
+            # Use provided kwargs for the corresponding data smell type
+            kwargs: Dict[str, Any] = deepcopy(data_smell_configuration[data_smell_type])
+            expectations[expectation_type] = (kwargs, _has_immutable_values(kwargs))
+        # Import the modules of the expectations which are not registered at
+        # Great Expectations yet.
+        registry.load_expectations(expectations)
+        self._expectations: List[Tuple[str, Dict[str, Any], bool]] = [
+            (expectation_type, kwargs, immutable)
+            for expectation_type, (kwargs, immutable) in expectations.items()
+        ]
+
+        # Request the scan features of all expectations of the column from
+        # each expectation. This results in a single scan of the column.
+        scan_features: Set[str] = set()
+        if fused_scan:
+            for expectation_type in expectations:
+                scan_features.update(registry.get_scan_features(expectation_type))
+        self._scan_features: List[str] = sorted(scan_features)
+
+    def instantiate(self, column: str) -> List[ExpectationConfiguration]:
+        configurations: List[ExpectationConfiguration] = []
+        for expectation_type, kwargs, immutable in self._expectations:
+            column_kwargs: Dict[str, Any] = dict(kwargs) if immutable else deepcopy(kwargs)
+            column_kwargs["column"] = column
+            configuration = ExpectationConfiguration(
+                expectation_type=expectation_type, kwargs=column_kwargs
+            )
+            if self._scan_features:
+                configuration.meta[SCAN_FEATURES_META_KEY] = list(self._scan_features)
+            configurations.append(configuration)
+        return configurations
+
+
 class DataSmellAwareProfiler(BasicDatasetProfilerBase):
     """
     A Great Expectations based profiler for data smell detection.
@@ -70,8 +134,49 @@ class DataSmellAwareProfiler(BasicDatasetProfilerBase):
         to the specified columns. Columns which are specified in the set but
         are not present in a dataset to profile are ignored. If this key is not
         provided it is assumed that all columns should be processed.
+
+    fused_scan:
+        A boolean which controls whether the values of a column are scanned
+        only once for all expectations of the column which are based on
+        scan features (see
+        :mod:`~datasmelldetection.detectors.great_expectations.scanner`). If
+        this key is not provided, the fused scan is used. Otherwise, each
+        expectation scans the column separately.
+
+    strict_type_inference:
+        A boolean which controls how the types of the columns are determined.
+        If this key is not provided or False, the type of a column is derived
+        from its dtype and (for object columns) a sample of its values (see
+        :func:`~datasmelldetection.detectors.great_expectations.type_inference.infer_column_type`).
+        Otherwise, the expectations of the basic dataset profiler of Great
+        Expectations check the types of all values.
+
+    column_type_cache:
+        The
+        :class:`~datasmelldetection.detectors.great_expectations.type_inference.ColumnTypeCache`
+        which stores the types of the columns which are determined by strict
+        type inference. The types are stored under a hash of the content of
+        the columns. If this key is not provided or None, the types are not
+        cached. The types which are derived from the dtype and a sample of a
+        column are never cached.
     """
 
+    @classmethod
+    def _infer_column_type(cls, df, column: str, strict: bool,
+                           cache: Optional[ColumnTypeCache]) -> ProfilerDataType:
+        if not strict:
+            return infer_column_type(df[column])
+        if cache is None:
+            return cls._get_column_type(df, column)
+
+        # The type of strict mode depends on all values of the column.
+        column_hash: str = compute_column_hash(df[column])
+        type_: Optional[ProfilerDataType] = cache.get(column_hash)
+        if type_ is None:
+            type_ = cls._get_column_type(df, column)
+            cache.put(column_hash, type_)
+        return type_
+
     @classmethod
     def _profile(cls, dataset, configuration=None) -> ExpectationSuite:
         df = dataset
@@ -109,31 +214,31 @@ class DataSmellAwareProfiler(BasicDatasetProfilerBase):
             specified_column_names = configuration["column_names"]
             columns = [x for x in columns if x in specified_column_names]
 
+        fused_scan: bool = configuration.get("fused_scan", True)
+        strict_type_inference: bool = configuration.get("strict_type_inference", False)
+        column_type_cache: Optional[ColumnTypeCache] = configuration.get("column_type_cache")
+
         # Store information about the column types (needed for analysis)
         meta_columns: Dict[str, Dict[str, str]] = {}
         for column in columns:
             meta_columns[column] = {}
 
+        templates: Dict[ProfilerDataType, _ColumnExpectationsTemplate] = dict()
         for column in columns:
-            type_ = cls._get_column_type(df, column)
+            type_ = cls._infer_column_type(
+                df, column, strict_type_inference, column_type_cache
+            )
 
             meta_columns[column]["type"] = str(type_)
 
-            # Parameters used to evaluate expectation later on.
-            expectation_dict = registry.get_smell_dict_for_profiler_data_type(type_)
-            for data_smell_type, expectation_type in expectation_dict.items():
-                if data_smell_type not in data_smell_configuration:
-                    # Data smell type should not be considered
-                    continue
-
-                # Use provided kwargs for the corresponding data smell type
-                kwargs: Dict[str, Any] = deepcopy(data_smell_configuration[data_smell_type])
-                kwargs["column"] = column
-
-                config = ExpectationConfiguration(
-                    expectation_type=expectation_type, kwargs=kwargs
+            # The expectations of all columns of a type are instantiated from
+            # the same template. The expectations are appended to the suite
+            # since the columns (and therefore the domains) are distinct.
+            if type_ not in templates:
+                templates[type_] = _ColumnExpectationsTemplate(
+                    type_, registry, data_smell_configuration, fused_scan
                 )
-                expectation_suite.add_expectation(config)
+            expectation_suite.expectations.extend(templates[type_].instantiate(column))
 
         # Add column type information to the expectation suite.
         expectation_suite.meta["columns"] = meta_columns
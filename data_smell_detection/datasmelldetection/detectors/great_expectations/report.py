@@ -0,0 +1,168 @@
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+import json
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class Measurement:
+    """The resources used by a single phase of the data smell detection."""
+
+    phase: str
+    """
+    The name of the measured phase ("profiling", "validation" or
+    "conversion").
+    """  # pylint: disable=W0105
+
+    wall_time: float
+    """The elapsed wall time in seconds."""  # pylint: disable=W0105
+
+    row_count: int
+    """The number of rows which were processed in the phase."""  # pylint: disable=W0105
+
+    rows_per_second: float
+    """
+    The number of processed rows per second (0 if no time was measured).
+    """  # pylint: disable=W0105
+
+    peak_memory: int
+    """
+    The peak size of the memory blocks in bytes which were allocated during
+    the phase (see :mod:`tracemalloc`).
+    """  # pylint: disable=W0105
+
+    column_name: Optional[str] = None
+    """The column the phase was performed for (if any)."""  # pylint: disable=W0105
+
+    expectation_type: Optional[str] = None
+    """The expectation which was validated (if any)."""  # pylint: disable=W0105
+
+
+@dataclass
+class DetectionReport:
+    """
+    The resources used by the phases of a data smell detection run (see
+    :meth:`.GreatExpectationsDetector.detect_with_report`).
+    """
+
+    row_count: int
+    """The number of rows of the dataset."""  # pylint: disable=W0105
+
+    measurements: List[Measurement] = field(default_factory=list)
+    """The measurements in the order the phases were performed."""  # pylint: disable=W0105
+
+    @property
+    def wall_time(self) -> float:
+        """The total wall time of all measured phases in seconds."""
+        return sum(x.wall_time for x in self.measurements)
+
+    def get_measurements(self, phase: Optional[str] = None) -> List[Measurement]:
+        """
+        :param phase: The name of the phase. If it is None, the measurements
+            of all phases are returned.
+        :return: The measurements of the phase.
+        """
+        return [x for x in self.measurements if phase is None or x.phase == phase]
+
+    def get_column_measurements(self, phase: str) -> List[Measurement]:
+        """
+        Combine the measurements of a phase per column.
+
+        :param phase: The name of the phase.
+        :return: A measurement per column which contains the total wall time
+            and the maximum peak memory of all measurements of the column.
+        """
+        measurements: Dict[Optional[str], List[Measurement]] = dict()
+        for measurement in self.get_measurements(phase):
+            measurements.setdefault(measurement.column_name, []).append(measurement)
+
+        return [
+            _create_measurement(
+                phase=phase,
+                wall_time=sum(x.wall_time for x in column_measurements),
+                row_count=column_measurements[0].row_count,
+                peak_memory=max(x.peak_memory for x in column_measurements),
+                column_name=column_name
+            )
+            for column_name, column_measurements in measurements.items()
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: The report as a dictionary which can be serialized to JSON.
+        """
+        report = asdict(self)
+        report["wall_time"] = self.wall_time
+        return report
+
+    def to_json(self, **kwargs) -> str:
+        """
+        :param kwargs: Additional kwargs which are passed to :func:`json.dumps`.
+        :return: The report serialized as JSON.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def _create_measurement(phase: str, wall_time: float, row_count: int, peak_memory: int,
+                        column_name: Optional[str] = None,
+                        expectation_type: Optional[str] = None) -> Measurement:
+    return Measurement(
+        phase=phase,
+        wall_time=wall_time,
+        row_count=row_count,
+        rows_per_second=row_count / wall_time if wall_time > 0 else 0.0,
+        peak_memory=peak_memory,
+        column_name=column_name,
+        expectation_type=expectation_type
+    )
+
+
+@contextmanager
+def measure(report: Optional[DetectionReport], phase: str, row_count: int,
+            column_name: Optional[str] = None,
+            expectation_type: Optional[str] = None) -> Iterator[None]:
+    """
+    Measure the wall time and the peak allocated memory of the enclosed block
+    and add the measurement to a report. Measurements must not be nested.
+
+    :param report: The report to add the measurement to. If it is None,
+        nothing is measured.
+    :param phase: The name of the measured phase.
+    :param row_count: The number of rows which are processed in the block.
+    :param column_name: The column which is processed in the block (if any).
+    :param expectation_type: The expectation which is validated in the block
+        (if any).
+    """
+    if report is None:
+        yield
+        return
+
+    # NOTE: If memory allocations are already traced by the caller, the peak
+    # can only be reset on Python 3.9 or later. Otherwise, the peak since the
+    # caller started tracing is reported.
+    was_tracing = tracemalloc.is_tracing()
+    reset_peak = getattr(tracemalloc, "reset_peak", None)
+    if not was_tracing:
+        tracemalloc.start()
+    elif reset_peak is not None:
+        reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall_time = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        if not was_tracing:
+            tracemalloc.stop()
+
+        report.measurements.append(_create_measurement(
+            phase=phase,
+            wall_time=wall_time,
+            row_count=row_count,
+            peak_memory=max(peak - baseline, 0),
+            column_name=column_name,
+            expectation_type=expectation_type
+        ))
@@ -0,0 +1,506 @@
+import re
+from functools import wraps
+from typing import (
+    Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Pattern, Sequence, Tuple
+)
+
+import numpy as np
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.execution_engine import (
+    MetricDomainTypes,
+    MetricPartialFunctionTypes,
+)
+from great_expectations.expectations.metrics import ColumnMetricProvider
+from great_expectations.expectations.metrics.metric_provider import metric_partial
+from great_expectations.validator.validation_graph import MetricConfiguration
+
+from .columncache import (
+    CachedColumnMapMetricProvider,
+    cached_column_aggregate_value,
+    get_cached_column,
+)
+
+
+SCAN_METRIC_NAME: str = "column.custom.fused_scan"
+"""
+Name of the column metric which computes all requested scan features of a
+column in a single pass.
+"""  # pylint: disable=W0105
+
+SCAN_FEATURES_META_KEY: str = "scan_features"
+"""
+Key of the expectation configuration meta dictionary which stores the scan
+features that are computed for the corresponding column. The
+:class:`~datasmelldetection.detectors.great_expectations.profiler.DataSmellAwareProfiler`
+stores the union of the scan features of all expectations of a column under
+this key.
+"""  # pylint: disable=W0105
+
+REGEX_SCAN_FEATURE_PREFIX: str = "regex:"
+
+ScanFeatureExtractor = Callable[[Any], Any]
+
+VectorizedScanFeatureExtractor = Callable[[pd.Series], Optional[np.ndarray]]
+
+
+def regex_scan_feature(regex: str) -> str:
+    """
+    Get the name of the scan feature which stores whether the string
+    representation of a value contains a match of the passed regex.
+
+    :param regex: The regular expression to search for.
+    :return: The name of the corresponding scan feature.
+    """
+    return REGEX_SCAN_FEATURE_PREFIX + regex
+
+
+def _create_regex_extractor(regex: str) -> ScanFeatureExtractor:
+    pattern: Pattern = re.compile(regex)
+
+    # NOTE: The semantics match the column_values.not_match_regex metric of
+    # Great Expectations which searches the string representation of a value.
+    def contains_match(element: Any) -> bool:
+        return pattern.search(str(element)) is not None
+    return contains_match
+
+
+# Regexes which are an anchored alternation of literals (e.g. ^(UNK|N/A)$).
+# Whether the string representation of a value contains a match of such a
+# regex is decided by a set lookup instead of a search.
+_LITERAL_CHARACTERS: str = r'[^\\.^$*+?{}\[\]|()]'
+_LITERAL_ALTERNATION_PATTERN: Pattern = re.compile(
+    rf'\^\((?:\?:)?((?:{_LITERAL_CHARACTERS}+\|)*{_LITERAL_CHARACTERS}+)\)\$'
+)
+
+
+def _get_literals(regex: str) -> Optional[FrozenSet[str]]:
+    match = _LITERAL_ALTERNATION_PATTERN.fullmatch(regex)
+    if match is None:
+        return None
+    literals = match.group(1).split("|")
+    # NOTE: $ also matches before a trailing newline.
+    return frozenset(literals + [x + "\n" for x in literals])
+
+
+class RegexMatcher:
+    """
+    Match multiple regular expressions against the values of a column in a
+    single pass.
+
+    Like the regex scan features (see :func:`regex_scan_feature`), the string
+    representation of each value is searched for a match of each regex. The
+    result of a value is a bitmask whose i-th bit is set if the i-th regex
+    matched. Regexes which are an anchored alternation of literals (e.g.
+    ``^(UNK|N/A)$``) are evaluated by a set lookup.
+    """
+
+    max_regex_count: int = 64
+    """The maximum number of regexes which can be matched at once."""  # pylint: disable=W0105
+
+    def __init__(self, regexes: Sequence[str]):
+        """
+        :param regexes: The regular expressions to match.
+        :raises ValueError: If more than :attr:`max_regex_count` regexes are
+            passed.
+        """
+        if len(regexes) > self.max_regex_count:
+            raise ValueError(f"At most {self.max_regex_count} regexes can be matched at once.")
+        self._regexes: Tuple[str, ...] = tuple(regexes)
+        self._literals: List[Tuple[int, FrozenSet[str]]] = list()
+        self._searches: List[Tuple[int, Callable[[str], Any]]] = list()
+        for i, regex in enumerate(regexes):
+            literals = _get_literals(regex)
+            if literals is None:
+                self._searches.append((1 << i, re.compile(regex).search))
+            else:
+                self._literals.append((1 << i, literals))
+
+    @property
+    def regexes(self) -> Tuple[str, ...]:
+        """The matched regexes in the order of the bits of the bitmasks."""
+        return self._regexes
+
+    def match(self, values: pd.Series) -> np.ndarray:
+        """
+        Match the regexes against values.
+
+        :param values: The values to match.
+        :return: The bitmasks of the values as an array of 64 bit unsigned
+            integers.
+        """
+        strings: List[str] = list(map(str, values.tolist()))
+        bitmasks = np.zeros(len(strings), dtype=np.uint64)
+        if len(self._literals) > 0:
+            string_series = pd.Series(strings, dtype=object)
+            for bit, literals in self._literals:
+                bitmasks[string_series.isin(literals).to_numpy(dtype=bool)] |= np.uint64(bit)
+        for bit, search in self._searches:
+            matches = np.fromiter((search(x) is not None for x in strings), dtype=bool,
+                                  count=len(strings))
+            bitmasks[matches] |= np.uint64(bit)
+        return bitmasks
+
+
+class ScanFeatureRegistry:
+    """Store the functions which compute scan features for single values."""
+
+    def __init__(self):
+        # Type: Dict[str, ScanFeatureExtractor]
+        self._extractors = dict()
+        # Type: Dict[str, VectorizedScanFeatureExtractor]
+        self._vectorized_extractors = dict()
+
+    def register(self, name: str, extractor: ScanFeatureExtractor,
+                 vectorized_extractor: Optional[VectorizedScanFeatureExtractor] = None):
+        """
+        Register a function which computes a scan feature for a single column
+        value.
+
+        :param name: The name of the scan feature.
+        :param extractor: A function which is called with a single non-null
+            column value and returns the value of the feature.
+        :param vectorized_extractor: An optional function which computes the
+            feature for all values at once. It is called with a series of
+            non-null values and returns an array which is aligned with the
+            series. It may return None if it does not support the values
+            (e.g. values which are not strings). In this case, the extractor
+            is called for each value. Both functions must compute the same
+            feature values.
+        """
+        self._extractors[name] = extractor
+        if vectorized_extractor is None:
+            self._vectorized_extractors.pop(name, None)
+        else:
+            self._vectorized_extractors[name] = vectorized_extractor
+
+    def get_vectorized_extractor(self, name: str) -> Optional[VectorizedScanFeatureExtractor]:
+        """
+        :param name: The name of the scan feature.
+        :return: The function which computes the scan feature for all values
+            at once or None if no such function is registered.
+        """
+        return self._vectorized_extractors.get(name)
+
+    def get_extractor(self, name: str) -> ScanFeatureExtractor:
+        """
+        Get the function which computes a specific scan feature.
+
+        Regex scan features (see :func:`regex_scan_feature`) do not have to be
+        registered.
+
+        :param name: The name of the scan feature.
+        :return: The function which computes the scan feature.
+        """
+        if name not in self._extractors and name.startswith(REGEX_SCAN_FEATURE_PREFIX):
+            self._extractors[name] = \
+                _create_regex_extractor(name[len(REGEX_SCAN_FEATURE_PREFIX):])
+        if name not in self._extractors:
+            raise KeyError(f"Scan feature {name} is not registered.")
+        return self._extractors[name]
+
+
+default_scan_feature_registry: ScanFeatureRegistry = ScanFeatureRegistry()
+"""
+The default :class:`.ScanFeatureRegistry` which is used by the
+:class:`.ColumnFusedScan` metric.
+"""  # pylint: disable=W0105
+
+
+class ColumnScan:
+    """
+    The scan features of the non-null values of a column.
+
+    The values of each feature are stored as an array which is aligned with
+    `index`. If the computation of a feature raised an exception, the exception
+    is raised again when the feature is accessed. This preserves the behaviour
+    of metrics which evaluate their values separately (only the expectations
+    which use the failing feature fail).
+    """
+
+    def __init__(self, index: pd.Index, features: Dict[str, np.ndarray],
+                 errors: Dict[str, Exception]):
+        self._index = index
+        self._features = features
+        self._errors = errors
+
+    @property
+    def index(self) -> pd.Index:
+        """The index of the scanned (non-null) values."""
+        return self._index
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._features or name in self._errors
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name in self._errors:
+            raise self._errors[name]
+        return self._features[name]
+
+
+def factorize_values(column: pd.Series) -> Optional[Tuple[np.ndarray, pd.Series]]:
+    """
+    Encode the values of a column as codes into the list of its distinct
+    values.
+
+    Floats are distinguished by their bit patterns (e.g. 0.0 and -0.0 are
+    different values).
+
+    :param column: The column to factorize.
+    :return: The code of each value and the distinct values (in order of
+        their first occurrence, with the index of that occurrence). None is
+        returned if the distinct values can't be determined safely. This is
+        the case for object columns which contain values of different types
+        (e.g. 1 and "1" or 1 and 1.0 which are equal but have a different
+        string representation).
+    """
+    kind: str = column.dtype.kind
+    if kind == "f":
+        # NOTE: The bit patterns are factorized to distinguish 0.0 and -0.0.
+        values = np.ascontiguousarray(column.values)
+        codes, _ = pd.factorize(values.view(f"i{values.dtype.itemsize}"))
+    elif kind in ("i", "u", "b", "M") or \
+            (kind == "O" and pd.api.types.infer_dtype(column, skipna=False) == "string"):
+        codes, _ = pd.factorize(column)
+    else:
+        return None
+
+    # The position of the first occurrence of each distinct value (the codes
+    # are assigned in order of appearance). Assigning in reverse order leaves
+    # the first occurrence.
+    first_positions = np.empty(codes.max(initial=-1) + 1, dtype=np.intp)
+    first_positions[codes[::-1]] = np.arange(len(codes) - 1, -1, -1)
+    return codes, column.iloc[first_positions]
+
+
+def scan_column(column: pd.Series, feature_names: Iterable[str],
+                registry: ScanFeatureRegistry = default_scan_feature_registry) \
+        -> ColumnScan:
+    """
+    Compute multiple scan features of a column by iterating over the values
+    of the column only once.
+
+    The features are computed once per distinct value and assigned to the
+    values of the column afterwards. This reduces the number of extractor
+    calls of low-cardinality columns to the number of distinct values. The
+    extractors must therefore only depend on the passed value. Features with
+    a vectorized extractor (see :meth:`.ScanFeatureRegistry.register`) are
+    computed for all distinct values at once. Regex features (see
+    :func:`regex_scan_feature`) are matched together by a
+    :class:`.RegexMatcher`.
+
+    :param column: The column to scan. Null values must have been removed.
+    :param feature_names: The names of the features to compute.
+    :param registry: The registry which stores the feature extractors.
+    :return: The computed features.
+    """
+    names: List[str] = list(dict.fromkeys(feature_names))
+    extractors: List[ScanFeatureExtractor] = [registry.get_extractor(x) for x in names]
+    outputs: List[List[Any]] = [list() for _ in names]
+    errors: Dict[str, Exception] = dict()
+
+    # The (distinct) values the features are computed for
+    codes: Optional[np.ndarray] = None
+    values: pd.Series = column
+    factorized = factorize_values(column) if len(names) > 0 else None
+    if factorized is not None:
+        codes, values = factorized
+
+    # Features which are computed for all (distinct) values at once.
+    vectorized_features: Dict[str, np.ndarray] = dict()
+    regex_names: List[str] = list()
+    for name in names:
+        vectorized_extractor = registry.get_vectorized_extractor(name)
+        if vectorized_extractor is not None:
+            feature = vectorized_extractor(values)
+            if feature is not None:
+                vectorized_features[name] = np.asarray(feature)
+        elif name.startswith(REGEX_SCAN_FEATURE_PREFIX):
+            regex_names.append(name)
+
+    # The regex features are matched together (see RegexMatcher).
+    for start in range(0, len(regex_names), RegexMatcher.max_regex_count):
+        group = regex_names[start:start + RegexMatcher.max_regex_count]
+        matcher = RegexMatcher([x[len(REGEX_SCAN_FEATURE_PREFIX):] for x in group])
+        try:
+            bitmasks = matcher.match(values)
+        except Exception as e:  # pylint: disable=W0703
+            errors.update({x: e for x in group})
+            continue
+        for i, name in enumerate(group):
+            vectorized_features[name] = (bitmasks & np.uint64(1 << i)) != 0
+
+    # Indices of the features which are still computed. A feature is dropped
+    # once the corresponding extractor raised an exception.
+    active: List[int] = [
+        i for i, x in enumerate(names) if x not in vectorized_features and x not in errors
+    ]
+    # NOTE: tolist() yields the same Python scalars as Series.map which has
+    # previously been used to evaluate the values.
+    elements: List[Any] = values.tolist() if len(active) > 0 else []
+    for element in elements:
+        failed: bool = False
+        for i in active:
+            try:
+                outputs[i].append(extractors[i](element))
+            except Exception as e:  # pylint: disable=W0703
+                errors[names[i]] = e
+                failed = True
+        if failed:
+            active = [i for i in active if names[i] not in errors]
+
+    features: Dict[str, np.ndarray] = dict()
+    for name, output in zip(names, outputs):
+        if name in errors:
+            continue
+        feature = vectorized_features[name] if name in vectorized_features else np.array(output)
+        # Assign the features of the distinct values to the values of the
+        # column.
+        features[name] = feature if codes is None else feature[codes]
+    return ColumnScan(index=column.index, features=features, errors=errors)
+
+
+class ColumnFusedScan(ColumnMetricProvider):
+    """Compute all requested scan features of a column in a single pass."""
+
+    metric_name = SCAN_METRIC_NAME
+    value_keys = ("features",)
+
+    @cached_column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, features, **kwargs):
+        # NOTE: The column contains the cached non-null values (see
+        # ColumnCache) which avoids copying the batch for each column.
+        return scan_column(column, features)
+
+
+class ScannedColumnMapMetricProvider(CachedColumnMapMetricProvider):
+    """
+    A base class for map metrics which evaluate features computed by the
+    :class:`.ColumnFusedScan` metric instead of iterating over the column.
+
+    The condition metric depends on the scan metric of the column. The
+    requested features are the features of the metric itself and the features
+    stored in the meta dictionary of the expectation configuration (see
+    :data:`SCAN_FEATURES_META_KEY`). Since all expectations of a column request
+    the same set of features, the scan metric is only computed once per column.
+    The condition function has to be decorated with
+    :func:`scanned_condition_partial`.
+    """
+
+    scan_features: Tuple[str, ...] = ()
+    """The names of the scan features the condition is based on."""  # pylint: disable=W0105
+
+    @classmethod
+    def get_scan_features(cls, metric_value_kwargs: Dict[str, Any]) -> Tuple[str, ...]:
+        """
+        Get the names of the scan features the condition is based on.
+
+        :param metric_value_kwargs: The value kwargs of the metric.
+        :return: The names of the scan features.
+        """
+        return cls.scan_features
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        if metric.metric_name == cls.condition_metric_name + ".condition":
+            features = set(cls.get_scan_features(metric.metric_value_kwargs))
+            if configuration is not None and configuration.meta is not None:
+                features.update(configuration.meta.get(SCAN_FEATURES_META_KEY, []))
+
+            domain_kwargs = {
+                k: v for k, v in metric.metric_domain_kwargs.items()
+                if k in ColumnFusedScan.domain_keys
+            }
+            dependencies[SCAN_METRIC_NAME] = MetricConfiguration(
+                metric_name=SCAN_METRIC_NAME,
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs={"features": tuple(sorted(features))}
+            )
+
+        return dependencies
+
+
+def scanned_condition_partial(engine=PandasExecutionEngine):
+    """
+    Provide the condition of a :class:`.ScannedColumnMapMetricProvider`.
+
+    This decorator is similar to
+    :func:`~great_expectations.expectations.metrics.column_condition_partial`.
+    However, the decorated function is called with the :class:`.ColumnScan`
+    of the column instead of the column itself and returns a boolean array
+    which is aligned with the scanned (non-null) values. The flags are
+    expanded to all values of the column by the :class:`.ColumnCache`. Only
+    the PandasExecutionEngine is supported.
+    """
+    if not issubclass(engine, PandasExecutionEngine):
+        raise ValueError("scanned_condition_partial only supports the PandasExecutionEngine")
+
+    domain_type = MetricDomainTypes.COLUMN
+
+    def wrapper(metric_fn: Callable):
+        @metric_partial(
+            engine=engine,
+            partial_fn_type=MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
+            domain_type=domain_type,
+        )
+        @wraps(metric_fn)
+        def inner_func(
+            cls,
+            execution_engine: PandasExecutionEngine,
+            metric_domain_kwargs: Dict,
+            metric_value_kwargs: Dict,
+            metrics: Dict[str, Any],
+            runtime_configuration: Dict,
+        ):
+            cached, compute_domain_kwargs, accessor_domain_kwargs = get_cached_column(
+                execution_engine, metric_domain_kwargs, metrics
+            )
+
+            scan: ColumnScan = metrics[SCAN_METRIC_NAME]
+            meets_expectation = metric_fn(
+                cls,
+                scan,
+                **metric_value_kwargs,
+                _metrics=metrics,
+            )
+            return (
+                cached.expand(~np.asarray(meets_expectation, dtype=bool)),
+                compute_domain_kwargs,
+                accessor_domain_kwargs,
+            )
+
+        return inner_func
+
+    return wrapper
+
+
+class ColumnValuesDontMatchScannedRegex(ScannedColumnMapMetricProvider):
+    """
+    Scan based equivalent of the column_values.not_match_regex metric of Great
+    Expectations.
+    """
+
+    condition_metric_name = "column_values.custom.not_match_regex"
+    condition_value_keys = ("regex",)
+
+    @classmethod
+    def get_scan_features(cls, metric_value_kwargs: Dict[str, Any]) -> Tuple[str, ...]:
+        return (regex_scan_feature(metric_value_kwargs["regex"]),)
+
+    @scanned_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, scan: ColumnScan, regex: str, **kwargs):
+        return ~scan[regex_scan_feature(regex)].astype(bool)
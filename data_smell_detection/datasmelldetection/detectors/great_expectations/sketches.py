@@ -0,0 +1,765 @@
+"""
+Mergeable summaries of the values of a column.
+
+The summaries are computed for parts of a column (e.g. the chunks of a
+:class:`~datasmelldetection.detectors.great_expectations.dataset.ChunkedCsvDataset`)
+and merged afterwards. Therefore, data smells which depend on statistics of
+the whole column can be detected without loading the whole column into
+memory.
+
+The :class:`.QuantileSketch` summarizes numeric values. The hashing sketches
+(:class:`.HyperLogLog`, :class:`.CountMinSketch`, :class:`.FrequentValues`
+and :class:`.DistinctSample` which are combined by :class:`.DuplicatesSketch`)
+summarize arbitrary values by their hashes.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_SKETCH_CAPACITY: int = 2048
+"""
+The default number of values which are stored per level of a
+:class:`.QuantileSketch`.
+"""  # pylint: disable=W0105
+
+SKETCH_BLOCK_SIZE: int = 2 ** 16
+"""
+The number of values which are sorted at once when a :class:`.QuantileSketch`
+is created from values.
+"""  # pylint: disable=W0105
+
+DEFAULT_HYPERLOGLOG_PRECISION: int = 14
+"""
+The default number of hash bits which select a register of a
+:class:`.HyperLogLog` sketch (i.e. 2^14 registers and a relative standard
+error of about 0.8%).
+"""  # pylint: disable=W0105
+
+DEFAULT_COUNT_MIN_DEPTH: int = 4
+"""The default number of rows of a :class:`.CountMinSketch`."""  # pylint: disable=W0105
+
+DEFAULT_COUNT_MIN_WIDTH: int = 2 ** 16
+"""The default number of counters per row of a :class:`.CountMinSketch`."""  # pylint: disable=W0105
+
+DEFAULT_FREQUENT_VALUES_CAPACITY: int = 1024
+"""
+The default number of values whose counts are tracked by
+:class:`.FrequentValues`.
+"""  # pylint: disable=W0105
+
+FREQUENT_VALUES_BLOCK_SIZE: int = 2 ** 16
+"""
+The number of values which are counted at once when values are added to
+:class:`.FrequentValues` or a :class:`.DistinctSample`.
+"""  # pylint: disable=W0105
+
+DEFAULT_DISTINCT_SAMPLE_CAPACITY: int = 2 ** 14
+"""
+The default maximum number of distinct values whose counts are stored by a
+:class:`.DistinctSample`.
+"""  # pylint: disable=W0105
+
+# Odd 64-bit multipliers of the multiply-shift hash functions of the rows of
+# a CountMinSketch.
+_COUNT_MIN_MULTIPLIERS = np.array([
+    0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+    0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB, 0xBF58476D1CE4E5B9
+], dtype=np.uint64)
+
+
+def hash_values(values: Any) -> np.ndarray:
+    """
+    Compute 64 bit hashes of values which are used by the hashing sketches
+    (:class:`.HyperLogLog`, :class:`.CountMinSketch`,
+    :class:`.FrequentValues` and :class:`.DistinctSample`).
+
+    The hashes depend on the dtype of the values (e.g. 1 and 1.0 have
+    different hashes). Therefore, sketches should only be merged if their
+    values have the same dtype.
+
+    :param values: The values (e.g. a column without null values).
+    :return: The hashes as an array of unsigned 64 bit integers.
+    """
+    return pd.util.hash_array(np.asarray(values))
+
+
+@dataclass
+class QuantileSketch:
+    """
+    A mergeable sketch which approximates the quantiles of a set of values.
+
+    The values are stored in levels of compactors. Each value at level h
+    represents 2^h values. If a level holds more than :attr:`capacity`
+    values, the values are sorted and every other value is promoted to the
+    next level. The quantiles are exact as long as at most :attr:`capacity`
+    values have been added. Otherwise, the rank error is bounded by the
+    number of levels divided by the capacity.
+    """
+
+    capacity: int = DEFAULT_SKETCH_CAPACITY
+    """The maximum number of values per level."""  # pylint: disable=W0105
+
+    count: int = 0
+    """The number of values which have been added."""  # pylint: disable=W0105
+
+    levels: List[np.ndarray] = field(default_factory=list)
+    """The values stored at each level."""  # pylint: disable=W0105
+
+    compactions: List[int] = field(default_factory=list)
+    """
+    The number of compactions of each level. It determines whether the values
+    at even or odd positions are promoted, which avoids a systematic bias.
+    """  # pylint: disable=W0105
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, capacity: int = DEFAULT_SKETCH_CAPACITY) \
+            -> "QuantileSketch":
+        """
+        Create a sketch of numeric values in a single streaming pass.
+
+        The values are processed in blocks (see :data:`SKETCH_BLOCK_SIZE`).
+        Each block is sorted once and compacted level by level until it fits
+        into the sketch. Therefore, the memory usage is bounded by the block
+        size and the values are never sorted as a whole.
+
+        :param values: The values (which must not contain NaN).
+        :param capacity: The maximum number of values per level.
+        :return: The sketch of the values.
+        """
+        sketch = cls(capacity=capacity, count=len(values))
+        block_size = max(capacity, SKETCH_BLOCK_SIZE)
+        for start in range(0, len(values), block_size):
+            block = np.sort(np.asarray(values[start:start + block_size], dtype=np.float64))
+            h = 0
+            while len(block) > capacity:
+                # NOTE: Promoting every other value of a sorted block keeps
+                # the block sorted.
+                block = sketch._compact_sorted(h, block)
+                h += 1
+            sketch._add(h, block)
+            sketch._compact()
+        return sketch
+
+    @staticmethod
+    def get_capacity(rank_error: float) -> int:
+        """
+        Compute the capacity of a sketch whose :attr:`rank_error` is expected
+        to stay below a bound.
+
+        Each level contributes a rank error of about 1 / capacity. The
+        capacity is chosen such that the bound holds for up to 2^32 values
+        (i.e. 32 levels).
+
+        :param rank_error: The bound of the normalized rank error (in the
+            interval (0, 1)).
+        :return: The capacity.
+        """
+        if not 0 < rank_error < 1:
+            raise ValueError("The rank error must be in the interval (0, 1).")
+        return int(np.ceil(32 / rank_error))
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether all values are stored (i.e. no level has been compacted)."""
+        return len(self.levels) <= 1
+
+    @property
+    def rank_error(self) -> float:
+        """
+        An upper bound of the normalized rank error of the quantiles. Each
+        compaction of level h shifts the ranks by at most 2^h.
+        """
+        if self.count == 0:
+            return 0.0
+        return sum(x * 2 ** h for h, x in enumerate(self.compactions)) / self.count
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merge two sketches without modifying them.
+
+        :param other: The sketch to merge with this sketch.
+        :return: The sketch of the values of both sketches.
+        :raises ValueError: If the capacities of the sketches differ.
+        """
+        if self.capacity != other.capacity:
+            raise ValueError("Sketches with different capacities cannot be merged.")
+        level_count = max(len(self.levels), len(other.levels))
+        empty = np.empty(0, dtype=np.float64)
+        merged = QuantileSketch(
+            capacity=self.capacity,
+            count=self.count + other.count,
+            levels=[
+                np.concatenate([
+                    self.levels[h] if h < len(self.levels) else empty,
+                    other.levels[h] if h < len(other.levels) else empty
+                ])
+                for h in range(level_count)
+            ],
+            compactions=[
+                (self.compactions[h] if h < len(self.compactions) else 0) +
+                (other.compactions[h] if h < len(other.compactions) else 0)
+                for h in range(level_count)
+            ]
+        )
+        merged._compact()
+        return merged
+
+    def get_quantiles(self, quantiles: Sequence[float]) -> List[float]:
+        """
+        Approximate quantiles of the values using linear interpolation.
+
+        If the sketch is exact, the result matches pandas.Series.quantile
+        with linear interpolation.
+
+        :param quantiles: The quantiles to compute (in the interval [0, 1]).
+        :return: The computed quantiles (NaN if the sketch is empty).
+        """
+        values, weights = self._get_weighted_values()
+        return _get_weighted_quantiles(values, weights, quantiles)
+
+    def get_median_absolute_deviation(self) -> float:
+        """
+        Approximate the median of the absolute deviations of the values from
+        their median.
+
+        :return: The median absolute deviation (NaN if the sketch is empty).
+        """
+        values, weights = self._get_weighted_values()
+        median = _get_weighted_quantiles(values, weights, [0.5])[0]
+        return _get_weighted_quantiles(np.abs(values - median), weights, [0.5])[0]
+
+    def _get_weighted_values(self):
+        values = np.concatenate(self.levels) if len(self.levels) > 0 \
+            else np.empty(0, dtype=np.float64)
+        weights = np.repeat(
+            2 ** np.arange(len(self.levels), dtype=np.int64), [len(x) for x in self.levels]
+        )
+        return values, weights
+
+    # Add values to a level (which is created if necessary).
+    def _add(self, h: int, values: np.ndarray):
+        while len(self.levels) <= h:
+            self.levels.append(np.empty(0, dtype=np.float64))
+            self.compactions.append(0)
+        self.levels[h] = np.concatenate([self.levels[h], values]) if len(self.levels[h]) > 0 \
+            else values
+
+    # Compact sorted values of level h and return the values which are
+    # promoted to the next level. If the number of values is odd, the largest
+    # value is added to level h.
+    def _compact_sorted(self, h: int, values: np.ndarray) -> np.ndarray:
+        end = len(values) - len(values) % 2
+        self._add(h, values[end:])
+        promoted = values[self.compactions[h] % 2:end:2]
+        self.compactions[h] += 1
+        return promoted
+
+    # Compact the levels bottom-up until each level holds at most capacity
+    # values.
+    def _compact(self):
+        h = 0
+        while h < len(self.levels):
+            if len(self.levels[h]) > self.capacity:
+                level = np.sort(self.levels[h])
+                self.levels[h] = np.empty(0, dtype=np.float64)
+                self._add(h + 1, self._compact_sorted(h, level))
+            h += 1
+
+
+@dataclass
+class HyperLogLog:
+    """
+    A mergeable sketch which estimates the number of distinct values.
+
+    The first :attr:`precision` bits of the hash of a value select a register
+    which stores the maximum position of the leftmost 1-bit in the remaining
+    bits of the hashes. The number of distinct values is estimated from the
+    harmonic mean of the registers. Small numbers of distinct values are
+    estimated by linear counting of the empty registers.
+    """
+
+    precision: int = DEFAULT_HYPERLOGLOG_PRECISION
+    """
+    The number of hash bits which select a register (in the interval
+    [4, 16]).
+    """  # pylint: disable=W0105
+
+    registers: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+    """The 2^precision registers (created if empty)."""  # pylint: disable=W0105
+
+    def __post_init__(self):
+        if not 4 <= self.precision <= 16:
+            raise ValueError("The precision must be in the interval [4, 16].")
+        if len(self.registers) == 0:
+            self.registers = np.zeros(2 ** self.precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray):
+        """
+        Add values to the sketch.
+
+        :param hashes: The hashes of the values (see :func:`hash_values`).
+        """
+        if len(hashes) == 0:
+            return
+        p = self.precision
+        indices = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        # NOTE: The bit length is taken from the exponent of the float
+        # representation. Rounding to the next power of two only affects a
+        # negligible fraction of the hashes.
+        bit_lengths = np.frexp((hashes << np.uint64(p)).astype(np.float64))[1]
+        ranks = np.clip(64 - bit_lengths, 0, 64 - p) + 1
+        # The maximum rank per register is the last non-zero count of a
+        # register (which is much faster than np.maximum.at).
+        counts = np.bincount(indices * 64 + ranks, minlength=len(self.registers) * 64)\
+            .reshape(-1, 64) > 0
+        maxima = np.where(counts.any(axis=1), 63 - np.argmax(counts[:, ::-1], axis=1), 0)
+        np.maximum(self.registers, maxima.astype(np.uint8), out=self.registers)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Merge two sketches without modifying them.
+
+        :param other: The sketch to merge with this sketch.
+        :return: The sketch of the values of both sketches.
+        :raises ValueError: If the precisions of the sketches differ.
+        """
+        if self.precision != other.precision:
+            raise ValueError("Sketches with different precisions cannot be merged.")
+        return HyperLogLog(
+            precision=self.precision,
+            registers=np.maximum(self.registers, other.registers)
+        )
+
+    @property
+    def relative_error(self) -> float:
+        """The relative standard error of the estimated number of distinct values."""
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def estimate_count(self) -> float:
+        """
+        :return: The estimated number of distinct values.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        empty_count = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and empty_count > 0:
+            return m * np.log(m / empty_count)
+        return float(estimate)
+
+
+@dataclass
+class CountMinSketch:
+    """
+    A mergeable sketch which estimates how often values occur.
+
+    Each row of counters uses a different hash function. The count of a value
+    is estimated by the minimum of its counters over the rows. The estimates
+    never underestimate the counts.
+    """
+
+    depth: int = DEFAULT_COUNT_MIN_DEPTH
+    """The number of rows (at most 8)."""  # pylint: disable=W0105
+
+    width: int = DEFAULT_COUNT_MIN_WIDTH
+    """The number of counters per row (a power of two)."""  # pylint: disable=W0105
+
+    counts: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.int64))
+    """The counters of the rows (created if empty)."""  # pylint: disable=W0105
+
+    def __post_init__(self):
+        if not 1 <= self.depth <= len(_COUNT_MIN_MULTIPLIERS):
+            raise ValueError(
+                f"The depth must be in the interval [1, {len(_COUNT_MIN_MULTIPLIERS)}]."
+            )
+        if self.width < 2 or self.width & (self.width - 1) != 0:
+            raise ValueError("The width must be a power of two.")
+        if self.counts.size == 0:
+            self.counts = np.zeros((self.depth, self.width), dtype=np.int64)
+
+    def add_hashes(self, hashes: np.ndarray):
+        """
+        Add values to the sketch.
+
+        :param hashes: The hashes of the values (see :func:`hash_values`).
+        """
+        for row in range(self.depth):
+            self.counts[row] += np.bincount(self._get_columns(row, hashes), minlength=self.width)
+
+    def estimate_counts(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Estimate how often values occur.
+
+        :param hashes: The hashes of the values (see :func:`hash_values`).
+        :return: The estimated counts of the values.
+        """
+        return np.min(
+            [self.counts[row, self._get_columns(row, hashes)] for row in range(self.depth)],
+            axis=0,
+            initial=np.iinfo(np.int64).max
+        )
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        """
+        Merge two sketches without modifying them.
+
+        :param other: The sketch to merge with this sketch.
+        :return: The sketch of the values of both sketches.
+        :raises ValueError: If the dimensions of the sketches differ.
+        """
+        if (self.depth, self.width) != (other.depth, other.width):
+            raise ValueError("Sketches with different dimensions cannot be merged.")
+        return CountMinSketch(depth=self.depth, width=self.width, counts=self.counts + other.counts)
+
+    # Multiply-shift hashing of the hashes to the counters of a row.
+    def _get_columns(self, row: int, hashes: np.ndarray) -> np.ndarray:
+        shift = np.uint64(64 - (self.width.bit_length() - 1))
+        return ((hashes * _COUNT_MIN_MULTIPLIERS[row]) >> shift).astype(np.intp)
+
+
+@dataclass
+class FrequentValues:
+    """
+    A mergeable summary of the most frequent values (Misra-Gries summary).
+
+    At most :attr:`capacity` values are tracked. If more values are tracked,
+    the (capacity + 1)-th largest count is subtracted from all counts and the
+    values whose count drops to zero are discarded. Every value which occurs
+    more than count / (capacity + 1) times is tracked. The counts
+    underestimate the actual counts by at most :attr:`error`.
+    """
+
+    capacity: int = DEFAULT_FREQUENT_VALUES_CAPACITY
+    """The maximum number of tracked values."""  # pylint: disable=W0105
+
+    hashes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint64))
+    """The hashes of the tracked values."""  # pylint: disable=W0105
+
+    counts: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    """The counts of the tracked values."""  # pylint: disable=W0105
+
+    values: Dict[int, Any] = field(default_factory=dict)
+    """The tracked values by their hashes."""  # pylint: disable=W0105
+
+    error: int = 0
+    """The sum of the subtracted counts."""  # pylint: disable=W0105
+
+    def add(self, values: np.ndarray, hashes: np.ndarray):
+        """
+        Add values to the summary. The values are counted in blocks (see
+        :data:`FREQUENT_VALUES_BLOCK_SIZE`).
+
+        :param values: The values.
+        :param hashes: The hashes of the values (see :func:`hash_values`).
+        """
+        for start in range(0, len(hashes), FREQUENT_VALUES_BLOCK_SIZE):
+            block_hashes = hashes[start:start + FREQUENT_VALUES_BLOCK_SIZE]
+            block_counts = pd.Series(block_hashes).value_counts(sort=False)
+            self._add_counts(
+                block_counts.index.to_numpy(dtype=np.uint64),
+                block_counts.to_numpy(dtype=np.int64)
+            )
+
+            # Store the first occurrence of the values which are tracked now.
+            new_hashes = [x for x in self.hashes if int(x) not in self.values]
+            if len(new_hashes) > 0:
+                positions = np.flatnonzero(
+                    pd.Index(np.array(new_hashes, dtype=np.uint64)).get_indexer(block_hashes) >= 0
+                )
+                block_values = values[start:start + FREQUENT_VALUES_BLOCK_SIZE]
+                for h, value in zip(block_hashes[positions], block_values[positions]):
+                    self.values.setdefault(int(h), value)
+
+    def merge(self, other: "FrequentValues") -> "FrequentValues":
+        """
+        Merge two summaries without modifying them.
+
+        :param other: The summary to merge with this summary.
+        :return: The summary of the values of both summaries.
+        :raises ValueError: If the capacities of the summaries differ.
+        """
+        if self.capacity != other.capacity:
+            raise ValueError("Summaries with different capacities cannot be merged.")
+        merged = FrequentValues(
+            capacity=self.capacity,
+            hashes=self.hashes,
+            counts=self.counts,
+            values={**other.values, **self.values},
+            error=self.error + other.error
+        )
+        merged._add_counts(other.hashes, other.counts)
+        return merged
+
+    # Add counts of distinct hashes to the tracked counts and reduce the
+    # counts to the capacity.
+    def _add_counts(self, hashes: np.ndarray, counts: np.ndarray):
+        # NOTE: The added hashes are looked up in the (much smaller) tracked
+        # hashes.
+        positions = pd.Index(self.hashes).get_indexer(hashes)
+        found = positions >= 0
+        counts = counts.copy()
+        counts[found] += self.counts[positions[found]]
+        untracked = np.ones(len(self.hashes), dtype=bool)
+        untracked[positions[found]] = False
+        hashes = np.concatenate([hashes, self.hashes[untracked]])
+        counts = np.concatenate([counts, self.counts[untracked]])
+        if len(counts) > self.capacity:
+            threshold = int(np.partition(counts, -(self.capacity + 1))[-(self.capacity + 1)])
+            kept = counts > threshold
+            hashes = hashes[kept]
+            counts = counts[kept] - threshold
+            self.error += threshold
+        self.hashes = hashes
+        self.counts = counts
+        kept_hashes = set(int(x) for x in hashes)
+        self.values = {h: x for h, x in self.values.items() if h in kept_hashes}
+
+
+@dataclass
+class DistinctSample:
+    """
+    A mergeable uniform sample of the distinct values with their exact counts
+    (distinct sampling).
+
+    A value is sampled if the first :attr:`level` bits of its hash are zero,
+    i.e. each distinct value is sampled with probability 2^-level regardless
+    of how often it occurs. If more than :attr:`capacity` distinct values are
+    sampled, the level is increased. Therefore, the sample is exact as long
+    as at most :attr:`capacity` distinct values have been added.
+    """
+
+    capacity: int = DEFAULT_DISTINCT_SAMPLE_CAPACITY
+    """The maximum number of sampled distinct values."""  # pylint: disable=W0105
+
+    level: int = 0
+    """The number of leading zero bits of the hashes of sampled values."""  # pylint: disable=W0105
+
+    hashes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint64))
+    """The hashes of the sampled values."""  # pylint: disable=W0105
+
+    counts: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    """The counts of the sampled values."""  # pylint: disable=W0105
+
+    def add_hashes(self, hashes: np.ndarray):
+        """
+        Add values to the sample. The values are counted in blocks (see
+        :data:`FREQUENT_VALUES_BLOCK_SIZE`).
+
+        :param hashes: The hashes of the values (see :func:`hash_values`).
+        """
+        for start in range(0, len(hashes), FREQUENT_VALUES_BLOCK_SIZE):
+            block_hashes = hashes[start:start + FREQUENT_VALUES_BLOCK_SIZE]
+            block_hashes = block_hashes[self._is_sampled(block_hashes)]
+            block_counts = pd.Series(block_hashes).value_counts(sort=False)
+            self._add_counts(
+                block_counts.index.to_numpy(dtype=np.uint64),
+                block_counts.to_numpy(dtype=np.int64)
+            )
+
+    def merge(self, other: "DistinctSample") -> "DistinctSample":
+        """
+        Merge two samples without modifying them.
+
+        :param other: The sample to merge with this sample.
+        :return: The sample of the values of both samples.
+        :raises ValueError: If the capacities of the samples differ.
+        """
+        if self.capacity != other.capacity:
+            raise ValueError("Samples with different capacities cannot be merged.")
+        merged = DistinctSample(
+            capacity=self.capacity,
+            level=max(self.level, other.level),
+            hashes=self.hashes,
+            counts=self.counts
+        )
+        sampled = merged._is_sampled(merged.hashes)
+        merged.hashes = merged.hashes[sampled]
+        merged.counts = merged.counts[sampled]
+        sampled = merged._is_sampled(other.hashes)
+        merged._add_counts(other.hashes[sampled], other.counts[sampled])
+        return merged
+
+    def estimate_duplicated_count(self, excluded_hashes: Optional[np.ndarray] = None) -> float:
+        """
+        Estimate the number of values which occur more than once (counting
+        every occurrence).
+
+        :param excluded_hashes: The hashes of values which are not counted
+            (e.g. the most frequent values whose counts are known otherwise).
+        :return: The estimated number of values.
+        """
+        duplicated = self.counts > 1
+        if excluded_hashes is not None and len(excluded_hashes) > 0:
+            duplicated &= pd.Index(excluded_hashes).get_indexer(self.hashes) < 0
+        return float(np.sum(self.counts[duplicated])) * 2.0 ** self.level
+
+    # Whether the hashes are sampled at the current level.
+    def _is_sampled(self, hashes: np.ndarray) -> np.ndarray:
+        if self.level == 0:
+            return np.ones(len(hashes), dtype=bool)
+        return (hashes >> np.uint64(64 - self.level)) == 0
+
+    # Add counts of distinct sampled hashes to the sample and increase the
+    # level until at most capacity distinct values are sampled.
+    def _add_counts(self, hashes: np.ndarray, counts: np.ndarray):
+        positions = pd.Index(self.hashes).get_indexer(hashes)
+        found = positions >= 0
+        self.counts = self.counts.copy()
+        self.counts[positions[found]] += counts[found]
+        self.hashes = np.concatenate([self.hashes, hashes[~found]])
+        self.counts = np.concatenate([self.counts, counts[~found]])
+        while len(self.hashes) > self.capacity and self.level < 64:
+            self.level += 1
+            sampled = self._is_sampled(self.hashes)
+            self.hashes = self.hashes[sampled]
+            self.counts = self.counts[sampled]
+
+
+@dataclass
+class DuplicatesSketch:
+    """
+    A mergeable sketch which estimates how many values of a column are
+    duplicated and which values are duplicated most often.
+
+    The number of distinct values is estimated by a :class:`.HyperLogLog`
+    sketch and the number of values which occur more than once is estimated
+    by a :class:`.DistinctSample`. Candidates of the most duplicated values
+    are tracked by :class:`.FrequentValues` and their counts are bounded by a
+    :class:`.CountMinSketch`. The memory usage is independent of the number
+    of values.
+    """
+
+    count: int = 0
+    """The number of values which have been added."""  # pylint: disable=W0105
+
+    distinct_values: HyperLogLog = field(default_factory=HyperLogLog)
+    """The sketch of the distinct values."""  # pylint: disable=W0105
+
+    value_counts: CountMinSketch = field(default_factory=CountMinSketch)
+    """The sketch of the counts of the values."""  # pylint: disable=W0105
+
+    frequent_values: FrequentValues = field(default_factory=FrequentValues)
+    """The candidates of the most frequent values."""  # pylint: disable=W0105
+
+    distinct_sample: DistinctSample = field(default_factory=DistinctSample)
+    """The sample of the distinct values with their counts."""  # pylint: disable=W0105
+
+    @classmethod
+    def from_values(cls, values: Any) -> "DuplicatesSketch":
+        """
+        Create a sketch of values.
+
+        :param values: The values (which must not contain null values).
+        :return: The sketch of the values.
+        """
+        hashes = hash_values(values)
+        sketch = cls(count=len(hashes))
+        sketch.distinct_values.add_hashes(hashes)
+        sketch.value_counts.add_hashes(hashes)
+        sketch.frequent_values.add(np.asarray(values), hashes)
+        sketch.distinct_sample.add_hashes(hashes)
+        return sketch
+
+    def merge(self, other: "DuplicatesSketch") -> "DuplicatesSketch":
+        """
+        Merge two sketches without modifying them.
+
+        :param other: The sketch to merge with this sketch.
+        :return: The sketch of the values of both sketches.
+        """
+        return DuplicatesSketch(
+            count=self.count + other.count,
+            distinct_values=self.distinct_values.merge(other.distinct_values),
+            value_counts=self.value_counts.merge(other.value_counts),
+            frequent_values=self.frequent_values.merge(other.frequent_values),
+            distinct_sample=self.distinct_sample.merge(other.distinct_sample)
+        )
+
+    def estimate_distinct_count(self) -> int:
+        """
+        :return: The estimated number of distinct values (at most
+            :attr:`count`).
+        """
+        return min(int(round(self.distinct_values.estimate_count())), self.count)
+
+    def estimate_duplicate_count(self) -> int:
+        """
+        :return: The estimated number of values which occur more than once.
+            All occurrences are counted (i.e. a value which occurs three
+            times contributes three values) which corresponds to
+            ``pandas.Series.duplicated(keep=False)``. The estimate is exact if
+            at most :attr:`DistinctSample.capacity` distinct values have been
+            added.
+        """
+        if self.distinct_sample.level == 0:
+            return int(self.distinct_sample.estimate_duplicated_count())
+        # NOTE: The sample of the distinct values rarely contains the few
+        # values which occur very often. Therefore, the counts of the most
+        # frequent values are added instead of being estimated from the
+        # sample.
+        hashes, counts = self._get_frequent_value_counts()
+        duplicated = counts > 1
+        estimate = np.sum(counts[duplicated]) + \
+            self.distinct_sample.estimate_duplicated_count(hashes[duplicated])
+        return min(int(round(estimate)), self.count)
+
+    def estimate_duplicate_ratio(self) -> float:
+        """
+        :return: The estimated fraction of the values which occur more than
+            once (0 if the sketch is empty).
+        """
+        if self.count == 0:
+            return 0.0
+        return self.estimate_duplicate_count() / self.count
+
+    def get_top_duplicated_values(self, top_k: int) -> List[Tuple[Any, int]]:
+        """
+        Approximate the values which occur most often (at least twice).
+
+        The count of a value is the minimum of the estimate of the
+        :class:`.CountMinSketch` and the upper bound of the
+        :class:`.FrequentValues`. Therefore, the counts are exact if less than
+        :attr:`FrequentValues.capacity` distinct values have been added.
+
+        :param top_k: The maximum number of values.
+        :return: Pairs of the values and their estimated counts ordered by
+            decreasing counts.
+        """
+        hashes, counts = self._get_frequent_value_counts()
+        order = np.argsort(-counts, kind="stable")[:top_k]
+        return [
+            (self.frequent_values.values[int(hashes[i])], int(counts[i]))
+            for i in order if counts[i] > 1
+        ]
+
+    # The hashes of the tracked frequent values and the minimum of the upper
+    # bounds of their counts.
+    def _get_frequent_value_counts(self) -> Tuple[np.ndarray, np.ndarray]:
+        frequent_values = self.frequent_values
+        counts = np.minimum(
+            self.value_counts.estimate_counts(frequent_values.hashes),
+            frequent_values.counts + frequent_values.error
+        )
+        return frequent_values.hashes, counts
+
+
+# Compute quantiles of weighted values. Each value is placed at the center of
+# the ranks it represents and the quantiles are interpolated linearly between
+# these positions. If all weights are 1, the positions are the ranks of the
+# values which corresponds to the linear interpolation of pandas.
+def _get_weighted_quantiles(values: np.ndarray, weights: np.ndarray,
+                            quantiles: Sequence[float]) -> List[float]:
+    if len(values) == 0:
+        return [np.nan] * len(quantiles)
+    if np.all(weights == 1):
+        # NOTE: np.interp rounds differently than np.percentile which
+        # computes the same quantiles as pandas.
+        return np.percentile(values, np.array(quantiles) * 100, interpolation="linear").tolist()
+    order = np.argsort(values, kind="stable")
+    values = values[order]
+    weights = weights[order]
+    positions = np.cumsum(weights) - (weights + 1) / 2
+    return np.interp(np.array(quantiles) * (weights.sum() - 1), positions, values).tolist()
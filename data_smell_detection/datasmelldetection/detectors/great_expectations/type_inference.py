@@ -0,0 +1,144 @@
+"""
+Infer the :class:`~great_expectations.profile.base.ProfilerDataType` of a
+column without evaluating expectations.
+
+The basic dataset profiler of Great Expectations classifies a column by
+evaluating the expect_column_values_to_be_in_type_list expectation for the
+type names of each profiler data type until one of them succeeds. Each
+evaluation of the expectation on an object column checks the type of each
+value of the column. :func:`infer_column_type` applies the same rules to the
+dtype of a column. The values of an object column are only checked for an
+evenly spaced sample of the column. The types which the profiler determines
+by checking all values can be stored in a :class:`ColumnTypeCache`.
+"""
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from great_expectations.dataset import PandasDataset
+from great_expectations.profile.base import ProfilerDataType, ProfilerTypeMapping
+
+
+DEFAULT_TYPE_INFERENCE_SAMPLE_SIZE: int = 1000
+"""
+The default number of values of an object column whose types are checked by
+:func:`infer_column_type`.
+"""  # pylint: disable=W0105
+
+
+# Return the types which the expect_column_values_to_be_in_type_list
+# expectation of Great Expectations compares the values (or the dtype) of a
+# column with.
+def _resolve_type_names(type_names: List[str]) -> Tuple[type, ...]:
+    types: List[type] = []
+    for type_name in sorted(type_names):
+        try:
+            types.append(np.dtype(type_name).type)
+        except TypeError:
+            for module in (pd, pd.core.dtypes.dtypes):
+                candidate = getattr(module, type_name, None)
+                if isinstance(candidate, type):
+                    types.append(candidate)
+        native_types = PandasDataset._native_type_type_map(type_name)  # pylint: disable=W0212
+        if native_types is not None:
+            types.extend(native_types)
+    return tuple(types)
+
+
+# The profiler data types in the order in which the basic dataset profiler
+# checks them.
+_PROFILER_DATA_TYPES: List[Tuple[ProfilerDataType, Tuple[type, ...]]] = [
+    (ProfilerDataType.INT, _resolve_type_names(ProfilerTypeMapping.INT_TYPE_NAMES)),
+    (ProfilerDataType.FLOAT, _resolve_type_names(ProfilerTypeMapping.FLOAT_TYPE_NAMES)),
+    (ProfilerDataType.STRING, _resolve_type_names(ProfilerTypeMapping.STRING_TYPE_NAMES)),
+    (ProfilerDataType.BOOLEAN, _resolve_type_names(ProfilerTypeMapping.BOOLEAN_TYPE_NAMES)),
+    (ProfilerDataType.DATETIME, _resolve_type_names(ProfilerTypeMapping.DATETIME_TYPE_NAMES)),
+]
+
+
+# Return the non-null values of an evenly spaced sample of a column. The whole
+# column is returned if it does not contain more values than the sample size.
+def _sample_values(column: pd.Series, sample_size: int) -> np.ndarray:
+    values = column.to_numpy()
+    if len(values) > sample_size:
+        sample = values[np.linspace(0, len(values) - 1, num=sample_size, dtype=np.int64)]
+        sample = sample[pd.notnull(sample)]
+        if len(sample) > 0:
+            return sample
+        # The values of a sparse column may all be missed by the sample.
+        values = values[pd.notnull(values)][:sample_size]
+    return values[pd.notnull(values)]
+
+
+def infer_column_type(column: pd.Series,
+                      sample_size: int = DEFAULT_TYPE_INFERENCE_SAMPLE_SIZE) -> ProfilerDataType:
+    """
+    Infer the profiler data type of a column.
+
+    The type of a column with a specific dtype is derived from the dtype in
+    the same way as the basic dataset profiler of Great Expectations does.
+    The type of an object column is the first profiler data type whose types
+    include the types of all non-null values of an evenly spaced sample of
+    the column. Therefore, the result may differ from the result of the
+    profiler if the column contains values of different types.
+
+    :param column: The column.
+    :param sample_size: The maximum number of values of an object column
+        whose types are checked.
+    :return: The profiler data type of the column.
+    """
+    if column.dtype != "object":
+        for type_, types in _PROFILER_DATA_TYPES:
+            if column.dtype.type in types:
+                return type_
+        return ProfilerDataType.UNKNOWN
+
+    values = _sample_values(column, sample_size)
+    for type_, types in _PROFILER_DATA_TYPES:
+        if all(isinstance(x, types) for x in values):
+            return type_
+    return ProfilerDataType.UNKNOWN
+
+
+class ColumnTypeCache:
+    """
+    An in-memory cache which stores the profiler data types of columns under a
+    hash of the content of the columns (see
+    :func:`~datasmelldetection.detectors.great_expectations.cache.compute_column_hash`).
+    The least recently used entries are evicted once the maximum number of
+    entries is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        :param max_entries: The maximum number of cached column types.
+        """
+        self._max_entries = max_entries
+        # Type: OrderedDict[str, ProfilerDataType]
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, column_hash: str) -> Optional[ProfilerDataType]:
+        """
+        :param column_hash: The hash of the column.
+        :return: The cached type or None if the hash is not cached.
+        """
+        if column_hash not in self._entries:
+            return None
+        self._entries.move_to_end(column_hash)
+        return self._entries[column_hash]
+
+    def put(self, column_hash: str, type_: ProfilerDataType):
+        """
+        Store the type of a column.
+
+        :param column_hash: The hash of the column.
+        :param type_: The type of the column.
+        """
+        self._entries[column_hash] = type_
+        self._entries.move_to_end(column_hash)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
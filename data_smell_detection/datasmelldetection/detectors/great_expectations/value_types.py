@@ -0,0 +1,208 @@
+"""
+Classify the values of a column into value types (e.g. integers stored as
+strings or dates) using a single scan feature.
+
+Several data smells check whether values are of a specific type by matching
+regular expressions. Instead of matching the regular expressions of each data
+smell separately, the value types of a value are stored as flags in the
+:data:`VALUE_TYPE_SCAN_FEATURE`. Since scan features are computed once per
+column (see :mod:`~datasmelldetection.detectors.great_expectations.scanner`),
+all data smells of a column read their verdicts from the same array.
+"""
+from enum import IntFlag
+import re
+from typing import Any, Dict, List, Pattern, Tuple
+
+import numpy as np
+import pandas as pd
+from great_expectations.execution_engine import PandasExecutionEngine
+
+from .scanner import (
+    ColumnScan,
+    ScannedColumnMapMetricProvider,
+    default_scan_feature_registry,
+    regex_scan_feature,
+    scanned_condition_partial
+)
+
+
+VALUE_TYPE_SCAN_FEATURE: str = "value_type"
+"""
+Name of the scan feature which stores the :class:`.ValueType` flags of each
+value (as an array of 16 bit unsigned integers).
+"""  # pylint: disable=W0105
+
+
+class ValueType(IntFlag):
+    """
+    The value types a value is classified into. A value can be of several
+    types (e.g. "5" is an integer and a numeric value).
+    """
+
+    ALPHABETIC = 1
+    """The value consists of letters and whitespace only."""  # pylint: disable=W0105
+
+    INTEGER = 2
+    """The value is an integer with an optional sign (e.g. "+5")."""  # pylint: disable=W0105
+
+    FLOAT = 4
+    """
+    The value is a floating point number with an optional sign (e.g. "-5." or
+    "3.14").
+    """  # pylint: disable=W0105
+
+    NUMERIC = 8
+    """
+    The value is an integer or a decimal number with an optional minus sign
+    (e.g. "-5" or "3.14").
+    """  # pylint: disable=W0105
+
+    DATE = 16
+    """The value is a date (e.g. "2021-12-31" or "31/12/2021")."""  # pylint: disable=W0105
+
+    TIME = 32
+    """The value is a time (e.g. "23:59" or "23:59:59")."""  # pylint: disable=W0105
+
+    DATETIME = 64
+    """
+    The value starts with a date and a time (e.g. "2021-12-31 23:59:59").
+    """  # pylint: disable=W0105
+
+    NUMBER = 128
+    """The value is an int or a float object instead of a string."""  # pylint: disable=W0105
+
+    NOT_A_STRING = 256
+    """The value is neither a string nor an int or a float object."""  # pylint: disable=W0105
+
+
+ALPHABETIC_REGEX: str = r'^[a-zA-Z\s]+$'
+INTEGER_REGEX: str = r'^(?:\+|-)?\d+$'
+FLOAT_REGEX: str = r'^(?:\+|-)?\d+\.\d*$'
+NUMERIC_REGEX: str = r'^-?\d+(\.\d+)?$'
+DATE_REGEX: str = \
+    r'^(\d{4}-\d{2}-\d{2})$|^(\d{2}/\d{2}/\d{4})$|^(\d{2}-\d{2}-\d{4})$|^(\d{4}/\d{2}/\d{2})$'
+TIME_REGEX: str = r'^(\d{2}:\d{2}:\d{2})$|^(\d{2}:\d{2})$'
+# NOTE: Only the start of a value has to match (see re.match).
+DATETIME_REGEX: str = \
+    r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})|(\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2})|' \
+    r'(\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2})|(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})'
+
+# The value types which are determined by searching the string representation
+# of a value for a regex. Searching for these regexes is equivalent to
+# checking the flag of the value type (see ColumnValuesDontMatchTypedRegex).
+_VALUE_TYPE_REGEXES: Dict[str, ValueType] = {
+    ALPHABETIC_REGEX: ValueType.ALPHABETIC,
+    INTEGER_REGEX: ValueType.INTEGER,
+    FLOAT_REGEX: ValueType.FLOAT,
+    NUMERIC_REGEX: ValueType.NUMERIC,
+    DATE_REGEX: ValueType.DATE,
+    TIME_REGEX: ValueType.TIME,
+}
+
+# The patterns which are used to classify a value. Instead of matching the
+# regex of each value type, the value types are derived from a few patterns:
+# - Values which start with a letter or whitespace can only be alphabetic.
+# - The integer, float and numeric regexes (which only differ in the sign and
+#   the decimal places) are combined into a single pattern. $ also matches
+#   before a trailing newline.
+# - Dates, times and datetimes are mutually exclusive and can't be numbers.
+_ALPHABETIC_PATTERN: Pattern = re.compile(ALPHABETIC_REGEX)
+_NUMBER_PATTERN: Pattern = re.compile(r'(?P<sign>[+-])?\d+(?:\.(?P<decimal_places>\d*))?\n?\Z')
+_DIGIT_PATTERNS: List[Tuple[int, Pattern]] = [
+    (ValueType.DATE.value, re.compile(DATE_REGEX)),
+    (ValueType.TIME.value, re.compile(TIME_REGEX)),
+    (ValueType.DATETIME.value, re.compile(DATETIME_REGEX)),
+]
+
+# NOTE: Combining IntFlag members creates new members which is slow.
+# Therefore, the classification uses plain integers.
+_INTEGER: int = ValueType.INTEGER.value
+_FLOAT: int = ValueType.FLOAT.value
+_NUMERIC: int = ValueType.NUMERIC.value
+
+
+# Classify the string representation of a value.
+def _classify_string(string: str) -> int:
+    first_character = string[:1]
+    if first_character in ("+", "-") or first_character.isdigit():
+        number = _NUMBER_PATTERN.match(string)
+        if number is not None:
+            sign = number.group("sign")
+            decimal_places = number.group("decimal_places")
+            value_type = _INTEGER if decimal_places is None else _FLOAT
+            if sign != "+" and decimal_places != "":
+                value_type |= _NUMERIC
+            return value_type
+        if first_character.isdigit():
+            # NOTE: All patterns start with \d which matches a subset of the
+            # characters isdigit returns True for.
+            for value_type, pattern in _DIGIT_PATTERNS:
+                if pattern.match(string) is not None:
+                    return value_type
+        return 0
+    if _ALPHABETIC_PATTERN.match(string) is not None:
+        return ValueType.ALPHABETIC.value
+    return 0
+
+
+def classify_value(element: Any) -> int:
+    """
+    Classify a single value.
+
+    The string representation of the value is classified. Additionally, int
+    and float objects are flagged as :attr:`ValueType.NUMBER` and other
+    objects which are no strings as :attr:`ValueType.NOT_A_STRING`.
+
+    :param element: The value to classify.
+    :return: The :class:`.ValueType` flags of the value.
+    """
+    value_type = _classify_string(str(element))
+    if type(element) == int or type(element) == float:
+        value_type |= ValueType.NUMBER.value
+    elif not isinstance(element, str):
+        value_type |= ValueType.NOT_A_STRING.value
+    return value_type
+
+
+def classify_values(values: pd.Series) -> np.ndarray:
+    """
+    Classify multiple values (see :func:`classify_value`).
+
+    :param values: The values to classify.
+    :return: The :class:`.ValueType` flags of the values as an array of 16 bit
+        unsigned integers.
+    """
+    return np.fromiter(map(classify_value, values.tolist()), dtype=np.uint16, count=len(values))
+
+
+default_scan_feature_registry.register(
+    VALUE_TYPE_SCAN_FEATURE,
+    classify_value,
+    vectorized_extractor=classify_values
+)
+
+
+class ColumnValuesDontMatchTypedRegex(ScannedColumnMapMetricProvider):
+    """
+    Equivalent of the column_values.custom.not_match_regex metric (see
+    :class:`~datasmelldetection.detectors.great_expectations.scanner.ColumnValuesDontMatchScannedRegex`)
+    which reads the result from the :data:`VALUE_TYPE_SCAN_FEATURE` if the
+    regex is the regex of a value type (e.g. :data:`INTEGER_REGEX`). Other
+    regexes are matched separately.
+    """
+
+    condition_metric_name = "column_values.custom.not_match_typed_regex"
+    condition_value_keys = ("regex",)
+
+    @classmethod
+    def get_scan_features(cls, metric_value_kwargs: Dict[str, Any]) -> Tuple[str, ...]:
+        if metric_value_kwargs["regex"] in _VALUE_TYPE_REGEXES:
+            return (VALUE_TYPE_SCAN_FEATURE,)
+        return (regex_scan_feature(metric_value_kwargs["regex"]),)
+
+    @scanned_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, scan: ColumnScan, regex: str, **kwargs):
+        value_type = _VALUE_TYPE_REGEXES.get(regex)
+        if value_type is None:
+            return ~scan[regex_scan_feature(regex)].astype(bool)
+        return (scan[VALUE_TYPE_SCAN_FEATURE].astype(np.uint16) & value_type) == 0
@@ -0,0 +1,171 @@
+"""
+Profile the whitespace of the values of a column using a single scan feature.
+
+The spacing smell and the spacing inconsistency smell both check the values
+for leading whitespace, trailing whitespace and runs of multiple whitespace
+characters. Instead of matching regular expressions for each data smell, the
+whitespace of each value is profiled once and stored in the
+:data:`WHITESPACE_PROFILE_SCAN_FEATURE` which is shared by both data smells.
+"""
+import re
+from typing import Any, List, Pattern, Tuple
+
+import numpy as np
+import pandas as pd
+from great_expectations.execution_engine import PandasExecutionEngine
+
+from .scanner import (
+    ColumnScan,
+    ScannedColumnMapMetricProvider,
+    default_scan_feature_registry,
+    scanned_condition_partial
+)
+
+
+WHITESPACE_PROFILE_SCAN_FEATURE: str = "whitespace_profile"
+"""
+Name of the scan feature which stores the whitespace profile of each value
+(see :func:`get_whitespace_profile`) as an array of shape (number of values, 3).
+"""  # pylint: disable=W0105
+
+LEADING_WHITESPACE: int = 0
+"""
+Index of the number of leading whitespace characters in a whitespace profile.
+"""  # pylint: disable=W0105
+
+TRAILING_WHITESPACE: int = 1
+"""
+Index of the number of trailing whitespace characters in a whitespace profile.
+"""  # pylint: disable=W0105
+
+MULTIPLE_WHITESPACE: int = 2
+"""
+Index of the number of runs of at least two whitespace characters in a
+whitespace profile.
+"""  # pylint: disable=W0105
+
+# NOTE: \s matches the same characters as str.isspace which is used by
+# str.lstrip and str.rstrip.
+_MULTIPLE_WHITESPACE_PATTERN: Pattern = re.compile(r'\s{2,}')
+
+
+def get_whitespace_profile(element: Any) -> Tuple[int, int, int]:
+    """
+    Profile the whitespace of the string representation of a value.
+
+    :param element: The value to profile.
+    :return: The number of leading whitespace characters, the number of
+        trailing whitespace characters and the number of runs of at least two
+        whitespace characters (see :data:`LEADING_WHITESPACE`,
+        :data:`TRAILING_WHITESPACE` and :data:`MULTIPLE_WHITESPACE`).
+    """
+    string = str(element)
+    return (
+        len(string) - len(string.lstrip()),
+        len(string) - len(string.rstrip()),
+        len(_MULTIPLE_WHITESPACE_PATTERN.findall(string))
+    )
+
+
+# Whether a character is a whitespace character (see str.isspace) indexed by
+# its code point. All whitespace characters have a code point below 0x3001.
+# Larger code points are looked up at the last (non-whitespace) entry.
+_WHITESPACE_TABLE: np.ndarray = np.array([chr(i).isspace() for i in range(0x3002)])
+
+# Longer strings are profiled one by one since the vectorized profiling pads
+# all strings to the length of the longest string.
+_MAX_VECTORIZED_LENGTH: int = 256
+
+# The maximum number of characters (including padding) which are profiled at
+# once.
+_BATCH_CHARACTER_COUNT: int = 2 ** 24
+
+
+# Profile the whitespace of strings without NUL characters whose length is at
+# most _MAX_VECTORIZED_LENGTH. The strings are converted to a matrix of code
+# points which is padded with NUL characters (which are no whitespace).
+def _get_padded_whitespace_profiles(strings: List[str], lengths: np.ndarray) -> np.ndarray:
+    profiles = np.empty((len(strings), 3), dtype=np.int64)
+    # NOTE: At least two padding characters are added. Therefore, each row
+    # ends with a non-whitespace character.
+    width = int(lengths.max(initial=0)) + 2
+    batch_size = max(1, _BATCH_CHARACTER_COUNT // width)
+    for start in range(0, len(strings), batch_size):
+        end = min(start + batch_size, len(strings))
+        code_points = np.array(strings[start:end], dtype=f"U{width}").view(np.uint32).\
+            reshape(-1, width)
+        whitespace = _WHITESPACE_TABLE[np.minimum(code_points, len(_WHITESPACE_TABLE) - 1)]
+        batch_lengths = lengths[start:end]
+
+        # The leading whitespace ends at the first non-whitespace character.
+        leading = np.argmin(whitespace, axis=1)
+        # The trailing whitespace starts after the last non-whitespace
+        # character of the string (the padding is excluded).
+        content = ~whitespace & (np.arange(width) < batch_lengths[:, np.newaxis])
+        last_content = width - 1 - np.argmax(content[:, ::-1], axis=1)
+        trailing = np.where(content.any(axis=1), batch_lengths - 1 - last_content, batch_lengths)
+        # A run of multiple whitespace characters starts at a whitespace
+        # character which is followed but not preceded by a whitespace
+        # character.
+        pairs = whitespace[:, :-1] & whitespace[:, 1:]
+        runs = pairs[:, 0].astype(np.int64) + (pairs[:, 1:] & ~whitespace[:, :-2]).sum(axis=1)
+
+        profiles[start:end, LEADING_WHITESPACE] = leading
+        profiles[start:end, TRAILING_WHITESPACE] = trailing
+        profiles[start:end, MULTIPLE_WHITESPACE] = runs
+    return profiles
+
+
+def get_whitespace_profiles(values: pd.Series) -> np.ndarray:
+    """
+    Vectorized equivalent of :func:`get_whitespace_profile`.
+
+    :param values: The values to profile.
+    :return: The whitespace profiles of the values as an array of shape
+        (number of values, 3).
+    """
+    strings: List[str] = values.tolist()
+    if pd.api.types.infer_dtype(values, skipna=False) != "string":
+        strings = list(map(str, strings))
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+    # NOTE: NumPy strips trailing NUL characters of strings.
+    if lengths.max(initial=0) <= _MAX_VECTORIZED_LENGTH and \
+            not any("\x00" in x for x in strings):
+        return _get_padded_whitespace_profiles(strings, lengths)
+    return np.array(list(map(get_whitespace_profile, strings)), dtype=np.int64).reshape(-1, 3)
+
+
+def has_spacing_issues(profiles: np.ndarray) -> np.ndarray:
+    """
+    Check whether values contain leading whitespace, trailing whitespace or
+    runs of multiple whitespace characters.
+
+    :param profiles: The whitespace profiles of the values (see
+        :func:`get_whitespace_profile`).
+    :return: Boolean array where True indicates a spacing issue.
+    """
+    return np.asarray(profiles).reshape(-1, 3).any(axis=1)
+
+
+default_scan_feature_registry.register(
+    WHITESPACE_PROFILE_SCAN_FEATURE,
+    get_whitespace_profile,
+    vectorized_extractor=get_whitespace_profiles
+)
+
+
+class ColumnValuesDontContainSpacingSmell(ScannedColumnMapMetricProvider):
+    """
+    Check whether the values of a column do not contain leading whitespace,
+    trailing whitespace or runs of multiple whitespace characters. The result
+    is equivalent to the column_values.not_match_regex metric with the regex
+    ``(^\\s+)|(\\s{2,})|(\\s+$)``.
+    """
+
+    condition_metric_name = "column_values.custom.not_contains_spacing_smell"
+    condition_value_keys = ()
+    scan_features = (WHITESPACE_PROFILE_SCAN_FEATURE,)
+
+    @scanned_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, scan: ColumnScan, **kwargs):
+        return ~has_spacing_issues(scan[WHITESPACE_PROFILE_SCAN_FEATURE])
@@ -0,0 +1,113 @@
+import os
+import shutil
+import threading
+import time
+from typing import List
+
+import pytest
+
+from datasmelldetection.detectors.great_expectations.batch import BatchDetector
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.detector import DetectorBuilder
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+
+
+# Create a data directory which contains copies of the data smell testset and
+# a file which can't be imported.
+def _create_data_directory(directory: str) -> List[str]:
+    identifiers = ["testset1.csv", "testset2.csv", "testset3.csv"]
+    for identifier in identifiers:
+        shutil.copy(
+            os.path.join(_test_data_directory, "data_smell_testset.csv"),
+            os.path.join(directory, identifier)
+        )
+    with open(os.path.join(directory, "empty.csv"), "w"):
+        pass
+    return identifiers
+
+
+class TestBatchDetector:
+    def test_detect(self, tmp_path):
+        identifiers = _create_data_directory(str(tmp_path))
+        context = GreatExpectationsContextBuilder(
+            _test_great_expectations_directory,
+            str(tmp_path)
+        ).build()
+        dataset_manager = FileBasedDatasetManager(context=context)
+
+        results = BatchDetector(context, dataset_manager, max_workers=2).detect()
+        assert list(results.keys()) == sorted(identifiers + ["empty.csv"])
+
+        # The file which can't be imported doesn't abort the detection of the
+        # other files.
+        assert not results["empty.csv"].success
+        assert results["empty.csv"].detection_results == []
+
+        expected_results = DetectorBuilder(
+            context=context,
+            dataset=dataset_manager.get_dataset("testset1.csv")
+        ).build().detect()
+        for identifier in identifiers:
+            assert results[identifier].success
+            assert results[identifier].dataset_identifier == identifier
+            assert results[identifier].detection_results == expected_results
+
+    def test_memory_limit(self, tmp_path, monkeypatch):
+        identifiers = _create_data_directory(str(tmp_path))
+        context = GreatExpectationsContextBuilder(
+            _test_great_expectations_directory,
+            str(tmp_path)
+        ).build()
+        dataset_manager = FileBasedDatasetManager(context=context)
+
+        # Record the maximum number of datasets which are imported at the
+        # same time.
+        lock = threading.Lock()
+        active_count = 0
+        max_active_count = 0
+        get_dataset = dataset_manager.get_dataset
+
+        def recording_get_dataset(dataset_identifier):
+            nonlocal active_count, max_active_count
+            with lock:
+                active_count += 1
+                max_active_count = max(max_active_count, active_count)
+            dataset = get_dataset(dataset_identifier)
+            # Ensure that imports would overlap without the memory limit.
+            time.sleep(0.1)
+            with lock:
+                active_count -= 1
+            return dataset
+        monkeypatch.setattr(dataset_manager, "get_dataset", recording_get_dataset)
+
+        # Each file exceeds the memory limit => the files are processed one
+        # after another.
+        results = BatchDetector(
+            context, dataset_manager, max_workers=3, memory_limit=1
+        ).detect(identifiers)
+        assert list(results.keys()) == identifiers
+        assert all(x.success for x in results.values())
+        assert max_active_count == 1
+
+    @pytest.mark.parametrize("kwargs", [
+        {"max_workers": 0},
+        {"memory_limit": -1},
+        {"memory_factor": 0.0}
+    ])
+    def test_invalid_arguments(self, tmp_path, kwargs):
+        context = GreatExpectationsContextBuilder(
+            _test_great_expectations_directory,
+            str(tmp_path)
+        ).build()
+        with pytest.raises(ValueError):
+            BatchDetector(
+                context=context,
+                dataset_manager=FileBasedDatasetManager(context=context),
+                **kwargs
+            )
@@ -0,0 +1,229 @@
+from datetime import date
+import os
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration, ExpectationValidationResult
+
+import datasmelldetection
+from datasmelldetection.core import DataSmellType
+from datasmelldetection.detectors.great_expectations.cache import (
+    DiskResultCache,
+    LRUResultCache,
+    ResultCache,
+    compute_cache_key,
+    compute_column_hash
+)
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+from datasmelldetection.detectors.great_expectations.detector import (
+    DataSmellAwareConfiguration,
+    DetectorBuilder
+)
+import datasmelldetection.detectors.great_expectations.expectations.\
+    expect_column_values_to_not_contain_suspect_date_value_smell as suspect_date_module
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+context_builder = GreatExpectationsContextBuilder(
+    _test_great_expectations_directory,
+    _test_data_directory
+)
+context = context_builder.build()
+
+dataset_manager = FileBasedDatasetManager(context=context)
+data_smell_testset = dataset_manager.get_dataset("data_smell_testset.csv")
+
+_SUSPECT_DATE_EXPECTATION_TYPE = "expect_column_values_to_not_contain_suspect_date_value_smell"
+
+
+class RecordingResultCache(LRUResultCache):
+    """An LRU cache which records the expectation types of stored results."""
+
+    def __init__(self):
+        super().__init__()
+        self.stored_expectation_types: List[str] = []
+
+    def put(self, key: str, result: ExpectationValidationResult):
+        self.stored_expectation_types.append(result.expectation_config.expectation_type)
+        super().put(key, result)
+
+
+def _create_result(value: int) -> ExpectationValidationResult:
+    return ExpectationValidationResult(success=True, result={"value": value})
+
+
+def _detect(configuration: DataSmellAwareConfiguration, result_cache: ResultCache):
+    builder = DetectorBuilder(context=context, dataset=data_smell_testset).\
+        set_configuration(configuration)
+    if result_cache is not None:
+        builder.set_result_cache(result_cache)
+    return builder.build().detect()
+
+
+class TestCacheKey:
+    def test_column_hash(self):
+        column = pd.Series([1, 2, 3])
+        assert compute_column_hash(column) == compute_column_hash(pd.Series([1, 2, 3]))
+        assert compute_column_hash(column) != compute_column_hash(pd.Series([1, 2, 4]))
+        assert compute_column_hash(column) != compute_column_hash(pd.Series([1.0, 2.0, 3.0]))
+
+    def test_cache_key(self):
+        configuration = ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a", "mostly": 0.9}
+        )
+        changed_configuration = ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a", "mostly": 0.8}
+        )
+        key = compute_cache_key("hash", configuration)
+        assert key == compute_cache_key("hash", configuration)
+        assert key != compute_cache_key("other_hash", configuration)
+        assert key != compute_cache_key("hash", changed_configuration)
+
+    def test_cache_key_depends_on_version(self, monkeypatch):
+        configuration = ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a"}
+        )
+        key = compute_cache_key("hash", configuration)
+        monkeypatch.setattr(datasmelldetection, "__version__", "other_version")
+        assert key != compute_cache_key("hash", configuration)
+
+    def test_time_dependent_defaults_are_resolved(self, monkeypatch):
+        configuration = ExpectationConfiguration(
+            expectation_type=_SUSPECT_DATE_EXPECTATION_TYPE,
+            kwargs={"column": "a", "future_threshold_date": None}
+        )
+
+        monkeypatch.setattr(
+            suspect_date_module, "_get_default_future_threshold_date", lambda: date(2021, 1, 2)
+        )
+        key = compute_cache_key("hash", configuration)
+        assert key == compute_cache_key("hash", ExpectationConfiguration(
+            expectation_type=_SUSPECT_DATE_EXPECTATION_TYPE,
+            kwargs={"column": "a", "future_threshold_date": date(2021, 1, 2)}
+        ))
+
+        # The key changes with the default threshold date (tomorrow).
+        monkeypatch.setattr(
+            suspect_date_module, "_get_default_future_threshold_date", lambda: date(2021, 1, 3)
+        )
+        assert key != compute_cache_key("hash", configuration)
+
+
+class TestLRUResultCache:
+    def test_get_and_put(self):
+        cache = LRUResultCache(max_entries=2)
+        assert cache.get("a") is None
+
+        cache.put("a", _create_result(1))
+        assert cache.get("a").result["value"] == 1
+
+    def test_eviction(self):
+        cache = LRUResultCache(max_entries=2)
+        cache.put("a", _create_result(1))
+        cache.put("b", _create_result(2))
+        # "a" is used more recently than "b"
+        cache.get("a")
+        cache.put("c", _create_result(3))
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            LRUResultCache(max_entries=0)
+
+
+class TestDiskResultCache:
+    def test_get_and_put(self, tmp_path):
+        cache = DiskResultCache(str(tmp_path))
+        assert cache.get("a") is None
+
+        cache.put("a", _create_result(1))
+        # Results are shared by cache objects using the same directory.
+        assert DiskResultCache(str(tmp_path)).get("a").result["value"] == 1
+
+    def test_eviction(self, tmp_path):
+        cache = DiskResultCache(str(tmp_path))
+        cache.put("a", _create_result(1))
+        size = os.path.getsize(os.path.join(str(tmp_path), "a.pickle"))
+
+        # Only two results fit into the cache.
+        cache = DiskResultCache(str(tmp_path), max_size=2 * size)
+        os.utime(os.path.join(str(tmp_path), "a.pickle"), (0, 0))
+        cache.put("b", _create_result(2))
+        cache.put("c", _create_result(3))
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+
+    def test_directory_is_scanned_once(self, tmp_path, monkeypatch):
+        cache = DiskResultCache(str(tmp_path))
+        cache.put("a", _create_result(1))
+        size = os.path.getsize(os.path.join(str(tmp_path), "a.pickle"))
+
+        cache = DiskResultCache(str(tmp_path), max_size=2 * size)
+        monkeypatch.setattr(os, "scandir", None)
+        cache.put("b", _create_result(2))
+        assert cache.get("a") is not None
+        # The result stored before the cache was created is counted.
+        cache.put("c", _create_result(3))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_invalid_max_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            DiskResultCache(str(tmp_path), max_size=0)
+
+
+class TestDetectionWithCache:
+    def test_results_match_uncached_detection(self, tmp_path):
+        configuration = DataSmellAwareConfiguration(
+            column_names=None,
+            data_smell_configuration=None
+        )
+        uncached_results = _detect(configuration, result_cache=None)
+
+        for cache in [LRUResultCache(), DiskResultCache(str(tmp_path))]:
+            # Results of the first run are computed, results of the second
+            # run are cached.
+            assert _detect(configuration, result_cache=cache) == uncached_results
+            assert _detect(configuration, result_cache=cache) == uncached_results
+
+    def test_only_changed_expectations_are_validated(self):
+        data_smell_configuration: Dict[DataSmellType, Dict] = {
+            x: dict() for x in default_registry.get_registered_data_smells()
+        }
+        configuration = DataSmellAwareConfiguration(
+            column_names=None,
+            data_smell_configuration=data_smell_configuration
+        )
+        cache = RecordingResultCache()
+        _detect(configuration, result_cache=cache)
+        assert len(cache.stored_expectation_types) > 0
+
+        cache.stored_expectation_types = []
+        _detect(configuration, result_cache=cache)
+        assert cache.stored_expectation_types == []
+
+        # Change the parameter of a single data smell
+        data_smell_configuration[DataSmellType.LONG_DATA_VALUE_SMELL] = {
+            "length_threshold": 3
+        }
+        _detect(configuration, result_cache=cache)
+        assert len(cache.stored_expectation_types) > 0
+        assert set(cache.stored_expectation_types) == {
+            "expect_column_values_to_not_contain_long_data_value_smell"
+        }
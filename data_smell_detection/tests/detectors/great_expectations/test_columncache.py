@@ -0,0 +1,161 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validator import Validator
+
+import datasmelldetection.detectors.great_expectations.columncache as columncache
+from datasmelldetection.detectors.great_expectations.columncache import (
+    ColumnCache,
+    get_column_cache
+)
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+
+# Import the expectations for data smell detection
+default_registry.load_expectations()
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    return pd.DataFrame({
+        "float_col": [1.5, None, 2.25, -3.5, 4.0, None, 5.5, 6.5, 1000.5, 7.5],
+        "string_col": ["a", "b", None, "a", "c", "d", "e", None, "f", "g"],
+    })
+
+
+# The expectations of several data smells which are evaluated on the
+# non-null values of a column.
+def _get_configurations() -> List[ExpectationConfiguration]:
+    return [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_contain_suspect_sign_smell",
+            kwargs={"column": "float_col", "percentile_threshold": 0.2,
+                    "result_format": "COMPLETE"}
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_contain_extreme_value_smell",
+            kwargs={"column": "float_col", "threshold": 2, "result_format": "COMPLETE"}
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_contain_precision_inconsistencies",
+            kwargs={"column": "float_col", "result_format": "COMPLETE"}
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_contain_integer_as_floating_point_number_smell",
+            kwargs={"column": "float_col", "result_format": "COMPLETE"}
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_contain_duplicated_value_smell",
+            kwargs={"column": "string_col", "result_format": "COMPLETE"}
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_contain_long_data_value_smell",
+            kwargs={"column": "string_col", "length_threshold": 0, "result_format": "COMPLETE"}
+        ),
+    ]
+
+
+class TestColumnCache:
+    def test_column_is_cached_per_domain(self, dataframe):
+        cache = ColumnCache()
+        cached = cache.get(dataframe, "float_col")
+
+        np.testing.assert_array_equal(cached.null_mask, dataframe["float_col"].isnull())
+        assert cached.nonnull_values.tolist() == dataframe["float_col"].dropna().tolist()
+        assert cache.get(dataframe, "float_col") is cached
+        # The cached values of another domain (e.g. a row condition) are not
+        # reused.
+        domain = dataframe[dataframe["string_col"] == "a"]
+        assert cache.get(domain, "float_col").nonnull_values.tolist() == [1.5, -3.5]
+        assert len(cache) == 1
+
+        cache.release("float_col")
+        cache.release("unknown_col")
+        assert len(cache) == 0
+
+    def test_column_without_nulls_is_not_copied(self, dataframe):
+        cached = ColumnCache().get(dataframe.fillna(0), "float_col")
+
+        assert not cached.null_mask.any()
+        assert cached.expand([True] * 10).tolist() == [True] * 10
+
+    def test_expanded_flags_of_nulls_are_false(self, dataframe):
+        cached = ColumnCache().get(dataframe, "float_col")
+        flags = cached.expand(np.ones(len(cached.nonnull_values), dtype=bool))
+
+        assert flags.tolist() == dataframe["float_col"].notnull().tolist()
+        assert flags.index.equals(dataframe.index)
+
+    def test_cache_of_execution_engine(self):
+        execution_engine = PandasExecutionEngine()
+
+        assert get_column_cache(execution_engine) is get_column_cache(execution_engine)
+        assert get_column_cache(PandasExecutionEngine()) is not \
+            get_column_cache(execution_engine)
+
+
+class TestCachedMetrics:
+    def test_nulls_are_filtered_once_per_column(self, dataframe, monkeypatch):
+        cached_columns: List[str] = []
+        cache_column = columncache._cache_column
+
+        def recording_cache_column(data, column_name):
+            cached_columns.append(column_name)
+            return cache_column(data, column_name)
+        monkeypatch.setattr(columncache, "_cache_column", recording_cache_column)
+
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=dataframe)]
+        )
+        results = validator.graph_validate(configurations=_get_configurations())
+
+        assert all(not x.exception_info["raised_exception"] for x in results)
+        assert sorted(cached_columns) == ["float_col", "string_col"]
+        assert len(get_column_cache(validator.execution_engine)) == 2
+
+    def test_results_exclude_nulls(self, dataframe):
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=dataframe)]
+        )
+        results = validator.graph_validate(configurations=_get_configurations())
+
+        suspect_sign, extreme_value, precision, integer_as_float, duplicated, long_value = \
+            [x.result for x in results]
+        assert suspect_sign["unexpected_list"] == [-3.5]
+        assert suspect_sign["unexpected_index_list"] == [3]
+        assert extreme_value["unexpected_list"] == [1000.5]
+        assert extreme_value["unexpected_index_list"] == [8]
+        assert precision["unexpected_list"] == [2.25]
+        assert integer_as_float["unexpected_list"] == [4.0]
+        assert duplicated["unexpected_list"] == ["a", "a"]
+        assert duplicated["unexpected_index_list"] == [0, 3]
+        assert long_value["unexpected_count"] == 8
+        assert all(x["missing_count"] == 2 for x in [suspect_sign, duplicated])
+
+    def test_row_condition(self, dataframe):
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=dataframe)]
+        )
+        results = validator.graph_validate(configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_contain_duplicated_value_smell",
+                kwargs={"column": "string_col", "result_format": "COMPLETE"}
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_contain_duplicated_value_smell",
+                kwargs={"column": "string_col", "result_format": "COMPLETE",
+                        "row_condition": 'float_col>0', "condition_parser": "pandas"}
+            ),
+        ])
+
+        assert results[0].result["unexpected_list"] == ["a", "a"]
+        # The second "a" has a negative value in float_col.
+        assert results[1].result["unexpected_list"] == []
+        assert results[1].result["element_count"] == 7
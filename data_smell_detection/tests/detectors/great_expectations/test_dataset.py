@@ -1,5 +1,7 @@
 import os
 import great_expectations
+import pandas as pd
+import pytest
 from great_expectations.core.batch import BatchRequest
 
 from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
@@ -74,3 +76,49 @@ class TestDatasetWrapper:
         batch_identifiers = batch_request.partition_request["batch_identifiers"]
         assert "filename" in batch_identifiers
         assert batch_identifiers["filename"] == "data_smell_testset.csv"
+
+
+    def test_get_dataset_path(self):
+        path = manager.get_dataset_path("data_smell_testset.csv")
+        assert path == os.path.join(_test_data_directory, "data_smell_testset.csv")
+
+        with pytest.raises(ValueError):
+            manager.get_dataset_path("missing.csv")
+
+
+class TestChunkedCsvDataset:
+    def test_get_chunked_dataset(self):
+        dataset = manager.get_chunked_dataset("data_smell_testset.csv", chunksize=4)
+        assert isinstance(dataset, Dataset)
+        assert dataset.chunksize == 4
+
+        in_memory_dataset = manager.get_dataset("data_smell_testset.csv")
+        assert dataset.get_column_names() == in_memory_dataset.get_column_names()
+
+    def test_chunks_match_whole_file(self):
+        dataset = manager.get_chunked_dataset("data_smell_testset.csv", chunksize=4)
+        df = pd.DataFrame(manager.get_dataset("data_smell_testset.csv").get_great_expectations_dataset())
+
+        chunks = list(dataset.iter_chunks())
+        assert len(chunks) > 1
+        assert all(len(x) <= 4 for x in chunks)
+        # The dtypes of all chunks are the dtypes of the whole file
+        pd.testing.assert_frame_equal(pd.concat(chunks), df)
+        assert dataset.get_row_count() == len(df)
+
+        columns = dataset.read_columns(["int1", "string1"])
+        pd.testing.assert_frame_equal(columns, df[["int1", "string1"]])
+
+    def test_iter_column_batches(self):
+        dataset = manager.get_chunked_dataset("data_smell_testset.csv", chunksize=4)
+        df = pd.DataFrame(manager.get_dataset("data_smell_testset.csv").get_great_expectations_dataset())
+        columns = ["string1", "int1", "float1"]
+
+        # All columns fit into a single batch.
+        batch, = dataset.iter_column_batches(columns, memory_limit=2 ** 30)
+        pd.testing.assert_frame_equal(batch, df[columns])
+
+        # Each column exceeds the memory limit.
+        batches = list(dataset.iter_column_batches(columns, memory_limit=1))
+        assert [list(x.columns) for x in batches] == [[x] for x in columns]
+        pd.testing.assert_frame_equal(pd.concat(batches, axis=1), df[columns])
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+import asyncio
+import json
+from dataclasses import dataclass, replace
 import os
-from typing import List
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 import pytest
 
@@ -8,10 +10,21 @@ from datasmelldetection.core.detector import (
     DetectionStatistics,
     DetectionResult
 )
+from datasmelldetection.detectors.great_expectations.cache import LRUResultCache
+from datasmelldetection.detectors.great_expectations.chunked import (
+    DEFAULT_COLUMN_MEMORY_LIMIT,
+    ChunkedGreatExpectationsDetector
+)
+from datasmelldetection.detectors.great_expectations.columncache import ColumnCache
 from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
 from datasmelldetection.detectors.great_expectations.converter import StandardResultConverter
-from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.dataset import (
+    ChunkedCsvDataset,
+    DatasetWrapper,
+    FileBasedDatasetManager
+)
 from datasmelldetection.detectors.great_expectations.datasmell import (
+    DataSmell,
     DataSmellRegistry,
     DataSmellType
 )
@@ -27,8 +40,11 @@ from datasmelldetection.detectors.great_expectations.expectations import (
     ExpectColumnValuesToNotContainIntegerAsStringSmell,
     ExpectColumnValuesToNotContainFloatingPointNumberAsStringSmell,
     ExpectColumnValuesToNotContainCasingSmell,
-    ExpectColumnValuesToNotContainDuplicatedValueSmell
+    ExpectColumnValuesToNotContainDuplicatedValueSmell,
+    ExpectColumnValuesToNotContainPrecisionInconsistencies
 )
+from datasmelldetection.detectors.great_expectations.profiler import DataSmellAwareProfiler
+from datasmelldetection.detectors.great_expectations.type_inference import ColumnTypeCache
 from great_expectations.core import ExpectationValidationResult
 
 cwd = os.getcwd()
@@ -194,6 +210,38 @@ def registry() -> DataSmellRegistry:
     return registry
 
 
+# Write a CSV file to the directory and detect the data smell of a single
+# expectation in the whole file and in chunks of the file.
+def _detect_in_memory_and_chunked(
+        tmp_path, name: str, lines: List[str], expectation: Type[DataSmell],
+        configuration: Optional[Dict[DataSmellType, Dict]],
+        chunksize: int) -> Tuple[List[DetectionResult], List[DetectionResult]]:
+    with open(os.path.join(str(tmp_path), name), "w") as file:
+        file.write("\n".join(lines))
+    file_context = GreatExpectationsContextBuilder(
+        _test_great_expectations_directory,
+        str(tmp_path)
+    ).build()
+    file_dataset_manager = FileBasedDatasetManager(context=file_context)
+    registry = DataSmellRegistry()
+    expectation.register_data_smell(registry=registry)
+
+    datasets: List[Union[DatasetWrapper, ChunkedCsvDataset]] = [
+        file_dataset_manager.get_dataset(name),
+        file_dataset_manager.get_chunked_dataset(name, chunksize=chunksize)
+    ]
+    results: List[List[DetectionResult]] = []
+    for dataset in datasets:
+        builder = DetectorBuilder(context=file_context, dataset=dataset).set_registry(registry)
+        if configuration is not None:
+            builder.set_configuration(DataSmellAwareConfiguration(
+                column_names=None,
+                data_smell_configuration=configuration
+            ))
+        results.append(list(builder.build().detect()))
+    return results[0], results[1]
+
+
 class TestDetectorBuilder:
     def test_creation(self, registry):
         for testcase in testcases:
@@ -241,3 +289,323 @@ class TestDetectorBuilder:
                 # Ensure a matching DetectionResult object was returned for second testcase
                 assert any(map(is_match_expected_detection_result, detection_results2)), \
                     testcase.title
+
+    def test_parallel_detection(self, registry):
+        for testcase in testcases:
+            # Use the same configuration but perform validation using
+            # worker processes.
+            parallel_configuration = replace(testcase.configuration, max_workers=2)
+
+            serial_results = DetectorBuilder(context=context, dataset=data_smell_testset).\
+                set_registry(registry).\
+                set_configuration(testcase.configuration).\
+                build().\
+                detect()
+            parallel_results = DetectorBuilder(context=context, dataset=data_smell_testset).\
+                set_registry(registry).\
+                set_configuration(parallel_configuration).\
+                build().\
+                detect()
+
+            # The results must be identical (including their order).
+            assert parallel_results == serial_results, testcase.title
+
+    def test_chunked_detection(self, registry):
+        # Use a small chunk size to ensure that the test set is split into
+        # multiple chunks.
+        chunked_dataset = dataset_manager.get_chunked_dataset("data_smell_testset.csv", chunksize=3)
+
+        for testcase in testcases:
+            in_memory_results = DetectorBuilder(context=context, dataset=data_smell_testset).\
+                set_registry(registry).\
+                set_configuration(testcase.configuration).\
+                build().\
+                detect()
+            chunked_results = DetectorBuilder(context=context, dataset=chunked_dataset).\
+                set_registry(registry).\
+                set_configuration(testcase.configuration).\
+                build().\
+                detect()
+
+            # The results must be identical (including their order).
+            assert chunked_results == in_memory_results, testcase.title
+
+    def test_chunked_detection_does_not_support_result_cache(self, registry):
+        chunked_dataset = dataset_manager.get_chunked_dataset("data_smell_testset.csv", chunksize=3)
+        builder = DetectorBuilder(context=context, dataset=chunked_dataset).\
+            set_registry(registry).\
+            set_result_cache(LRUResultCache())
+
+        with pytest.raises(ValueError):
+            builder.build()
+
+    @pytest.mark.parametrize("memory_limit", [1, DEFAULT_COLUMN_MEMORY_LIMIT])
+    def test_chunked_detection_reads_columns_in_batches(self, registry, monkeypatch,
+                                                        memory_limit):
+        chunked_dataset = dataset_manager.get_chunked_dataset("data_smell_testset.csv", chunksize=3)
+        column_batches: List[List[str]] = []
+        iter_column_batches = chunked_dataset.iter_column_batches
+
+        def record_column_batches(columns, memory_limit):
+            for batch in iter_column_batches(columns, memory_limit):
+                column_batches.append(list(batch.columns))
+                yield batch
+        monkeypatch.setattr(chunked_dataset, "iter_column_batches", record_column_batches)
+
+        chunked_results = ChunkedGreatExpectationsDetector(
+            context=context,
+            dataset=chunked_dataset,
+            profiler=DataSmellAwareProfiler(),
+            registry=registry,
+            converter=StandardResultConverter(registry=registry),
+            configuration=None,
+            memory_limit=memory_limit
+        ).detect()
+        in_memory_results = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            build().\
+            detect()
+        assert chunked_results == in_memory_results
+
+        # The columns fit into a single batch unless each column exceeds the
+        # memory limit.
+        assert sum(len(x) for x in column_batches) > 1
+        if memory_limit == DEFAULT_COLUMN_MEMORY_LIMIT:
+            assert len(column_batches) == 1
+        else:
+            assert all(len(x) == 1 for x in column_batches)
+
+    def test_chunked_detection_with_aggregate_metrics(self, tmp_path):
+        # The dominant precision of the first chunks differs from the dominant
+        # precision of the whole column.
+        in_memory_results, chunked_results = _detect_in_memory_and_chunked(
+            tmp_path, "precision.csv",
+            lines=["float1"] + ["1.5"] * 4 + ["1.25"] * 6 + ["1.5"] * 3,
+            expectation=ExpectColumnValuesToNotContainPrecisionInconsistencies,
+            configuration=None,
+            chunksize=3
+        )
+
+        assert len(in_memory_results) == 1
+        assert in_memory_results[0].data_smell_type == DataSmellType.PRECISION_INCONSISTENCY_SMELL
+        assert in_memory_results[0].faulty_elements == [1.25] * 6
+        assert chunked_results == in_memory_results
+
+    def test_chunked_detection_of_extreme_values(self, tmp_path):
+        # The moments of the chunks are merged before the z-scores are
+        # computed. The outlier is not extreme within its own chunk.
+        in_memory_results, chunked_results = _detect_in_memory_and_chunked(
+            tmp_path, "extreme.csv",
+            lines=["int1"] + [str(x % 7) for x in range(40)] + ["1000", "999", "998"],
+            expectation=ExpectColumnValuesToNotContainExtremeValueSmell,
+            configuration=None,
+            chunksize=3
+        )
+
+        assert len(in_memory_results) == 1
+        assert in_memory_results[0].data_smell_type == DataSmellType.EXTREME_VALUE_SMELL
+        assert in_memory_results[0].faulty_elements == [1000, 999, 998]
+        assert chunked_results == in_memory_results
+
+    @pytest.mark.parametrize("approximate", [False, True])
+    def test_chunked_detection_of_suspect_signs(self, tmp_path, approximate):
+        # The first chunk only contains negative values. In approximate mode,
+        # the quantile sketches of the chunks are merged. Otherwise, the
+        # column is validated as a whole.
+        in_memory_results, chunked_results = _detect_in_memory_and_chunked(
+            tmp_path, "sign.csv",
+            lines=["int1", "-1", "-2", "-3"] + [str(x) for x in range(1, 60)],
+            expectation=ExpectColumnValuesToNotContainSuspectSignSmell,
+            configuration={
+                DataSmellType.SUSPECT_SIGN_SMELL: {"approximate": approximate, "mostly": 1}
+            },
+            chunksize=3
+        )
+
+        assert len(in_memory_results) == 1
+        assert in_memory_results[0].faulty_elements == [-1, -2, -3]
+        assert chunked_results == in_memory_results
+
+    def test_chunked_detection_of_duplicated_values(self, tmp_path):
+        # The duplicates sketches of the chunks are merged. The most
+        # duplicated values are reported first.
+        in_memory_results, chunked_results = _detect_in_memory_and_chunked(
+            tmp_path, "ids.csv",
+            lines=["int1"] + [str(x) for x in [3, 7] + list(range(10, 60)) + [7, 7, 3, 7]],
+            expectation=ExpectColumnValuesToNotContainDuplicatedValueSmell,
+            configuration={
+                DataSmellType.DUPLICATED_VALUE_SMELL: {"approximate": True, "mostly": 1}
+            },
+            chunksize=5
+        )
+
+        assert len(in_memory_results) == 1
+        assert in_memory_results[0].faulty_elements == [7, 3]
+        # All occurrences of the duplicated values are counted.
+        assert in_memory_results[0].statistics == DetectionStatistics(
+            total_element_count=56, faulty_element_count=6
+        )
+        assert chunked_results == in_memory_results
+
+    def test_column_types_are_cached_across_detections(self, registry, monkeypatch):
+        cache = ColumnTypeCache()
+        detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            set_configuration(DataSmellAwareConfiguration(
+                column_names=None,
+                data_smell_configuration=None,
+                strict_type_inference=True,
+                column_type_cache=cache
+            )).\
+            build()
+        first_results = detector.detect()
+        assert len(cache) == len(data_smell_testset.get_column_names())
+
+        # The types of the columns are not checked again.
+        def failing_get_column_type(df, column):
+            raise AssertionError("The type of a cached column is checked again.")
+        monkeypatch.setattr(DataSmellAwareProfiler, "_get_column_type", failing_get_column_type)
+        assert detector.detect() == first_results
+
+    def test_detection_does_not_import_dataset_again(self, registry, monkeypatch):
+        # The dataset which has already been imported must be validated
+        # instead of importing the dataset again using the data context.
+        def get_validator(*args, **kwargs):
+            raise AssertionError("Dataset imported again")
+        monkeypatch.setattr(context, "get_validator", get_validator)
+
+        for testcase in testcases:
+            detection_results = DetectorBuilder(context=context, dataset=data_smell_testset).\
+                set_registry(registry).\
+                set_configuration(testcase.configuration).\
+                build().\
+                detect()
+            assert len(detection_results) == len(testcase.expected_detection_results), \
+                testcase.title
+
+    def test_iter_detect(self, registry):
+        for testcase in testcases:
+            detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+                set_registry(registry).\
+                set_configuration(testcase.configuration).\
+                build()
+
+            # The detection results are yielded in the same order as they
+            # are returned by detect.
+            assert list(detector.iter_detect()) == detector.detect(), testcase.title
+
+    def test_iter_detect_yields_results_per_column(self, registry, monkeypatch):
+        detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            build()
+
+        # Record the validated columns.
+        validated_columns: List[str] = []
+        convert = detector.converter.convert
+
+        def recording_convert(validation_result):
+            columns = set(x.expectation_config.kwargs["column"] for x in validation_result.results)
+            assert len(columns) == 1
+            validated_columns.extend(columns)
+            return convert(validation_result)
+        monkeypatch.setattr(detector.converter, "convert", recording_convert)
+
+        iterator = detector.iter_detect()
+        first_result = next(iterator)
+        # Only the expectations of the column of the first result have been
+        # validated.
+        assert validated_columns[-1] == first_result.column_name
+        assert len(validated_columns) < len(data_smell_testset.get_column_names())
+
+        remaining_results = list(iterator)
+        assert len(validated_columns) == len(data_smell_testset.get_column_names())
+        assert [first_result] + remaining_results == detector.detect()
+
+    def test_cached_columns_are_released(self, registry, monkeypatch):
+        detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            build()
+
+        # Record the released columns and the number of columns which are
+        # still cached.
+        released_columns: List[str] = []
+        release = ColumnCache.release
+
+        def recording_release(self, column_name):
+            release(self, column_name)
+            released_columns.append(column_name)
+            assert len(self) == 0
+        monkeypatch.setattr(ColumnCache, "release", recording_release)
+
+        detection_results = detector.detect()
+        assert len(detection_results) > 0
+        assert sorted(released_columns) == sorted(data_smell_testset.get_column_names())
+
+    def test_detect_async(self, registry):
+        detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            build()
+
+        async def collect_results():
+            return [x async for x in detector.detect_async()]
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(collect_results()) == detector.detect()
+        finally:
+            loop.close()
+
+    def test_detect_with_report(self, registry):
+        for testcase in testcases:
+            detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+                set_registry(registry).\
+                set_configuration(testcase.configuration).\
+                build()
+
+            detection_results, report = detector.detect_with_report()
+            assert detection_results == detector.detect(), testcase.title
+
+            row_count = len(data_smell_testset.get_great_expectations_dataset())
+            assert report.row_count == row_count
+            assert len(report.get_measurements("profiling")) == 1
+            # Each expectation is measured separately.
+            validation_measurements = report.get_measurements("validation")
+            assert len(validation_measurements) > 0
+            assert all(x.expectation_type is not None for x in validation_measurements)
+            assert len(report.get_column_measurements("validation")) == \
+                len(report.get_measurements("conversion"))
+            for measurement in report.get_measurements():
+                assert measurement.row_count == row_count
+                assert measurement.wall_time >= 0
+                assert measurement.peak_memory >= 0
+
+            report_dict = json.loads(report.to_json())
+            assert len(report_dict["measurements"]) == len(report.measurements)
+            assert report_dict["wall_time"] == report.wall_time
+
+    def test_chunked_detect_with_report(self, registry):
+        chunked_dataset = dataset_manager.get_chunked_dataset("data_smell_testset.csv", chunksize=3)
+        row_count = len(data_smell_testset.get_great_expectations_dataset())
+        detector = DetectorBuilder(context=context, dataset=chunked_dataset).\
+            set_registry(registry).\
+            build()
+
+        detection_results, report = detector.detect_with_report()
+        assert detection_results == detector.detect()
+
+        assert report.row_count == row_count
+        # The first chunk is profiled.
+        assert [x.row_count for x in report.get_measurements("profiling")] == [3]
+        assert len(report.get_measurements("conversion")) == 1
+        # Each chunk pass and each expectation is measured.
+        validation_measurements = report.get_measurements("validation")
+        chunk_measurements = [x for x in validation_measurements if x.expectation_type is None]
+        assert len(chunk_measurements) > 0
+        assert sum(x.row_count for x in chunk_measurements) % row_count == 0
+        # Each expectation of each column is validated once.
+        expectations = [
+            (x.column_name, x.expectation_type) for x in validation_measurements
+            if x.expectation_type is not None
+        ]
+        assert len(expectations) == len(set(expectations))
+        assert set(x[0] for x in expectations) == chunked_dataset.get_column_names()
@@ -1,7 +1,17 @@
 # Check whether the expectations which implement data smell detection work as intended.
 # "Examples" are executed to test the behaviour.
-from typing import List
+from datetime import date, datetime
+import inspect
+import re
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation import Expectation
+from great_expectations.validator.validator import Validator
 
 from datasmelldetection.detectors.great_expectations.expectations import (
     ExpectColumnValuesToNotContainSuspectSignSmell,
@@ -9,9 +19,33 @@ from datasmelldetection.detectors.great_expectations.expectations import (
     ExpectColumnValuesToNotContainFloatingPointNumberAsStringSmell,
     ExpectColumnValuesToNotContainLongDataValueSmell,
     ExpectColumnValuesToNotContainIntegerAsFloatingPointNumberSmell,
-    ExpectColumnValuesToNotContainCasingSmell
+    ExpectColumnValuesToNotContainCasingSmell,
+    ExpectColumnValuesToNotContainPrecisionInconsistencies,
+    ExpectColumnValuesToNotContainSuspectDateValueSmell
 )
 
+from datasmelldetection.detectors.great_expectations.expectations.\
+    expect_column_values_to_not_contain_casing_smell import ColumnValuesDontContainCasingSmell
+from datasmelldetection.detectors.great_expectations.expectations.\
+    expect_column_values_to_not_contain_long_data_value_smell import (
+        MAX_WORD_LENGTH_SCAN_FEATURE,
+        ColumnValuesDontContainLongDataValueSmell,
+        get_long_data_values
+    )
+from datasmelldetection.detectors.great_expectations.expectations.\
+    expect_column_values_to_not_contain_precision_inconsistency_smell import (
+        _get_decimal_place_counts,
+        _has_dominant_precision
+    )
+from datasmelldetection.detectors.great_expectations.expectations.\
+    expect_column_values_to_not_contain_suspect_date_value_smell import (
+        DATE_KEY_SCAN_FEATURE,
+        ColumnValuesDontContainSuspectDateValueSmell
+    )
+from datasmelldetection.detectors.great_expectations.scanner import (
+    default_scan_feature_registry,
+    scan_column
+)
 from .helper_functions import check_expectation_examples
 
 
@@ -22,10 +56,152 @@ class TestExpectations:
         ExpectColumnValuesToNotContainFloatingPointNumberAsStringSmell(),
         ExpectColumnValuesToNotContainLongDataValueSmell(),
         ExpectColumnValuesToNotContainIntegerAsFloatingPointNumberSmell(),
-        ExpectColumnValuesToNotContainCasingSmell()
+        ExpectColumnValuesToNotContainCasingSmell(),
+        ExpectColumnValuesToNotContainPrecisionInconsistencies(),
+        ExpectColumnValuesToNotContainSuspectDateValueSmell()
     ]
 
     def test_examples_of_all_expectations(self):
         for expectation in self.expectations_to_test:
             print(f"Executing tests for {expectation.expectation_type}")
             check_expectation_examples(expectation)
+
+
+class TestCasingSmell:
+    def test_vectorized_wordcount_limits(self):
+        values = pd.Series([
+            "", " ", "abc", "ABC", "Abc", "aBc", "AbC", "ABc", "abc def", "ABC  DEF\t",
+            "Abc def", "abc. DEF", "abc. def", "x1Y", "1aB", "a-B", " aB", "(abc) DEF",
+            "a\nB", "abc\x1cdef", "The quick brown fox", "THE QUICK BROWN FOX"
+        ])
+        expected = np.array(
+            [ColumnValuesDontContainCasingSmell._get_casing_smell_wordcount_limit(x)
+             for x in values],
+            dtype=float
+        )
+        limits = ColumnValuesDontContainCasingSmell._get_casing_smell_wordcount_limits(values)
+        assert np.array_equal(limits, expected)
+
+    def test_vectorized_wordcount_limits_of_unsupported_values(self):
+        # Non-ASCII strings and values which are not strings are evaluated
+        # element-wise.
+        assert ColumnValuesDontContainCasingSmell._get_casing_smell_wordcount_limits(
+            pd.Series(["\u00e9t\u00e9 abc"])) is None
+        assert ColumnValuesDontContainCasingSmell._get_casing_smell_wordcount_limits(
+            pd.Series(["abc", 1], dtype=object)) is None
+
+
+class TestLongDataValueSmell:
+    values = pd.Series([
+        "word", "Incomprehensibilities", "a Pneumonoultramicroscopicsilicovolcanoconiosis b",
+        "Pseudopseudohypoparathyroidism", "", "twenty_characters_12", "word", 12345678901
+    ])
+
+    def test_several_thresholds(self):
+        thresholds = [10, 20, 30]
+        long_data_values = get_long_data_values(self.values, thresholds)
+
+        assert long_data_values.shape == (len(thresholds), len(self.values))
+        for i, threshold in enumerate(thresholds):
+            expected = [re.search(rf"\w{{{threshold},}}", str(x)) is not None for x in self.values]
+            assert list(long_data_values[i]) == expected
+
+    def test_thresholds_share_scan(self):
+        # Expectations with different thresholds which are validated together
+        # compute the word lengths once.
+        evaluated_values: List[Any] = []
+
+        def get_max_word_length(element: Any) -> int:
+            evaluated_values.append(element)
+            return ColumnValuesDontContainLongDataValueSmell._get_max_word_length(element)
+
+        default_scan_feature_registry.register(MAX_WORD_LENGTH_SCAN_FEATURE, get_max_word_length)
+        try:
+            df = pd.DataFrame({"column": self.values.astype(str)})
+            results = Validator(
+                execution_engine=PandasExecutionEngine(),
+                batches=[Batch(data=df)]
+            ).graph_validate(configurations=[
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_not_contain_long_data_value_smell",
+                    kwargs={"column": "column", "length_threshold": threshold, "mostly": 1}
+                )
+                for threshold in [10, 20, 30]
+            ])
+        finally:
+            default_scan_feature_registry.register(
+                MAX_WORD_LENGTH_SCAN_FEATURE,
+                ColumnValuesDontContainLongDataValueSmell._get_max_word_length
+            )
+
+        assert sorted(evaluated_values) == sorted(set(df["column"]))
+        assert [x.result["unexpected_count"] for x in results] == [5, 4, 2]
+
+
+class TestPrecisionInconsistencySmell:
+    def test_decimal_place_counts(self):
+        assert _get_decimal_place_counts(pd.Series([1.5, 2.25, 3.5, 1e-05, 4.0])) == \
+            {0: 1, 1: 3, 2: 1}
+        assert _get_decimal_place_counts(pd.Series(["1.50", "2", "1.2.3"])) == {0: 1, 1: 1, 2: 1}
+        assert _get_decimal_place_counts(pd.Series([], dtype=float)) == {}
+
+    def test_result_does_not_depend_on_order(self):
+        column = pd.Series([1.25, 1.5, 2.5, 3.5, 4.75])
+        expected = [False, True, True, True, False]
+
+        for permutation in [[0, 1, 2, 3, 4], [4, 3, 2, 1, 0], [1, 0, 4, 2, 3]]:
+            permuted = column.iloc[permutation]
+            result = _has_dominant_precision(permuted, _get_decimal_place_counts(permuted))
+            assert list(result.index) == permutation
+            assert list(result) == [expected[i] for i in permutation]
+
+    def test_decimal_place_counts_of_chunks_can_be_merged(self):
+        column = pd.Series([1.5, 1.5, 1.25, 1.25, 1.25, 1.5, 1.5])
+        merged: Dict[int, int] = dict()
+        for chunk in [column.iloc[:3], column.iloc[3:5], column.iloc[5:]]:
+            for decimal_places, count in _get_decimal_place_counts(chunk).items():
+                merged[decimal_places] = merged.get(decimal_places, 0) + count
+
+        assert merged == _get_decimal_place_counts(column)
+        # The first chunk is evaluated with the histogram of the whole column.
+        assert list(_has_dominant_precision(column.iloc[:3], merged)) == [True, True, False]
+
+
+class TestSuspectDateValueSmell:
+    def test_vectorized_date_keys(self):
+        values = pd.Series([
+            "2021-12-31", "2021-1-5", "2021-01- 5", "0001-01-01", "0000-01-01", "2000-02-29",
+            "1900-02-29", "2021-02-29", "2021-04-31", "2021-13-01", "2021-12-31 ", "2021-12-31\n",
+            "21-12-31", "3000-12-31", "", "hello"
+        ])
+        expected = np.array(
+            [ColumnValuesDontContainSuspectDateValueSmell._get_date_key(x) for x in values],
+            dtype=float
+        )
+        keys = ColumnValuesDontContainSuspectDateValueSmell._get_date_keys(values)
+        assert np.array_equal(keys, expected, equal_nan=True)
+        assert keys[0] == 20211231
+        assert keys[13] == 30001231
+
+        assert ColumnValuesDontContainSuspectDateValueSmell._get_date_keys(
+            pd.Series(["2021-12-31", 1], dtype=object)) is None
+
+    def test_thresholds(self):
+        values = pd.Series(["1999-12-31", "2000-01-01", "2010-06-15", "2020-12-31", "2021-01-01"])
+        scan = scan_column(values, [DATE_KEY_SCAN_FEATURE])
+        condition = inspect.unwrap(ColumnValuesDontContainSuspectDateValueSmell._pandas)
+
+        for past_threshold_date, future_threshold_date in [
+            ("2000-01-01", "2020-12-31"),
+            (date(2000, 1, 1), datetime(2020, 12, 31, 12))
+        ]:
+            result = condition(
+                ColumnValuesDontContainSuspectDateValueSmell, scan,
+                past_threshold_date=past_threshold_date,
+                future_threshold_date=future_threshold_date
+            )
+            assert list(result) == [False, True, True, True, False]
+
+        # By default, dates before 1950-01-01 and after tomorrow are suspect.
+        result = condition(ColumnValuesDontContainSuspectDateValueSmell, scan)
+        assert list(result) == [True] * 5
@@ -0,0 +1,172 @@
+import importlib
+import json
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+from datasmelldetection.detectors.great_expectations.datasmell import DataSmellRegistry
+import datasmelldetection.detectors.great_expectations.expectations as expectations
+from datasmelldetection.detectors.great_expectations.manifest import (
+    EXPECTATION_MANIFEST,
+    ExpectationManifestEntry,
+    register_manifest
+)
+from .helper_functions import check_data_smell_stored_in_registry
+
+
+# Import the detector in a new interpreter, profile a dataframe with a float
+# and an integer column and print the names of the imported expectation
+# modules after each step.
+_LAZY_LOADING_SCRIPT = """
+import json
+import sys
+
+import pandas as pd
+from great_expectations.dataset import PandasDataset
+
+from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+from datasmelldetection.detectors.great_expectations.detector import GreatExpectationsDetector
+from datasmelldetection.detectors.great_expectations.profiler import DataSmellAwareProfiler
+
+
+def get_imported_modules():
+    return sorted(
+        x.split(".")[-1] for x in sys.modules
+        if x.startswith("datasmelldetection.detectors.great_expectations.expectations.")
+    )
+
+
+result = {"import": get_imported_modules()}
+DataSmellAwareProfiler._profile(
+    PandasDataset(pd.DataFrame({"float": [1.5, 2.5], "int": [1, 2]})),
+    {
+        "registry": default_registry,
+        "data_smell_configuration": {
+            DataSmellType.EXTREME_VALUE_SMELL: {},
+            DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL: {},
+            DataSmellType.CASING_SMELL: {}
+        }
+    }
+)
+result["profile"] = get_imported_modules()
+print(json.dumps(result))
+"""
+
+# Import every module of the manifest in a new interpreter and print the
+# registrations which the modules perform on import.
+_REGISTRATION_SCRIPT = """
+import importlib
+import json
+
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+from datasmelldetection.detectors.great_expectations.manifest import EXPECTATION_MANIFEST
+
+registrations = {}
+
+
+def register(metadata, expectation_type, scan_features=(), module=None):
+    registrations[expectation_type] = {
+        "data_smell_type": metadata.data_smell_type.value,
+        "profiler_data_types": sorted(x.value for x in metadata.profiler_data_types),
+        "scan_features": sorted(scan_features),
+        "module": module
+    }
+
+
+default_registry.register = register
+for entry in EXPECTATION_MANIFEST:
+    importlib.import_module(entry.module)
+print(json.dumps(registrations))
+"""
+
+
+def _get_module_name(expectation_type: str) -> str:
+    return next(x for x in EXPECTATION_MANIFEST if x.expectation_type == expectation_type).module
+
+
+class TestExpectationManifest:
+    @pytest.mark.parametrize(
+        "entry", EXPECTATION_MANIFEST, ids=[x.class_name for x in EXPECTATION_MANIFEST]
+    )
+    def test_entry_matches_expectation_class(self, entry: ExpectationManifestEntry):
+        expectation_class = getattr(importlib.import_module(entry.module), entry.class_name)
+
+        assert expectation_class.expectation_type == entry.expectation_type
+        assert expectation_class.data_smell_metadata == entry.data_smell_metadata
+        assert expectation_class.scan_features == entry.scan_features
+        assert getattr(expectations, entry.class_name) is expectation_class
+
+    def test_entries_match_registrations_of_modules(self):
+        output = subprocess.run(
+            [sys.executable, "-c", _REGISTRATION_SCRIPT],
+            check=True, stdout=subprocess.PIPE
+        ).stdout
+        registrations: Dict[str, Dict] = json.loads(output)
+
+        assert registrations == {
+            entry.expectation_type: {
+                "data_smell_type": entry.data_smell_metadata.data_smell_type.value,
+                "profiler_data_types": sorted(
+                    x.value for x in entry.data_smell_metadata.profiler_data_types
+                ),
+                "scan_features": sorted(entry.scan_features),
+                "module": entry.module
+            }
+            for entry in EXPECTATION_MANIFEST
+        }
+
+    def test_register_manifest(self):
+        registry = DataSmellRegistry()
+        register_manifest(registry)
+
+        for entry in EXPECTATION_MANIFEST:
+            check_data_smell_stored_in_registry(
+                registry=registry,
+                metadata=entry.data_smell_metadata,
+                expectation_type=entry.expectation_type
+            )
+            assert registry.get_scan_features(entry.expectation_type) == set(entry.scan_features)
+        assert registry.get_registered_data_smells() == \
+            set(x.data_smell_metadata.data_smell_type for x in EXPECTATION_MANIFEST)
+
+    def test_unknown_expectation_class(self):
+        with pytest.raises(AttributeError):
+            getattr(expectations, "ExpectColumnValuesToNotContainUnknownSmell")
+
+    def test_load_expectations(self, monkeypatch):
+        registry = DataSmellRegistry()
+        # Register an expectation whose module has not been imported yet.
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        registry.register(
+            EXPECTATION_MANIFEST[0].data_smell_metadata,
+            expectation_type="expect_column_values_to_not_contain_test_smell",
+            module="colorsys"
+        )
+
+        # Expectation types without a module are skipped.
+        registry.load_expectations(["expect_column_values_to_not_contain_unknown_smell"])
+        assert "colorsys" not in sys.modules
+
+        registry.load_expectations(["expect_column_values_to_not_contain_test_smell"])
+        assert "colorsys" in sys.modules
+
+
+class TestLazyLoading:
+    def test_expectations_are_loaded_on_demand(self):
+        output = subprocess.run(
+            [sys.executable, "-c", _LAZY_LOADING_SCRIPT],
+            check=True, stdout=subprocess.PIPE
+        ).stdout
+        imported_modules: Dict[str, List[str]] = json.loads(output)
+
+        assert imported_modules["import"] == []
+        # The casing smell is not registered for numeric columns.
+        assert imported_modules["profile"] == sorted(
+            _get_module_name(x).split(".")[-1] for x in [
+                "expect_column_values_to_not_contain_extreme_value_smell",
+                "expect_column_values_to_not_contain_integer_as_floating_point_number_smell"
+            ]
+        )
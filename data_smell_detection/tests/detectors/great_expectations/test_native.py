@@ -0,0 +1,190 @@
+import os
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.dataset import PandasDataset
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validator import Validator
+
+from datasmelldetection.core import DataSmellType
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import (
+    DatasetWrapper,
+    FileBasedDatasetManager
+)
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+from datasmelldetection.detectors.great_expectations.detector import (
+    DataSmellAwareConfiguration,
+    DetectorBuilder,
+    NativeDetector
+)
+from datasmelldetection.detectors.great_expectations.native import (
+    NativeColumn,
+    NativeConditionRegistry,
+    validate_column_natively
+)
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+context_builder = GreatExpectationsContextBuilder(
+    _test_great_expectations_directory,
+    _test_data_directory
+)
+context = context_builder.build()
+
+dataset_manager = FileBasedDatasetManager(context=context)
+data_smell_testset = dataset_manager.get_dataset("data_smell_testset.csv")
+
+_RUNTIME_CONFIGURATION = {
+    "catch_exceptions": True,
+    "result_format": {"result_format": "BASIC"}
+}
+
+
+def _create_synthetic_dataset() -> DatasetWrapper:
+    rng = np.random.default_rng(0)
+    row_count = 200
+    dataframe = pd.DataFrame({
+        "null": [None] * row_count,
+        "bool": rng.choice([True, False], row_count),
+        "date": pd.date_range("2020-01-01", periods=row_count).astype(str),
+        "mixed": rng.choice(
+            ["1", "a", "2.5", "-3", "2020-01-01 10:00", " x", "Foo Bar", "N/A", None],
+            row_count
+        ),
+        "float": rng.normal(size=row_count) * rng.choice([1, -1, 100], row_count),
+        "int": rng.integers(-5, 100000, row_count)
+    })
+    return DatasetWrapper(PandasDataset(dataframe), batch_request=None)
+
+
+configurations: List[Optional[DataSmellAwareConfiguration]] = [
+    None,
+    DataSmellAwareConfiguration(
+        column_names=None,
+        data_smell_configuration={
+            DataSmellType.EXTREME_VALUE_SMELL: {"mostly": 1, "threshold": 1.5},
+            DataSmellType.SUSPECT_SIGN_SMELL: {"mostly": 1, "percentile_threshold": 0.25},
+            DataSmellType.LONG_DATA_VALUE_SMELL: {"mostly": 1, "length_threshold": 5},
+            DataSmellType.CASING_SMELL: {"mostly": 1, "same_case_wordcount_threshold": 1}
+        }
+    ),
+    DataSmellAwareConfiguration(
+        column_names=None,
+        data_smell_configuration=None,
+        fused_scan=False
+    ),
+    DataSmellAwareConfiguration(
+        column_names=None,
+        data_smell_configuration={
+            DataSmellType.DUPLICATED_VALUE_SMELL: {"mostly": 1, "approximate": True},
+            DataSmellType.SUSPECT_SIGN_SMELL: {"mostly": 1, "approximate": True}
+        }
+    )
+]
+
+
+class TestNativeDetector:
+    @pytest.mark.parametrize("dataset", [data_smell_testset, _create_synthetic_dataset()])
+    def test_results_match_great_expectations_detector(self, dataset):
+        for configuration in configurations:
+            builder = DetectorBuilder(context=context, dataset=dataset)
+            if configuration is not None:
+                builder.set_configuration(configuration)
+
+            native_detector = builder.build_native()
+            assert isinstance(native_detector, NativeDetector)
+
+            # The results must be identical (including their order).
+            assert native_detector.detect() == builder.build().detect()
+
+    def test_iter_detect(self):
+        detector = DetectorBuilder(context=context, dataset=data_smell_testset).build_native()
+        assert list(detector.iter_detect()) == detector.detect()
+
+    def test_chunked_dataset_is_not_supported(self):
+        chunked_dataset = dataset_manager.get_chunked_dataset("data_smell_testset.csv", chunksize=3)
+        with pytest.raises(ValueError):
+            DetectorBuilder(context=context, dataset=chunked_dataset).build_native()
+
+
+class TestValidateColumnNatively:
+    def test_registered_condition(self):
+        def condition(column: NativeColumn, **kwargs):
+            return column.values > 1
+
+        registry = NativeConditionRegistry()
+        registry.register("column_values.nonnull", condition)
+        configuration = ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a"}
+        )
+        result, = validate_column_natively(
+            pd.Series([1, 2, 3, None]),
+            [configuration],
+            _RUNTIME_CONFIGURATION,
+            registry=registry
+        )
+        assert result.result["unexpected_count"] == 1
+        assert result.result["partial_unexpected_list"] == [1]
+
+    def test_exceptions_are_caught(self):
+        configurations = [
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_contain_long_data_value_smell",
+                kwargs={"column": "a", "length_threshold": None}
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "a"}
+            )
+        ]
+        results = validate_column_natively(
+            pd.Series(["a", None]), configurations, _RUNTIME_CONFIGURATION
+        )
+        assert results[0].exception_info["raised_exception"]
+        assert results[1].expectation_config == configurations[1]
+        assert not results[1].success
+
+    @pytest.mark.parametrize("configuration, values, expected_result", [
+        (
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_contain_duplicated_value_smell",
+                kwargs={"column": "a", "approximate": True}
+            ),
+            [3, 7] + list(range(10, 60)) + [7, 7, 3, 7],
+            {"unexpected_count": 6, "partial_unexpected_list": [7, 3]}
+        ),
+        (
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_contain_suspect_sign_smell",
+                kwargs={"column": "a", "approximate": True, "percentile_threshold": 0.1}
+            ),
+            [*range(1, 50), -3, None, -7],
+            {"unexpected_count": 2, "details": {"quantile_rank_error": 0.0}}
+        )
+    ])
+    def test_aggregate_metrics_are_validated_by_validator(self, configuration, values,
+                                                          expected_result):
+        # The results of approximate modes depend on sketches which are not
+        # computed by native conditions.
+        default_registry.load_expectations([configuration.expectation_type])
+        column = pd.Series(values, name="a")
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=column.to_frame())]
+        )
+        validator_result, = validator.graph_validate(
+            configurations=[configuration], runtime_configuration=_RUNTIME_CONFIGURATION
+        )
+
+        result, = validate_column_natively(column, [configuration], _RUNTIME_CONFIGURATION)
+        assert result.to_json_dict() == validator_result.to_json_dict()
+        assert {k: result.result[k] for k in expected_result} == expected_result
@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validator import Validator
+
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+from datasmelldetection.detectors.great_expectations.native import NativeColumn
+from datasmelldetection.detectors.great_expectations.numeric import (
+    RunningMoments,
+    compute_numeric_statistics,
+    get_robust_z_scores,
+    has_fractional_part
+)
+from datasmelldetection.detectors.great_expectations.sketches import QuantileSketch
+
+# Import the expectations for data smell detection
+default_registry.load_expectations()
+
+
+_COLUMNS = [
+    pd.Series([-3, 0, 5, 7, 12, 12, 100]),
+    pd.Series(np.random.RandomState(0).randn(1000)),
+    pd.Series([1.5, -2.25, 0.0, np.inf]),
+    pd.Series(np.arange(20, dtype=np.uint8)),
+    pd.Series(np.random.RandomState(1).randn(100).astype(np.float32)),
+    pd.Series([1, 2.5, -4], dtype=object),
+    pd.Series([42]),
+    pd.Series([], dtype=np.float64)
+]
+
+
+# The statistics are computed in float64 (also for float32 columns).
+def _to_reference(column: pd.Series) -> pd.Series:
+    return column.astype(np.float64) if column.dtype == np.float32 else column
+
+
+class TestNumericStatistics:
+    @pytest.mark.parametrize("column", _COLUMNS)
+    def test_statistics_match_pandas(self, column):
+        statistics = compute_numeric_statistics(column)
+        column = _to_reference(column)
+
+        np.testing.assert_array_equal(statistics.mean, column.mean())
+        np.testing.assert_array_equal(statistics.standard_deviation, column.std())
+        assert statistics.count == len(column)
+        assert statistics.negative_count == (column < 0).sum()
+        assert statistics.zero_count == (column == 0).sum()
+        assert statistics.positive_count == (column > 0).sum()
+
+    @pytest.mark.parametrize("column", _COLUMNS)
+    def test_quantiles_match_pandas(self, column):
+        quantiles = [0, 0.1, 0.25, 0.5, 0.75, 1]
+        statistics = compute_numeric_statistics(column)
+
+        np.testing.assert_array_equal(
+            statistics.get_quantiles(quantiles),
+            column.quantile(quantiles, interpolation="linear").tolist()
+        )
+
+    @pytest.mark.parametrize("column", _COLUMNS)
+    def test_z_scores_match_pandas(self, column):
+        statistics = compute_numeric_statistics(column)
+        column = _to_reference(column)
+        expected = ((column - column.mean()) / column.std()).to_numpy(dtype=np.float64)
+
+        np.testing.assert_array_equal(statistics.get_z_scores(), expected)
+        buffer = np.empty_like(statistics.values)
+        assert statistics.get_z_scores(out=buffer) is buffer
+
+    def test_non_numeric_column(self):
+        with pytest.raises(TypeError):
+            compute_numeric_statistics(pd.Series(["a", "b"]))
+
+    def test_native_column_shares_statistics(self):
+        column = NativeColumn(pd.Series([1.0, None, 3.0]))
+
+        assert column.numeric_statistics is column.numeric_statistics
+        assert column.numeric_statistics.count == 2
+
+
+class TestRunningMoments:
+    @pytest.mark.parametrize("chunk_count", [1, 2, 7])
+    def test_merged_moments_match_pandas(self, chunk_count):
+        values = np.random.RandomState(0).randn(1000) * 1e3 + 1e6
+        merged = RunningMoments.from_values(np.array([]))
+        for chunk in np.array_split(values, chunk_count):
+            merged = merged.merge(RunningMoments.from_values(chunk))
+
+        assert merged.count == len(values)
+        assert merged.mean == pytest.approx(pd.Series(values).mean(), rel=1e-12)
+        assert merged.standard_deviation == pytest.approx(pd.Series(values).std(), rel=1e-9)
+
+    def test_single_value(self):
+        moments = RunningMoments.from_values(np.array([5.0]))
+
+        assert moments.mean == 5.0
+        assert np.isnan(moments.standard_deviation)
+
+
+class TestRobustZScores:
+    def test_robust_z_scores(self):
+        values = np.array([1.0, 2.0, 3.0, 4.0, 100.0])
+        z_scores = get_robust_z_scores(values, QuantileSketch.from_values(values))
+
+        # The median is 3 and the median absolute deviation is 1.
+        np.testing.assert_allclose(z_scores, (values - 3) / 1.4826)
+
+    def test_zero_median_absolute_deviation(self):
+        values = np.array([1.0, 1.0, 1.0, 5.0, -3.0])
+        z_scores = get_robust_z_scores(values, QuantileSketch.from_values(values))
+
+        assert z_scores.tolist() == [0, 0, 0, np.inf, -np.inf]
+
+    def test_robust_extreme_value_smell(self):
+        # The outliers inflate the standard deviation such that they are
+        # masked unless robust z-scores are used.
+        column = [10.0, 11.0, 9.0, 10.5, 9.5, 10.0, 11.0, 9.0, 1000.0, 2000.0]
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=pd.DataFrame({"column": column}))]
+        )
+        unexpected_lists = dict()
+        for robust in (False, True):
+            result = validator.graph_validate(configurations=[ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_contain_extreme_value_smell",
+                kwargs={"column": "column", "robust": robust, "result_format": "COMPLETE"}
+            )])[0]
+            unexpected_lists[robust] = result.result["unexpected_list"]
+
+        assert unexpected_lists == {False: [], True: [1000.0, 2000.0]}
+
+
+class TestHasFractionalPart:
+    @pytest.mark.parametrize("column", [
+        pd.Series([1.0, 1.5, -2.0, 2.0001, -0.49, 1e20, np.inf]),
+        pd.Series([1, 2, 3]),
+        pd.Series([True, False])
+    ])
+    @pytest.mark.parametrize("epsilon", [0.001, 0.1])
+    def test_matches_pandas(self, column, epsilon):
+        expected = (column - column.round(decimals=0)).abs() > epsilon
+
+        assert has_fractional_part(column, epsilon).tolist() == expected.tolist()
+
+    def test_object_column(self):
+        # NOTE: Rounding object columns fails in pandas as well.
+        with pytest.raises(TypeError):
+            has_fractional_part(pd.Series([1.0, 2.5], dtype=object), 0.1)
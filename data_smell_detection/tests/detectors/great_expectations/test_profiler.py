@@ -14,6 +14,7 @@ from datasmelldetection.detectors.great_expectations.profiler import DataSmellAw
 import datasmelldetection.detectors.great_expectations.expectations
 from datasmelldetection.detectors.great_expectations.datasmell import default_registry, \
     DataSmellRegistry
+from datasmelldetection.detectors.great_expectations.type_inference import ColumnTypeCache
 
 from .fixtures import (
     data_smell_registry_empty,
@@ -528,3 +529,90 @@ class TestDataSmellAwareProfiler:
                 process_testcase(testcase)
             except AssertionError as e:
                 raise AssertionError(f"During execution of testcase {testcase.title}: {e}")
+
+    @pytest.mark.parametrize("strict_type_inference", [False, True])
+    def test_type_inference_modes(self, pandas_dataset1, expected_column_types_dataset1,
+                                  strict_type_inference):
+        expectation_suite, _ = DataSmellAwareProfiler.profile(
+            data_asset=pandas_dataset1,
+            profiler_configuration={
+                "registry": default_registry,
+                "strict_type_inference": strict_type_inference,
+                "column_type_cache": None
+            }
+        )
+
+        check_column_types_in_expectation_suite_meta_information(
+            suite=expectation_suite,
+            expected_column_types=expected_column_types_dataset1
+        )
+
+    def test_column_types_are_cached(self, pandas_dataset1, monkeypatch):
+        cache = ColumnTypeCache()
+        configuration = {
+            "registry": default_registry,
+            "strict_type_inference": True,
+            "column_type_cache": cache
+        }
+        first_suite, _ = DataSmellAwareProfiler.profile(
+            data_asset=pandas_dataset1,
+            profiler_configuration=configuration
+        )
+        assert len(cache) == len(pandas_dataset1.columns)
+
+        # The types of the columns are not checked again.
+        def failing_get_column_type(df, column):
+            raise AssertionError("The type of a cached column is checked again.")
+        monkeypatch.setattr(DataSmellAwareProfiler, "_get_column_type", failing_get_column_type)
+        second_suite, _ = DataSmellAwareProfiler.profile(
+            data_asset=pandas_dataset1,
+            profiler_configuration=configuration
+        )
+        assert second_suite.meta["columns"] == first_suite.meta["columns"]
+
+    def test_sampled_column_types_are_not_cached(self, pandas_dataset1):
+        cache = ColumnTypeCache()
+        DataSmellAwareProfiler.profile(
+            data_asset=pandas_dataset1,
+            profiler_configuration={
+                "registry": default_registry,
+                "strict_type_inference": False,
+                "column_type_cache": cache
+            }
+        )
+        assert len(cache) == 0
+
+    def test_expectations_are_instantiated_from_templates(self, pandas_dataset1):
+        data_smell_configuration = {
+            DataSmellType.EXTREME_VALUE_SMELL: {"threshold": 3},
+            DataSmellType.LONG_DATA_VALUE_SMELL: {"length_threshold": 2},
+            DataSmellType.DUMMY_VALUE_SMELL: {"result_format": {"result_format": "BASIC"}}
+        }
+        expectation_suite, _ = DataSmellAwareProfiler.profile(
+            data_asset=pandas_dataset1,
+            profiler_configuration={
+                "registry": default_registry,
+                "data_smell_configuration": data_smell_configuration
+            }
+        )
+
+        # The suite matches a suite whose expectations are added one at a
+        # time.
+        expected_suite = ExpectationSuite(expectation_suite_name="expected")
+        for configuration in expectation_suite.expectations:
+            expected_suite.add_expectation(deepcopy(configuration))
+        assert expectation_suite.expectations == expected_suite.expectations
+        assert [x.kwargs["column"] for x in expectation_suite.expectations] == \
+            sorted((x.kwargs["column"] for x in expectation_suite.expectations),
+                   key=list(pandas_dataset1.columns).index)
+
+        # The kwargs of the expectations do not share mutable values.
+        dummy_value_kwargs = [
+            x.kwargs for x in expectation_suite.expectations
+            if x.expectation_type == "expect_column_values_to_not_contain_dummy_value_smell"
+        ]
+        assert len(dummy_value_kwargs) > 0
+        dummy_value_kwargs[0]["result_format"]["result_format"] = "COMPLETE"
+        assert all(x["result_format"] == {"result_format": "BASIC"} for x in dummy_value_kwargs[1:])
+        assert data_smell_configuration[DataSmellType.DUMMY_VALUE_SMELL]["result_format"] == \
+            {"result_format": "BASIC"}
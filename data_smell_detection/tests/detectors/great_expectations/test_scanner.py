@@ -0,0 +1,258 @@
+import re
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.core.batch import Batch
+from great_expectations.dataset.pandas_dataset import PandasDataset
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.profile.base import ProfilerDataType
+from great_expectations.validator.validator import Validator
+
+from datasmelldetection.core import DataSmellType
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+# Register expectations for data smell detection
+import datasmelldetection.detectors.great_expectations.expectations
+from datasmelldetection.detectors.great_expectations.profiler import DataSmellAwareProfiler
+from datasmelldetection.detectors.great_expectations.scanner import (
+    SCAN_FEATURES_META_KEY,
+    RegexMatcher,
+    ScanFeatureRegistry,
+    factorize_values,
+    regex_scan_feature,
+    scan_column
+)
+
+
+@pytest.fixture
+def scan_feature_registry() -> ScanFeatureRegistry:
+    registry = ScanFeatureRegistry()
+    registry.register("length", len)
+    registry.register("upper", lambda x: x.upper() == x)
+    return registry
+
+
+@pytest.fixture
+def string_dataframe() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "string_col1": ["abc def", "ABC DEF", "aBc", "  lead", None, "2020-01-01", "N/A", "-42",
+                            "Pneumonoultramicroscopicsilicovolcanoconiosis", "Hello World"],
+            "string_col2": ["1.5", "12:30", None, "trail  ", "UNK", "x", "3000-01-01", "A  B", "abc", "1"],
+            "int_col1": [0, 1, 2, 3, 4, 5, 6, 999, 8, 9],
+        }
+    )
+
+
+# Profile the dataframe with all registered data smells and return the
+# results of the validation of the generated expectations.
+def _validate_profiled_dataframe(df: pd.DataFrame, fused_scan: bool) -> List[Dict[str, Any]]:
+    suite: ExpectationSuite
+    suite, _ = DataSmellAwareProfiler.profile(
+        data_asset=PandasDataset(df),
+        profiler_configuration={
+            "registry": default_registry,
+            "fused_scan": fused_scan
+        }
+    )
+    results = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=df)]
+    ).graph_validate(configurations=suite.expectations)
+    return [
+        {
+            "expectation_config": result.expectation_config.kwargs,
+            "expectation_type": result.expectation_config.expectation_type,
+            "success": result.success,
+            "result": result.result
+        }
+        for result in results
+    ]
+
+
+class TestScanColumn:
+    def test_scan_features(self, scan_feature_registry):
+        column = pd.Series(["a", "BC", "def"], index=[3, 5, 7])
+        scan = scan_column(column, ["length", "upper"], registry=scan_feature_registry)
+
+        assert list(scan.index) == [3, 5, 7]
+        assert list(scan["length"]) == [1, 2, 3]
+        assert list(scan["upper"]) == [False, True, False]
+
+    def test_regex_scan_feature(self, scan_feature_registry):
+        # Regex features don't have to be registered. The string
+        # representation of the values is searched.
+        feature = regex_scan_feature(r"^\d+$")
+        scan = scan_column(pd.Series(["1", "a", 2]), [feature], registry=scan_feature_registry)
+
+        assert list(scan[feature]) == [True, False, True]
+
+    def test_failing_feature(self, scan_feature_registry):
+        # Only the failing feature raises the exception when it is accessed.
+        scan = scan_column(pd.Series(["a", 1]), ["length", "upper"], registry=scan_feature_registry)
+
+        assert "length" in scan
+        with pytest.raises(TypeError):
+            _ = scan["length"]
+        with pytest.raises(AttributeError):
+            _ = scan["upper"]
+
+    def test_unknown_feature(self, scan_feature_registry):
+        with pytest.raises(KeyError):
+            scan_column(pd.Series(["a"]), ["unknown"], registry=scan_feature_registry)
+
+    def test_features_are_computed_per_distinct_value(self):
+        evaluated_values: List[Any] = []
+
+        def length(value):
+            evaluated_values.append(value)
+            return len(value)
+
+        registry = ScanFeatureRegistry()
+        registry.register("length", length)
+        column = pd.Series(["ab", "c", "ab", "ab", "def", "c"], index=[1, 2, 3, 4, 5, 6])
+        scan = scan_column(column, ["length"], registry=registry)
+
+        assert evaluated_values == ["ab", "c", "def"]
+        assert list(scan.index) == [1, 2, 3, 4, 5, 6]
+        assert list(scan["length"]) == [2, 1, 2, 2, 3, 1]
+
+    @pytest.mark.parametrize("column", [
+        # Equal values of different types have different string
+        # representations.
+        pd.Series([1, 1.0, True, "1", 1], dtype=object),
+        pd.Series([0.0, -0.0, 0.0, 1.5]),
+        pd.Series([3, 1, 3, 2]),
+        pd.Series(pd.to_datetime(["2020-01-01", "2021-01-01", "2020-01-01"]))
+    ])
+    def test_features_match_values(self, column):
+        regex = r"^-|\.|True|2020"
+        scan = scan_column(column, [regex_scan_feature(regex)])
+
+        expected = [re.search(regex, str(x)) is not None for x in column.tolist()]
+        assert list(scan[regex_scan_feature(regex)]) == expected
+
+    def test_vectorized_feature(self, scan_feature_registry):
+        vectorized_values: List[List[Any]] = []
+
+        def vectorized_length(values: pd.Series):
+            vectorized_values.append(values.tolist())
+            if not all(isinstance(x, str) for x in values):
+                return None
+            return values.str.len().to_numpy()
+
+        scan_feature_registry.register("length", len, vectorized_extractor=vectorized_length)
+        scan = scan_column(pd.Series(["ab", "c", "ab"]), ["length", "upper"],
+                           registry=scan_feature_registry)
+        # The vectorized extractor is called once with the distinct values.
+        assert vectorized_values == [["ab", "c"]]
+        assert list(scan["length"]) == [2, 1, 2]
+        assert list(scan["upper"]) == [False, False, False]
+
+        # The extractor is used for unsupported values.
+        scan = scan_column(pd.Series(["ab", 1]), ["length"], registry=scan_feature_registry)
+        with pytest.raises(TypeError):
+            _ = scan["length"]
+
+
+class TestFactorizeValues:
+    def test_codes_and_distinct_values(self):
+        codes, distinct_values = factorize_values(pd.Series(["b", "a", "b", "c"]))
+        assert list(codes) == [0, 1, 0, 2]
+        assert list(distinct_values) == ["b", "a", "c"]
+        assert list(distinct_values.index) == [0, 1, 3]
+
+    def test_signed_zeros_are_distinct(self):
+        codes, distinct_values = factorize_values(pd.Series([0.0, -0.0, 0.0]))
+        assert list(codes) == [0, 1, 0]
+        assert len(distinct_values) == 2
+
+    def test_mixed_object_column(self):
+        assert factorize_values(pd.Series([1, "1"])) is None
+
+
+class TestRegexMatcher:
+    def test_bitmasks_match_searches(self):
+        # The first two regexes are evaluated by set lookups.
+        regexes = [r"^(0|1|999|UNK|N/A)$", r"^(?:a b)$", r"^(a|b)c$", r"\d{3}", r"^a|b$"]
+        values = ["0", "1\n", "1\n\n", "x1", "999", "UNK", "N/A", "a b", "a bc", "ac", "bc\n",
+                  "b", 1, 999.0, True]
+        bitmasks = RegexMatcher(regexes).match(pd.Series(values, dtype=object))
+
+        for i, regex in enumerate(regexes):
+            expected = [re.search(regex, str(x)) is not None for x in values]
+            assert [bool(x & (1 << i)) for x in bitmasks.tolist()] == expected
+
+    def test_scan_features_are_matched_together(self):
+        regexes = [r"^(0|1)$", r"\d", r"^a"]
+        column = pd.Series(["0", "a1", "b", "0", "1"])
+        scan = scan_column(column, [regex_scan_feature(x) for x in regexes])
+
+        for regex in regexes:
+            expected = [re.search(regex, x) is not None for x in column]
+            assert list(scan[regex_scan_feature(regex)]) == expected
+
+    def test_too_many_regexes(self):
+        with pytest.raises(ValueError):
+            RegexMatcher([str(x) for x in range(RegexMatcher.max_regex_count + 1)])
+
+
+class TestFusedScan:
+    def test_profiler_scan_features_meta(self, string_dataframe):
+        suite, _ = DataSmellAwareProfiler.profile(
+            data_asset=PandasDataset(string_dataframe),
+            profiler_configuration={"registry": default_registry}
+        )
+
+        # All expectations of a column request the same scan features which
+        # contain the features of each expectation of the column.
+        for column in string_dataframe.columns:
+            configurations: List[ExpectationConfiguration] = [
+                x for x in suite.expectations if x.kwargs["column"] == column
+            ]
+            features = set()
+            for configuration in configurations:
+                features.update(default_registry.get_scan_features(configuration.expectation_type))
+
+            for configuration in configurations:
+                if features:
+                    assert configuration.meta[SCAN_FEATURES_META_KEY] == sorted(features)
+                else:
+                    assert SCAN_FEATURES_META_KEY not in configuration.meta
+
+        # Ensure that string smells are evaluated by the scan
+        casing_expectation_type = default_registry.get_smell_dict_for_profiler_data_type(
+            ProfilerDataType.STRING)[DataSmellType.CASING_SMELL]
+        assert len(default_registry.get_scan_features(casing_expectation_type)) > 0
+
+    def test_profiler_without_fused_scan(self, string_dataframe):
+        suite, _ = DataSmellAwareProfiler.profile(
+            data_asset=PandasDataset(string_dataframe),
+            profiler_configuration={"registry": default_registry, "fused_scan": False}
+        )
+
+        for configuration in suite.expectations:
+            assert SCAN_FEATURES_META_KEY not in configuration.meta
+
+    def test_results_match_separate_scans(self, string_dataframe):
+        fused_results = _validate_profiled_dataframe(string_dataframe, fused_scan=True)
+        separate_results = _validate_profiled_dataframe(string_dataframe, fused_scan=False)
+
+        assert len(fused_results) > 0
+        assert fused_results == separate_results
+
+    def test_casing_smell_result(self, string_dataframe):
+        results = _validate_profiled_dataframe(string_dataframe, fused_scan=True)
+        casing_expectation_type = default_registry.get_smell_dict_for_profiler_data_type(
+            ProfilerDataType.STRING)[DataSmellType.CASING_SMELL]
+
+        casing_results = [
+            x for x in results
+            if x["expectation_type"] == casing_expectation_type and
+            x["expectation_config"]["column"] == "string_col1"
+        ]
+        assert len(casing_results) == 1
+        assert casing_results[0]["success"] is False
+        assert set(casing_results[0]["result"]["partial_unexpected_list"]) == \
+            {"abc def", "ABC DEF", "aBc"}
@@ -0,0 +1,270 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validator import Validator
+
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+from datasmelldetection.detectors.great_expectations.sketches import (
+    CountMinSketch,
+    DistinctSample,
+    DuplicatesSketch,
+    FrequentValues,
+    HyperLogLog,
+    QuantileSketch,
+    hash_values
+)
+
+# Import the expectations for data smell detection
+default_registry.load_expectations()
+
+
+_QUANTILES = [0, 0.1, 0.25, 0.5, 0.75, 0.9, 1]
+
+
+class TestQuantileSketch:
+    @pytest.mark.parametrize("values", [
+        np.array([3.0, -1.0, 2.5, 7.0, 7.0, 0.0]),
+        np.random.RandomState(0).randn(1000),
+        np.array([42.0])
+    ])
+    def test_exact_quantiles_match_pandas(self, values):
+        sketch = QuantileSketch.from_values(values)
+
+        assert sketch.is_exact
+        assert sketch.get_quantiles(_QUANTILES) == \
+            pd.Series(values).quantile(_QUANTILES, interpolation="linear").tolist()
+        median = np.median(values)
+        assert sketch.get_median_absolute_deviation() == np.median(np.abs(values - median))
+
+    def test_empty_sketch(self):
+        sketch = QuantileSketch.from_values(np.array([]))
+
+        assert np.isnan(sketch.get_quantiles([0.5])[0])
+        assert np.isnan(sketch.get_median_absolute_deviation())
+
+    def test_compacted_quantiles_are_approximate(self):
+        values = np.random.RandomState(1).randn(100000)
+        sketch = QuantileSketch.from_values(values, capacity=256)
+
+        assert not sketch.is_exact
+        assert sketch.count == len(values)
+        assert all(len(x) <= 256 for x in sketch.levels)
+        # The ranks of the approximated quantiles are close to the requested
+        # ranks.
+        ranks = np.searchsorted(np.sort(values), sketch.get_quantiles(_QUANTILES)) / len(values)
+        np.testing.assert_allclose(ranks, _QUANTILES, atol=0.02)
+
+    def test_merged_sketches(self):
+        values = np.random.RandomState(2).standard_cauchy(20000)
+        chunks = np.array_split(values, 7)
+        merged = QuantileSketch.from_values(chunks[0], capacity=512)
+        for chunk in chunks[1:]:
+            merged = merged.merge(QuantileSketch.from_values(chunk, capacity=512))
+
+        assert merged.count == len(values)
+        ranks = np.searchsorted(np.sort(values), merged.get_quantiles(_QUANTILES)) / len(values)
+        np.testing.assert_allclose(ranks, _QUANTILES, atol=0.02)
+
+    @pytest.mark.parametrize("rank_error", [0.1, 0.01])
+    def test_rank_error_bound(self, rank_error):
+        values = np.random.RandomState(4).exponential(size=200000)
+        sketch = QuantileSketch.from_values(values, capacity=QuantileSketch.get_capacity(rank_error))
+
+        assert 0 < sketch.rank_error <= rank_error
+        ranks = np.searchsorted(np.sort(values), sketch.get_quantiles(_QUANTILES)) / len(values)
+        # NOTE: The interpolation between the stored values may shift the
+        # ranks by a single value.
+        np.testing.assert_allclose(ranks, _QUANTILES, atol=sketch.rank_error + 1 / len(values))
+
+    def test_invalid_rank_error(self):
+        with pytest.raises(ValueError):
+            QuantileSketch.get_capacity(0)
+
+    def test_merge_of_exact_sketches_is_exact(self):
+        values = np.random.RandomState(3).randn(100)
+        merged = QuantileSketch.from_values(values[:30]).merge(QuantileSketch.from_values(values[30:]))
+
+        assert merged.is_exact
+        assert merged.get_quantiles(_QUANTILES) == QuantileSketch.from_values(values).\
+            get_quantiles(_QUANTILES)
+
+    def test_capacities_must_match(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(capacity=16).merge(QuantileSketch(capacity=32))
+
+
+class TestHyperLogLog:
+    @pytest.mark.parametrize("distinct_count", [0, 10, 1000, 100000])
+    def test_estimated_count(self, distinct_count):
+        values = np.random.RandomState(0).permutation(np.repeat(np.arange(distinct_count), 3))
+        sketch = HyperLogLog()
+        sketch.add_hashes(hash_values(values))
+
+        assert sketch.estimate_count() == pytest.approx(
+            distinct_count, rel=3 * sketch.relative_error, abs=0.5
+        )
+
+    def test_merged_sketches(self):
+        values = np.random.RandomState(1).randint(0, 50000, size=200000)
+        merged = HyperLogLog()
+        for chunk in np.array_split(values, 7):
+            sketch = HyperLogLog()
+            sketch.add_hashes(hash_values(chunk))
+            merged = merged.merge(sketch)
+        expected = HyperLogLog()
+        expected.add_hashes(hash_values(values))
+
+        np.testing.assert_array_equal(merged.registers, expected.registers)
+
+    def test_invalid_precision(self):
+        with pytest.raises(ValueError):
+            HyperLogLog(precision=20)
+
+
+class TestCountMinSketch:
+    def test_counts_are_not_underestimated(self):
+        values = np.random.RandomState(2).zipf(1.5, size=100000)
+        sketch = CountMinSketch(width=2 ** 10)
+        sketch.add_hashes(hash_values(values))
+        counts = pd.Series(values).value_counts()
+
+        estimates = sketch.estimate_counts(hash_values(counts.index.to_numpy()))
+        assert np.all(estimates >= counts.to_numpy())
+        # The estimates of the most frequent values are accurate.
+        np.testing.assert_allclose(estimates[:10], counts.to_numpy()[:10], rtol=0.05)
+
+    def test_invalid_width(self):
+        with pytest.raises(ValueError):
+            CountMinSketch(width=1000)
+
+
+class TestFrequentValues:
+    def test_heavy_hitters_are_tracked(self):
+        random_state = np.random.RandomState(3)
+        values = random_state.permutation(np.concatenate([
+            random_state.randint(1000, 10 ** 9, size=200000),
+            np.repeat([1, 2, 3], [5000, 3000, 1000])
+        ]))
+        summary = FrequentValues(capacity=64)
+        summary.add(values, hash_values(values))
+
+        assert len(summary.counts) <= 64
+        tracked = {summary.values[int(h)]: x for h, x in zip(summary.hashes, summary.counts)}
+        for value, count in [(1, 5000), (2, 3000), (3, 1000)]:
+            assert count - summary.error <= tracked[value] <= count
+
+    def test_capacities_must_match(self):
+        with pytest.raises(ValueError):
+            FrequentValues(capacity=16).merge(FrequentValues(capacity=32))
+
+
+class TestDistinctSample:
+    def test_exact_below_capacity(self):
+        values = np.array([1, 2, 2, 3, 3, 3, 4])
+        sample = DistinctSample(capacity=4)
+        sample.add_hashes(hash_values(values))
+
+        assert sample.level == 0
+        assert sample.estimate_duplicated_count() == 5
+        assert sample.estimate_duplicated_count(hash_values(np.array([3]))) == 2
+
+    def test_merged_samples_are_bounded(self):
+        values = np.random.RandomState(5).randint(0, 20000, size=40000)
+        merged = DistinctSample(capacity=256)
+        for chunk in np.array_split(values, 4):
+            sample = DistinctSample(capacity=256)
+            sample.add_hashes(hash_values(chunk))
+            merged = merged.merge(sample)
+
+        assert len(merged.hashes) <= 256
+        assert np.all(merged.hashes >> np.uint64(64 - merged.level) == 0)
+        expected_count = pd.Series(values).duplicated(keep=False).sum()
+        assert merged.estimate_duplicated_count() == pytest.approx(expected_count, rel=0.25)
+
+    def test_capacities_must_match(self):
+        with pytest.raises(ValueError):
+            DistinctSample(capacity=16).merge(DistinctSample(capacity=32))
+
+
+class TestDuplicatesSketch:
+    def test_exact_for_few_distinct_values(self):
+        values = np.array(["a", "b", "a", "c", "a", "b", "d"], dtype=object)
+        sketch = DuplicatesSketch.from_values(values)
+
+        assert sketch.estimate_distinct_count() == 4
+        assert sketch.estimate_duplicate_count() == 5
+        assert sketch.estimate_duplicate_ratio() == 5 / 7
+        assert sketch.get_top_duplicated_values(5) == [("a", 3), ("b", 2)]
+        assert sketch.get_top_duplicated_values(1) == [("a", 3)]
+
+    def test_empty_sketch(self):
+        sketch = DuplicatesSketch.from_values(np.array([], dtype=np.int64))
+
+        assert sketch.estimate_duplicate_ratio() == 0
+        assert sketch.get_top_duplicated_values(5) == []
+
+    def test_merged_sketches(self):
+        random_state = np.random.RandomState(4)
+        values = random_state.permutation(np.concatenate([
+            np.arange(100000), np.repeat([7, 8], [500, 200])
+        ]))
+        merged = DuplicatesSketch()
+        for chunk in np.array_split(values, 5):
+            merged = merged.merge(DuplicatesSketch.from_values(chunk))
+
+        assert merged.count == len(values)
+        # The 100000 distinct values exceed the capacity of the distinct
+        # sample. Therefore, the duplicated values are estimated.
+        assert merged.distinct_sample.level > 0
+        assert merged.estimate_duplicate_count() == pytest.approx(702, rel=0.05)
+        assert merged.get_top_duplicated_values(2) == [(7, 501), (8, 201)]
+
+    @pytest.mark.parametrize("values, relative_error", [
+        (["x", "y", "x", "z", "x", "w", "y", None], 0),
+        ([3, 7] + list(range(10, 60)) + [7, 7, 3, 7], 0),
+        (list(np.random.RandomState(2).randint(0, 100000, size=100000)), 0.05)
+    ])
+    def test_approximate_and_exact_duplicated_value_smell_agree(self, values, relative_error):
+        # Both modes count all occurrences of the duplicated values.
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=pd.DataFrame({"column": values}))]
+        )
+        exact_result, approximate_result = validator.graph_validate(configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_contain_duplicated_value_smell",
+                kwargs={"column": "column", "approximate": approximate}
+            )
+            for approximate in [False, True]
+        ])
+
+        expected_count = int(pd.Series(values).dropna().duplicated(keep=False).sum())
+        assert exact_result.result["unexpected_count"] == expected_count
+        assert approximate_result.result["unexpected_count"] == pytest.approx(
+            expected_count, rel=relative_error
+        )
+
+    def test_approximate_duplicated_value_smell(self):
+        column = ["x", "y", "x", "z", "x", "w", "y", None]
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=pd.DataFrame({"column": column}))]
+        )
+        result = validator.graph_validate(configurations=[ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_contain_duplicated_value_smell",
+            kwargs={"column": "column", "approximate": True, "top_k": 1,
+                    "result_format": "COMPLETE"}
+        )])[0]
+
+        assert not result.success
+        assert result.result["element_count"] == 8
+        assert result.result["missing_count"] == 1
+        assert result.result["unexpected_count"] == 5
+        assert result.result["partial_unexpected_list"] == ["x"]
+        assert result.result["details"]["estimated_distinct_count"] == 4
+        assert result.result["details"]["estimated_duplicate_ratio"] == 5 / 7
+        assert result.result["details"]["top_duplicated_values"] == [{"value": "x", "count": 3}]
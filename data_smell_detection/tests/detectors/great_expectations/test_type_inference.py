@@ -0,0 +1,68 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from great_expectations.dataset import PandasDataset
+from great_expectations.profile.base import ProfilerDataType
+
+from datasmelldetection.detectors.great_expectations.profiler import DataSmellAwareProfiler
+from datasmelldetection.detectors.great_expectations.type_inference import (
+    ColumnTypeCache,
+    infer_column_type
+)
+
+
+class TestInferColumnType:
+    @pytest.mark.parametrize("column", [
+        pd.Series([1, 2, 3]),
+        pd.Series([1, None, 3]),
+        pd.Series(np.array([1, 2, 3], dtype=np.uint8)),
+        pd.Series(np.array([1.5, 2, 3], dtype=np.float32)),
+        pd.Series([1, None, 3], dtype="Int64"),
+        pd.Series(["a", "b", None]),
+        pd.Series(["a", "b", None], dtype="string"),
+        pd.Series([True, False]),
+        pd.Series([True, False, None]),
+        pd.Series([True, False], dtype=object),
+        pd.Series([1, 2], dtype=object),
+        pd.Series([1, "a", 2.5]),
+        pd.Series([None, None], dtype=object),
+        pd.to_datetime(pd.Series(["2020-01-01", None])),
+        pd.Series([datetime.datetime(2020, 1, 1)], dtype=object),
+        pd.Series([datetime.date(2020, 1, 1)]),
+        pd.Series([b"a", b"b"]),
+        pd.Series(pd.Categorical(["a", "b"])),
+    ])
+    def test_types_match_basic_dataset_profiler(self, column):
+        dataset = PandasDataset({"column": column})
+        dataset.set_default_expectation_argument("catch_exceptions", True)
+
+        assert infer_column_type(column) == \
+            DataSmellAwareProfiler._get_column_type(dataset, "column")
+
+    def test_object_columns_are_sampled(self):
+        column = pd.Series(["a"] * 50 + [1] + ["a"] * 49)
+
+        # The integer is not part of the evenly spaced sample.
+        assert infer_column_type(column, sample_size=10) == ProfilerDataType.STRING
+        assert infer_column_type(column, sample_size=100) == ProfilerDataType.UNKNOWN
+
+    def test_sparse_object_column(self):
+        column = pd.Series([None] * 99 + ["a"])
+
+        assert infer_column_type(column, sample_size=5) == ProfilerDataType.STRING
+
+
+class TestColumnTypeCache:
+    def test_least_recently_used_types_are_evicted(self):
+        cache = ColumnTypeCache(max_entries=2)
+        cache.put("a", ProfilerDataType.INT)
+        cache.put("b", ProfilerDataType.FLOAT)
+        assert cache.get("a") == ProfilerDataType.INT
+        cache.put("c", ProfilerDataType.STRING)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == ProfilerDataType.INT
+        assert cache.get("c") == ProfilerDataType.STRING
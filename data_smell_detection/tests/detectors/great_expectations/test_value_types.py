@@ -0,0 +1,115 @@
+import re
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+import pytest
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.profile.base import ProfilerDataType
+from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+from datasmelldetection.core import DataSmellType
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+# Register expectations for data smell detection
+import datasmelldetection.detectors.great_expectations.expectations
+from datasmelldetection.detectors.great_expectations.scanner import scan_column
+from datasmelldetection.detectors.great_expectations.value_types import (
+    ALPHABETIC_REGEX,
+    DATE_REGEX,
+    DATETIME_REGEX,
+    FLOAT_REGEX,
+    INTEGER_REGEX,
+    NUMERIC_REGEX,
+    TIME_REGEX,
+    VALUE_TYPE_SCAN_FEATURE,
+    ValueType,
+    classify_value,
+    classify_values
+)
+
+
+_VALUES: List[Any] = [
+    "", " ", "abc", "abc DEF", "a1", "1a", "5", "+5", "-5", "05", "5\n", "5\n\n", " 5",
+    "3.14", "+3.14", "-3.14", "3.", "-3.", "+3.", ".5", "3,5", "3.1.4", "٣", "²",
+    "2021-12-31", "31/12/2021", "31-12-2021", "2021/12/31", "2021-12-31\n", "2021-1-31",
+    "23:59", "23:59:59", "23:5", "2021-12-31 23:59:59", "2021-12-31 23:59:59 UTC",
+    "x2021-12-31 23:59:59", 5, -3.5, float("nan"), True, None
+]
+
+
+def _match_regexes(element: Any) -> int:
+    string = str(element)
+    value_type = 0
+    for regex, flag in [(ALPHABETIC_REGEX, ValueType.ALPHABETIC),
+                        (INTEGER_REGEX, ValueType.INTEGER),
+                        (FLOAT_REGEX, ValueType.FLOAT),
+                        (NUMERIC_REGEX, ValueType.NUMERIC),
+                        (DATE_REGEX, ValueType.DATE),
+                        (TIME_REGEX, ValueType.TIME)]:
+        if re.search(regex, string) is not None:
+            value_type |= flag
+    if re.match(DATETIME_REGEX, string) is not None:
+        value_type |= ValueType.DATETIME
+    return value_type
+
+
+class TestClassifyValue:
+    @pytest.mark.parametrize("element", _VALUES)
+    def test_flags_match_regexes(self, element):
+        value_type = classify_value(element) & ~(ValueType.NUMBER | ValueType.NOT_A_STRING)
+        assert value_type == _match_regexes(element)
+
+    def test_type_flags(self):
+        assert classify_value(5) & ValueType.NUMBER
+        assert classify_value(float("nan")) & ValueType.NUMBER
+        assert classify_value(True) & ValueType.NOT_A_STRING
+        assert classify_value(None) & ValueType.NOT_A_STRING
+        assert classify_value("5") & (ValueType.NUMBER | ValueType.NOT_A_STRING) == 0
+
+    def test_classify_values(self):
+        value_types = classify_values(pd.Series(_VALUES, dtype=object))
+
+        assert value_types.dtype == np.uint16
+        assert list(value_types) == [classify_value(x) for x in _VALUES]
+
+    def test_scan_feature(self):
+        column = pd.Series(["5", "abc", "5", "2021-12-31"])
+        scan = scan_column(column, [VALUE_TYPE_SCAN_FEATURE])
+
+        assert list(scan[VALUE_TYPE_SCAN_FEATURE]) == [
+            ValueType.INTEGER | ValueType.NUMERIC, ValueType.ALPHABETIC,
+            ValueType.INTEGER | ValueType.NUMERIC, ValueType.DATE
+        ]
+
+
+class TestTypedRegexMetric:
+    def test_type_smells_share_scan_feature(self):
+        smells = default_registry.get_smell_dict_for_profiler_data_type(ProfilerDataType.STRING)
+        for data_smell_type in [DataSmellType.INTEGER_AS_STRING_SMELL,
+                                DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL,
+                                DataSmellType.DATE_AS_STRING_SMELL,
+                                DataSmellType.TIME_AS_STRING_SMELL,
+                                DataSmellType.INTERMINGLED_DATA_TYPE_SMELL]:
+            assert default_registry.get_scan_features(smells[data_smell_type]) == \
+                {VALUE_TYPE_SCAN_FEATURE}
+
+    @pytest.mark.parametrize("regex", [INTEGER_REGEX, TIME_REGEX, r"^\d+$"])
+    def test_results_match_regex(self, regex):
+        # Custom regexes which are not the regex of a value type are matched
+        # separately.
+        column = ["1", "+1", "1.5", "abc", "1\n", "12:30", 2, None]
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=pd.DataFrame({"column": column}))]
+        )
+        unexpected_values = validator.get_metric(MetricConfiguration(
+            "column_values.custom.not_match_typed_regex.unexpected_values",
+            metric_domain_kwargs={"column": "column"},
+            metric_value_kwargs={"regex": regex, "result_format": {"result_format": "COMPLETE"}}
+        ))
+
+        assert unexpected_values == [
+            x for x in column if x is not None and re.search(regex, str(x)) is not None
+        ]
@@ -0,0 +1,69 @@
+import re
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+import pytest
+from great_expectations.profile.base import ProfilerDataType
+
+from datasmelldetection.core import DataSmellType
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+# Register expectations for data smell detection
+import datasmelldetection.detectors.great_expectations.expectations
+from datasmelldetection.detectors.great_expectations.scanner import scan_column
+from datasmelldetection.detectors.great_expectations.whitespace import (
+    LEADING_WHITESPACE,
+    MULTIPLE_WHITESPACE,
+    TRAILING_WHITESPACE,
+    WHITESPACE_PROFILE_SCAN_FEATURE,
+    get_whitespace_profile,
+    get_whitespace_profiles,
+    has_spacing_issues
+)
+
+
+_VALUES: List[Any] = [
+    "", " ", "   ", "abc", "abc def", " abc", "  abc", "abc ", "abc  def", "abc  def   ghi",
+    "abc\n", "abc\ndef", "abc \ndef", "\tabc", "abc\u3000", "abc\xa0 def", "a\x1cb", "a\x00 ",
+    " " * 300 + "x", 1, 2.5, True
+]
+
+
+class TestWhitespaceProfile:
+    @pytest.mark.parametrize("element", _VALUES)
+    def test_profile_matches_regexes(self, element):
+        string = str(element)
+        profile = get_whitespace_profile(element)
+
+        assert (profile[LEADING_WHITESPACE] > 0) == (re.search(r"^\s+", string) is not None)
+        assert (profile[TRAILING_WHITESPACE] > 0) == (re.search(r"\s+$", string) is not None)
+        assert profile[MULTIPLE_WHITESPACE] == len(re.findall(r"\s{2,}", string))
+        assert has_spacing_issues(np.array([profile]))[0] == \
+            (re.search(r"(^\s+)|(\s{2,})|(\s+$)", string) is not None)
+
+    @pytest.mark.parametrize("values", [
+        _VALUES,
+        # Short strings without NUL characters are profiled using NumPy.
+        [x for x in _VALUES if isinstance(x, str) and len(x) < 20 and "\x00" not in x]
+    ])
+    def test_vectorized_profiles(self, values):
+        profiles = get_whitespace_profiles(pd.Series(values, dtype=object))
+
+        assert profiles.shape == (len(values), 3)
+        assert profiles.tolist() == [list(get_whitespace_profile(x)) for x in values]
+
+    def test_empty_values(self):
+        assert get_whitespace_profiles(pd.Series([], dtype=object)).shape == (0, 3)
+
+    def test_scan_feature(self):
+        scan = scan_column(pd.Series(["  a", "b  c ", "  a"]), [WHITESPACE_PROFILE_SCAN_FEATURE])
+
+        assert scan[WHITESPACE_PROFILE_SCAN_FEATURE].tolist() == \
+            [[2, 0, 1], [0, 1, 1], [2, 0, 1]]
+
+    def test_spacing_smells_share_scan_feature(self):
+        smells = default_registry.get_smell_dict_for_profiler_data_type(ProfilerDataType.STRING)
+        for data_smell_type in [DataSmellType.SPACING_SMELL,
+                                DataSmellType.SPACING_INCONSISTENCY_SMELL]:
+            assert default_registry.get_scan_features(smells[data_smell_type]) == \
+                {WHITESPACE_PROFILE_SCAN_FEATURE}